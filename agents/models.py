@@ -1,4 +1,6 @@
 from abc import ABC
+from typing import Optional
+
 from pydantic import BaseModel, Field
 from core.config import RouterOptions
 
@@ -10,6 +12,10 @@ class Router(BaseModel):
         description="The next agent to route to.",
         json_schema_extra={"enum": [option.value for option in RouterOptions]},
     )
+    answer: Optional[str] = Field(
+        default=None,
+        description="The final answer to the user, only when next is direct_response.",
+    )
 
 
 class BaseStats(BaseModel):
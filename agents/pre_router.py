@@ -0,0 +1,225 @@
+import json
+import math
+import re
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Container, Dict, List, NamedTuple, Optional, Tuple
+
+from core.config import RouterOptions, settings
+from core.logging import get_logger
+from tools.pokeapi import get_loaded_name_index
+
+logger = get_logger("agents.pre_router")
+
+WEIGHTS_PATH = Path(__file__).with_name("pre_router_weights.json")
+
+# Stands in for every detected Pokémon name, so the classifier learns
+# "a Pokémon is mentioned" instead of individual names.
+POKEMON_TOKEN = "__pokemon__"
+TOKEN_PATTERN = re.compile(r"[a-z0-9_♀♂-]+")
+
+BATTLE_PATTERN = re.compile(
+    r"\b(who would win|who wins|vs|versus|battle|fight|beat|beats|stronger than|"
+    r"win against|matchup|counter)\b"
+)
+# Only the base stats the researcher's PokemonData schema answers; a bare
+# "attack" usually means a move.
+STATS_PATTERN = re.compile(
+    r"\b(base stats?|stats?|hp|hit points|base attack|special attack|"
+    r"special defense|defense|speed)\b"
+)
+# Matchup and move questions mentioning a stat are analysis, not a lookup.
+MATCHUP_PATTERN = re.compile(
+    r"\b(weak\w*|strong\w*|against|effective\w*|resist\w*|moves?|moveset)\b"
+)
+
+
+class PreRoute(NamedTuple):
+    """Local routing decision with its confidence and what produced it."""
+
+    route: RouterOptions
+    confidence: float
+    reason: str
+
+
+def normalize(text: str) -> str:
+    """Lower-case a query and fold the spellings of Pokémon names found in free text."""
+    text = re.sub(r"['’]s\b", "", text.lower().replace("é", "e"))
+    return re.sub(r"['’.:]", "", text)
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+def find_pokemon(tokens: List[str], names: Container[str]) -> List[str]:
+    """Return the Pokémon names among the tokens, joining two-word names like "mr mime"."""
+    found = []
+    i = 0
+    while i < len(tokens):
+        pair = f"{tokens[i]}-{tokens[i + 1]}" if i + 1 < len(tokens) else None
+        if pair is not None and pair in names:
+            found.append(pair)
+            i += 2
+            continue
+        if tokens[i] in names:
+            found.append(tokens[i])
+        i += 1
+    return found
+
+
+def features(tokens: List[str], pokemon: List[str]) -> List[str]:
+    """Return the unigram, bigram and name-count features of a tokenized query."""
+    names = set(pokemon)
+    words = [POKEMON_TOKEN if token in names else token for token in tokens]
+    bigrams = [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return words + bigrams + [f"__names_{min(len(names), 2)}__"]
+
+
+def feature_index(feature: str, dimensions: int) -> int:
+    return zlib.crc32(feature.encode()) % dimensions
+
+
+class HashedLinearClassifier:
+    """
+    Multinomial logistic regression over hashed text features.
+
+    Weights are trained offline by ``agents.train_pre_router`` and stored
+    sparsely: only the hashed features seen in training have a row.
+
+    Args:
+        labels: Class labels, in the order of the weight columns
+        dimensions: Size of the hashed feature space
+        weights: Weight row of every non-zero feature index
+        bias: Bias of every class
+    """
+
+    def __init__(
+        self,
+        labels: List[str],
+        dimensions: int,
+        weights: Dict[int, List[float]],
+        bias: List[float],
+    ):
+        self.labels = labels
+        self.dimensions = dimensions
+        self.weights = weights
+        self.bias = bias
+
+    @classmethod
+    def load(cls, path: Path = WEIGHTS_PATH) -> "HashedLinearClassifier":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(
+            data["labels"],
+            data["dimensions"],
+            {int(index): row for index, row in data["weights"].items()},
+            data["bias"],
+        )
+
+    def predict(self, feature_list: List[str]) -> Tuple[str, float]:
+        """Return the most likely label and its probability."""
+        scores = list(self.bias)
+        for feature, count in Counter(feature_list).items():
+            row = self.weights.get(feature_index(feature, self.dimensions))
+            if row is not None:
+                for i, weight in enumerate(row):
+                    scores[i] += weight * count
+
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return self.labels[best], exps[best] / sum(exps)
+
+
+class PreRouter:
+    """
+    Deterministic router answering obvious queries without the routing LLM call.
+
+    Pokémon names are detected against the name index, then keyword rules
+    handle battle ("who would win", "vs") and stats ("base stats", "speed")
+    questions. Anything the rules leave open goes to a small hashed linear
+    classifier. Routes below ``threshold`` confidence are left to the LLM.
+
+    Args:
+        classifier: Offline-trained classifier for queries the rules leave open
+        name_source: Returns the known Pokémon names, or None while they are
+            not loaded (every query is then left to the LLM)
+        threshold: Minimum confidence of a route that is used
+    """
+
+    def __init__(
+        self,
+        classifier: HashedLinearClassifier,
+        name_source: Callable[[], Optional[Container[str]]] = lambda: None,
+        threshold: float = 0.8,
+    ):
+        self.classifier = classifier
+        self.name_source = name_source
+        self.threshold = threshold
+
+        self.routed: Counter = Counter()
+        self.fell_through = 0
+
+    def classify(self, query: str) -> PreRoute:
+        """Return the local route of a query with its confidence, whatever the threshold."""
+        names = self.name_source()
+        if names is None:
+            # Without names, "pikachu" looks like any unknown word.
+            return PreRoute(RouterOptions.POKEMON_EXPERT, 0.0, "no_name_index")
+
+        tokens = tokenize(query)
+        pokemon = find_pokemon(tokens, names)
+
+        text = " ".join(tokens)
+        battle = BATTLE_PATTERN.search(text) is not None
+        stats = (
+            STATS_PATTERN.search(text) is not None
+            and MATCHUP_PATTERN.search(text) is None
+        )
+        distinct = len(set(pokemon))
+
+        if battle and distinct >= 2:
+            return PreRoute(RouterOptions.POKEMON_EXPERT, 0.95, "rule:battle")
+        if stats and not battle and distinct == 1:
+            return PreRoute(RouterOptions.RESEARCHER, 0.9, "rule:stats")
+
+        label, probability = self.classifier.predict(features(tokens, pokemon))
+        return PreRoute(RouterOptions(label), probability, "classifier")
+
+    def route(self, query: str) -> Optional[PreRoute]:
+        """Return the local route of a query, or None when the LLM has to decide."""
+        pre_route = self.classify(query)
+        if pre_route.confidence < self.threshold:
+            self.fell_through += 1
+            logger.debug(f"Pre-router left {query!r} to the LLM: {pre_route}")
+            return None
+
+        self.routed[pre_route.route] += 1
+        logger.debug(f"Pre-routed {query!r}: {pre_route}")
+        return pre_route
+
+    def stats(self) -> Dict[str, object]:
+        routed = sum(self.routed.values())
+        total = routed + self.fell_through
+        return {
+            "routed": {str(route): count for route, count in self.routed.items()},
+            "fell_through": self.fell_through,
+            "local_rate": routed / total if total else 0.0,
+        }
+
+
+def create_pre_router() -> Optional[PreRouter]:
+    """Create the supervisor's pre-router from the PRE_ROUTER_* settings."""
+    if not settings.PRE_ROUTER_ENABLED:
+        return None
+    try:
+        classifier = HashedLinearClassifier.load()
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Pre-router disabled, could not load its weights: {e}")
+        return None
+    return PreRouter(
+        classifier,
+        name_source=get_loaded_name_index,
+        threshold=settings.PRE_ROUTER_CONFIDENCE_THRESHOLD,
+    )
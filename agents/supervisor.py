@@ -1,8 +1,10 @@
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 from agents.base import BaseAgent
 from agents.models import Router
+from agents.pre_router import PreRouter, create_pre_router
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages.base import BaseMessage
-from core.config import AgentType, RouterOptions
+from core.config import AgentType, RouterOptions, settings
 
 from prompts import SYSTEM_PROMPT, DIRECT_ANSWER_PROMPT
 from core.logging import get_logger
@@ -29,12 +31,74 @@ class SupervisorAgent(BaseAgent):
     Always use this exact JSON format - nothing else. No explanations, no additional text.
     """
 
+    SINGLE_CALL_SUFFIX: str = f"""
+    You must respond with a valid JSON object containing the key "next" with one of these three values.
+    If "next" is "{RouterOptions.DIRECT_RESPONSE.value}", also answer the user in the key "answer":
+    a clear, concise response to their question or message, friendly but brief.
+    Otherwise leave "answer" out.
+
+    For example:
+    {{"next": "{RouterOptions.RESEARCHER.value}"}}
+    {{"next": "{RouterOptions.DIRECT_RESPONSE.value}", "answer": "Hi! How can I help you today?"}}
+
+    Always use this exact JSON format - nothing else. No explanations, no additional text.
+    """
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        pre_router: Optional[PreRouter] = None,
+        single_call: Optional[bool] = None,
+    ):
+        """
+        Initialize the agent.
+
+        Args:
+            llm: Language model used for routing and direct answers
+            pre_router: Local router of obvious queries (from settings by default)
+            single_call: Route and answer direct questions in one structured call
+                (SUPERVISOR_SINGLE_CALL by default)
+        """
+        super().__init__(llm)
+        self.pre_router = pre_router if pre_router is not None else create_pre_router()
+        self.single_call = (
+            settings.SUPERVISOR_SINGLE_CALL if single_call is None else single_call
+        )
+
     async def process(self, messages: List[BaseMessage]) -> Union[str, Dict[str, str]]:
         """Determine which agent should handle the request or respond directly."""
-        for approach in ("raw", "structured"):
+        if self.pre_router is not None:
+            pre_route = self.pre_router.route(messages[-1].content)
+            if pre_route is not None:
+                if pre_route.route == RouterOptions.DIRECT_RESPONSE:
+                    return await self._generate_direct_response(messages[-1].content)
+                return pre_route.route.value
+
+        approaches = ("raw", "structured")
+        if self.single_call:
+            approaches = ("single",) + approaches
+
+        for approach in approaches:
             try:
                 logger.debug(f"Starting supervisor agent with {approach} approach")
-                if approach == "raw":
+                if approach == "single":
+                    llm_messages = [
+                        {
+                            "role": "system",
+                            "content": SYSTEM_PROMPT + self.SINGLE_CALL_SUFFIX,
+                        }
+                    ] + messages
+                    single_response = await self.llm.with_structured_output(
+                        Router
+                    ).ainvoke(llm_messages)
+                    if single_response.next == RouterOptions.DIRECT_RESPONSE.value:
+                        if single_response.answer:
+                            return {"answer": single_response.answer}
+                        direct_message = messages[-1].content
+                        return await self._generate_direct_response(direct_message)
+                    elif single_response.next in self.VALID_OPTIONS:
+                        return single_response.next
+                elif approach == "raw":
                     llm_messages = [
                         {
                             "role": "system",
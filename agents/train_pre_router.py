@@ -0,0 +1,215 @@
+"""
+Train the pre-router's hashed linear classifier and write its weights.
+
+The labelled queries below mirror the categories of the supervisor prompt.
+Pokémon names go through the same name detection as at serving time, so
+the model learns from the ``__pokemon__`` placeholder rather than from
+individual names.
+
+Usage:
+    python -m agents.train_pre_router [--output agents/pre_router_weights.json]
+"""
+
+import argparse
+import json
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from agents.pre_router import (
+    WEIGHTS_PATH,
+    feature_index,
+    features,
+    find_pokemon,
+    tokenize,
+)
+from core.config import RouterOptions
+
+DIMENSIONS = 2**12
+TRAINING_NAMES = frozenset(
+    {
+        "pikachu",
+        "charizard",
+        "bulbasaur",
+        "mewtwo",
+        "gengar",
+        "snorlax",
+        "eevee",
+        "lucario",
+        "garchomp",
+        "squirtle",
+        "mr-mime",
+        "tapu-koko",
+    }
+)
+
+RESEARCHER = RouterOptions.RESEARCHER.value
+EXPERT = RouterOptions.POKEMON_EXPERT.value
+DIRECT = RouterOptions.DIRECT_RESPONSE.value
+
+EXAMPLES: List[Tuple[str, str]] = [
+    (RESEARCHER, "What are the base stats of Charizard?"),
+    (RESEARCHER, "Show me Pikachu's stats"),
+    (RESEARCHER, "How fast is Garchomp?"),
+    (RESEARCHER, "How much does Snorlax weigh?"),
+    (RESEARCHER, "How tall is Mewtwo?"),
+    (RESEARCHER, "What is the attack stat of Lucario?"),
+    (RESEARCHER, "What type is Gengar?"),
+    (RESEARCHER, "What abilities does Eevee have?"),
+    (RESEARCHER, "Give me the HP of Bulbasaur"),
+    (RESEARCHER, "List the stats for Squirtle"),
+    (RESEARCHER, "What's the special defense of Mr. Mime?"),
+    (RESEARCHER, "Tapu Koko base stats"),
+    (RESEARCHER, "Find some facts about Pikachu"),
+    (RESEARCHER, "Look up data on Charizard"),
+    (RESEARCHER, "What is the base experience of Eevee?"),
+    (RESEARCHER, "Pikachu speed stat"),
+    (RESEARCHER, "Get me the numbers for Garchomp"),
+    (RESEARCHER, "What is Snorlax's defense?"),
+    (RESEARCHER, "Stats of Gengar please"),
+    (RESEARCHER, "Fetch Lucario data"),
+    (RESEARCHER, "What are the stats of Pikachu and Eevee?"),
+    (RESEARCHER, "Compare the base stats of Charizard and Squirtle"),
+    (RESEARCHER, "Which has more HP, Snorlax or Mewtwo?"),
+    (RESEARCHER, "What is the total base stat of Garchomp?"),
+    (RESEARCHER, "How heavy is Mewtwo in kilograms?"),
+    (RESEARCHER, "Show the height and weight of Bulbasaur"),
+    (EXPERT, "Who would win in a battle, Pikachu or Bulbasaur?"),
+    (EXPERT, "Pikachu vs Charizard"),
+    (EXPERT, "Mewtwo versus Gengar, who wins?"),
+    (EXPERT, "Can Squirtle beat Charizard?"),
+    (EXPERT, "Is Lucario stronger than Garchomp?"),
+    (EXPERT, "What is a good counter to Snorlax?"),
+    (EXPERT, "How should I use Gengar in competitive play?"),
+    (EXPERT, "Is Eevee a good Pokémon for a beginner team?"),
+    (EXPERT, "Which Pokémon should I pick against Mewtwo?"),
+    (EXPERT, "Build me a team around Charizard"),
+    (EXPERT, "What moves should Pikachu learn?"),
+    (EXPERT, "Why is Garchomp so strong?"),
+    (EXPERT, "Who is the best electric Pokémon?"),
+    (EXPERT, "What's the strongest Pokémon ever?"),
+    (EXPERT, "Tell me about Pikachu"),
+    (EXPERT, "Who is Mewtwo?"),
+    (EXPERT, "What is Eevee known for?"),
+    (EXPERT, "Which starter Pokémon is the best?"),
+    (EXPERT, "Explain how type advantages work in Pokémon"),
+    (EXPERT, "Is fire good against grass Pokémon?"),
+    (EXPERT, "What type is Gengar weak against?"),
+    (EXPERT, "What is Snorlax weak to?"),
+    (EXPERT, "Which types is Garchomp strong against?"),
+    (EXPERT, "What is super effective against Mewtwo?"),
+    (EXPERT, "What does Squirtle resist?"),
+    (EXPERT, "What is the best attack for Lucario?"),
+    (EXPERT, "Which move should Eevee use against Gengar?"),
+    (EXPERT, "What evolves into Charizard?"),
+    (EXPERT, "How do I evolve Eevee into Umbreon?"),
+    (EXPERT, "Would Snorlax survive a hit from Mewtwo?"),
+    (EXPERT, "Analyze a fight between Lucario and Gengar"),
+    (EXPERT, "Recommend a Pokémon to beat a water team"),
+    (EXPERT, "Which legendary Pokémon is the most powerful?"),
+    (EXPERT, "How many Pokémon are there?"),
+    (EXPERT, "What is a Pokémon?"),
+    (EXPERT, "I love Pokémon"),
+    (EXPERT, "Which Pokémon is the fastest?"),
+    (EXPERT, "Is Gengar good in competitive?"),
+    (EXPERT, "What is the rarest Pokémon?"),
+    (DIRECT, "Hello"),
+    (DIRECT, "Hi there!"),
+    (DIRECT, "What's your name?"),
+    (DIRECT, "My name is Vlad"),
+    (DIRECT, "How are you today?"),
+    (DIRECT, "Thanks!"),
+    (DIRECT, "Thank you so much"),
+    (DIRECT, "Good morning"),
+    (DIRECT, "Who made you?"),
+    (DIRECT, "What can you do?"),
+    (DIRECT, "Tell me a joke"),
+    (DIRECT, "What is the capital of France?"),
+    (DIRECT, "What time is it?"),
+    (DIRECT, "How is the weather?"),
+    (DIRECT, "Bye"),
+    (DIRECT, "Goodbye, see you later"),
+    (DIRECT, "What is 2 plus 2?"),
+    (DIRECT, "Can you help me?"),
+    (DIRECT, "Who are you?"),
+    (DIRECT, "I like pizza"),
+    (DIRECT, "Translate hello into Spanish"),
+    (DIRECT, "Nice to meet you"),
+    (DIRECT, "What is Python?"),
+    (DIRECT, "Recommend a good book"),
+    (DIRECT, "What is your favourite colour?"),
+    (DIRECT, "How many days are in a year?"),
+    (DIRECT, "Good evening"),
+    (DIRECT, "Tell me something interesting"),
+]
+
+
+def vectorize(query: str) -> Dict[int, float]:
+    """Return the hashed feature counts of a training query."""
+    tokens = tokenize(query)
+    counts: Dict[int, float] = {}
+    for feature in features(tokens, find_pokemon(tokens, TRAINING_NAMES)):
+        index = feature_index(feature, DIMENSIONS)
+        counts[index] = counts.get(index, 0.0) + 1.0
+    return counts
+
+
+def train(
+    examples: List[Tuple[str, str]],
+    epochs: int = 500,
+    learning_rate: float = 0.5,
+    l2: float = 1e-3,
+) -> Dict[str, object]:
+    """
+    Fit a softmax regression with full-batch gradient descent.
+
+    Returns:
+        The model in the format read by ``HashedLinearClassifier.load``
+    """
+    labels = [option.value for option in RouterOptions]
+    x = np.zeros((len(examples), DIMENSIONS))
+    y = np.zeros((len(examples), len(labels)))
+    for row, (label, query) in enumerate(examples):
+        for index, count in vectorize(query).items():
+            x[row, index] = count
+        y[row, labels.index(label)] = 1.0
+
+    weights = np.zeros((DIMENSIONS, len(labels)))
+    bias = np.zeros(len(labels))
+    for _ in range(epochs):
+        scores = x @ weights + bias
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        error = (probabilities - y) / len(examples)
+        weights -= learning_rate * (x.T @ error + l2 * weights)
+        bias -= learning_rate * error.sum(axis=0)
+
+    used = np.flatnonzero(x.any(axis=0))
+    return {
+        "labels": labels,
+        "dimensions": DIMENSIONS,
+        "weights": {
+            str(index): [round(float(w), 4) for w in weights[index]] for index in used
+        },
+        "bias": [round(float(b), 4) for b in bias],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Train the supervisor pre-router")
+    parser.add_argument("--output", default=str(WEIGHTS_PATH), help="Weights file")
+    parser.add_argument("--epochs", type=int, default=500, help="Training epochs")
+    args = parser.parse_args()
+
+    model = train(EXAMPLES, epochs=args.epochs)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(model, f, separators=(",", ":"))
+    print(
+        f"Trained on {len(EXAMPLES)} queries, "
+        f"{len(model['weights'])} features -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Compare full and selective parsing of PokéAPI /pokemon documents.
+
+Each document is split into chunks as they would arrive from the network
+and turned into an ``extract_pokemon_info`` record in two ways:
+
+* full: join the body and ``json.loads`` it, as ``response.json()`` does, and
+* selective: feed the chunks to ``SelectiveJSONParser`` (SELECTIVE_JSON_PARSING).
+
+CPU time per fetch is measured with ``time.process_time`` and peak memory
+with ``tracemalloc``. Recorded documents are read from a PokeAPI
+``api-data`` dump (``<dir>/pokemon/<id>/index.json``); without one,
+synthetic documents with the structure and size of real ones are used.
+
+Usage:
+    python -m benchmarks.pokemon_parsing [--from-dump DIR] [--count 200]
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from tools.pokeapi import POKEMON_DOCUMENT_FIELDS, extract_pokemon_info
+from tools.records import STAT_NAMES
+from tools.selective_json import SelectiveJSONParser
+from tools.type_matrix import TYPE_NAMES
+
+VERSION_GROUPS = [f"version-group-{i}" for i in range(25)]
+LEARN_METHODS = ["level-up", "machine", "egg", "tutor"]
+
+
+def resource(name: str, kind: str, index: int) -> Dict[str, str]:
+    return {"name": name, "url": f"https://pokeapi.co/api/v2/{kind}/{index}/"}
+
+
+def make_document(index: int, rng: random.Random) -> Dict[str, Any]:
+    """Return a synthetic /pokemon document shaped like the real PokéAPI one."""
+    sprite_urls = {
+        f"{side}_{variant}": (
+            f"https://raw.githubusercontent.com/PokeAPI/sprites/master/"
+            f"sprites/pokemon/{side}/{variant}/{index}.png"
+        )
+        for side in ("back", "front")
+        for variant in ("default", "female", "shiny", "shiny_female")
+    }
+    return {
+        "abilities": [
+            {
+                "ability": resource(f"ability-{a}", "ability", a),
+                "is_hidden": slot == 3,
+                "slot": slot,
+            }
+            for slot, a in enumerate(rng.sample(range(300), 2), start=1)
+        ],
+        "base_experience": rng.randint(36, 340),
+        "cries": {"latest": f"https://cries/{index}.ogg", "legacy": None},
+        "forms": [resource(f"pokemon-{index}", "pokemon-form", index)],
+        "game_indices": [
+            {"game_index": index, "version": resource(f"version-{v}", "version", v)}
+            for v in range(rng.randint(10, 30))
+        ],
+        "height": rng.randint(1, 200),
+        "held_items": [],
+        "id": index,
+        "is_default": True,
+        "location_area_encounters": f"https://pokeapi.co/api/v2/pokemon/{index}/encounters",
+        "moves": [
+            {
+                "move": resource(f"move-{m}", "move", m),
+                "version_group_details": [
+                    {
+                        "level_learned_at": rng.randint(0, 60),
+                        "move_learn_method": resource(
+                            rng.choice(LEARN_METHODS), "move-learn-method", 1
+                        ),
+                        "order": None,
+                        "version_group": resource(group, "version-group", g),
+                    }
+                    for g, group in enumerate(
+                        rng.sample(VERSION_GROUPS, rng.randint(3, 20))
+                    )
+                ],
+            }
+            for m in rng.sample(range(900), rng.randint(40, 120))
+        ],
+        "name": f"pokemon-{index}",
+        "order": index,
+        "past_abilities": [],
+        "past_types": [],
+        "species": resource(f"pokemon-{index}", "pokemon-species", index),
+        "sprites": {
+            **sprite_urls,
+            "other": {
+                name: dict(sprite_urls)
+                for name in ("dream_world", "home", "official-artwork", "showdown")
+            },
+            "versions": {
+                f"generation-{g}": {
+                    f"game-{v}": dict(sprite_urls) for v in range(rng.randint(1, 3))
+                }
+                for g in range(1, 9)
+            },
+        },
+        "stats": [
+            {
+                "base_stat": rng.randint(5, 255),
+                "effort": 0,
+                "stat": resource(name, "stat", i),
+            }
+            for i, name in enumerate(STAT_NAMES, start=1)
+        ],
+        "types": [
+            {"slot": slot, "type": resource(name, "type", 1)}
+            for slot, name in enumerate(rng.sample(TYPE_NAMES, 2), start=1)
+        ],
+        "weight": rng.randint(1, 9999),
+    }
+
+
+def load_documents(dump_dir: str, count: int) -> List[bytes]:
+    """Return up to ``count`` recorded /pokemon documents from an api-data dump."""
+    paths = sorted(Path(dump_dir).glob("pokemon/*/index.json"))[:count]
+    return [path.read_bytes() for path in paths]
+
+
+def split(document: bytes, chunk_size: int) -> List[bytes]:
+    return [document[i : i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+
+def parse_full(chunks: List[bytes]) -> Dict[str, Any]:
+    return extract_pokemon_info(json.loads(b"".join(chunks)))
+
+
+def parse_selective(chunks: List[bytes]) -> Dict[str, Any]:
+    parser = SelectiveJSONParser(POKEMON_DOCUMENT_FIELDS)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return extract_pokemon_info(parser.close())
+
+
+def measure(
+    parse: Callable[[List[bytes]], Dict[str, Any]],
+    documents: List[List[bytes]],
+    repeat: int,
+) -> Dict[str, float]:
+    """Return the CPU time (best round) and the mean and max peak memory per fetch."""
+    rounds = []
+    for _ in range(repeat):
+        started = time.process_time()
+        for chunks in documents:
+            parse(chunks)
+        rounds.append(time.process_time() - started)
+    cpu = min(rounds) / len(documents)
+
+    peaks = []
+    for chunks in documents:
+        tracemalloc.start()
+        parse(chunks)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+    return {"cpu": cpu, "peak_avg": sum(peaks) / len(peaks), "peak_max": max(peaks)}
+
+
+def report(label: str, result: Dict[str, float]) -> None:
+    print(
+        f"{label:<10} CPU {1000 * result['cpu']:7.3f} ms/fetch   "
+        f"peak memory avg {result['peak_avg'] / 1024:8.1f} KiB   "
+        f"max {result['peak_max'] / 1024:8.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PokéAPI /pokemon parsing benchmark")
+    parser.add_argument("--from-dump", help="PokeAPI api-data dump directory")
+    parser.add_argument("--count", type=int, default=200, help="Documents to parse")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="CPU timing rounds (best is kept)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=16384, help="Bytes per network chunk"
+    )
+    args = parser.parse_args()
+
+    if args.from_dump:
+        raw = load_documents(args.from_dump, args.count)
+    else:
+        rng = random.Random(0)
+        raw = [
+            json.dumps(make_document(i, rng)).encode() for i in range(1, args.count + 1)
+        ]
+    documents = [split(document, args.chunk_size) for document in raw]
+    sizes = [len(document) for document in raw]
+
+    for chunks in documents:
+        assert parse_full(chunks) == parse_selective(chunks)
+
+    print(
+        f"documents: {len(raw)}, average size {sum(sizes) / len(sizes) / 1024:.1f} "
+        f"KiB, largest {max(sizes) / 1024:.1f} KiB, chunks of {args.chunk_size} B"
+    )
+    full = measure(parse_full, documents, args.repeat)
+    selective = measure(parse_selective, documents, args.repeat)
+    report("full", full)
+    report("selective", selective)
+    print(
+        f"peak memory reduction {1 - selective['peak_avg'] / full['peak_avg']:.1%}, "
+        f"CPU time ratio {selective['cpu'] / full['cpu']:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
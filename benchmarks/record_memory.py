@@ -0,0 +1,83 @@
+"""
+Compare the memory footprint of cached Pokémon records.
+
+Builds N synthetic records shaped like ``extract_pokemon_info`` output,
+decoding each one from its own JSON document as the service does for every
+fetched Pokémon, and measures the retained memory of:
+
+* the current representation (nested dicts and lists), and
+* ``PokemonRecord`` (``__slots__``, packed ``array('H')`` stats, interned names).
+
+Usage:
+    python -m benchmarks.record_memory [--count 1300]
+"""
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from tools.records import STAT_NAMES, PokemonRecord
+from tools.type_matrix import TYPE_NAMES
+
+
+def make_documents(count: int, seed: int = 0) -> List[str]:
+    """Return ``count`` JSON documents of trimmed Pokémon records."""
+    rng = random.Random(seed)
+    abilities = [f"ability-{i}" for i in range(300)]
+    documents = []
+    for i in range(1, count + 1):
+        record = {
+            "id": i,
+            "name": f"pokemon-{i}",
+            "base_experience": rng.randint(36, 340),
+            "height": rng.randint(1, 200),
+            "weight": rng.randint(1, 9999),
+            "abilities": rng.sample(abilities, rng.randint(1, 3)),
+            "stats": {name: rng.randint(5, 255) for name in STAT_NAMES},
+            "types": rng.sample(TYPE_NAMES, rng.randint(1, 2)),
+        }
+        documents.append(json.dumps(record))
+    return documents
+
+
+def measure(build: Callable[[str], Any], documents: List[str]) -> int:
+    """Return the bytes retained by the objects ``build`` creates from the documents."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    cache: Dict[int, Any] = {i: build(doc) for i, doc in enumerate(documents)}
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pokémon record memory benchmark")
+    parser.add_argument("--count", type=int, default=1300, help="Number of records")
+    args = parser.parse_args()
+
+    documents = make_documents(args.count)
+    dict_bytes = measure(json.loads, documents)
+    record_bytes = measure(
+        lambda doc: PokemonRecord.from_dict(json.loads(doc)), documents
+    )
+
+    print(f"records:            {args.count}")
+    print(
+        f"nested dicts:       {dict_bytes / 1024:9.1f} KiB "
+        f"({dict_bytes / args.count:6.0f} B/record)"
+    )
+    print(
+        f"PokemonRecord:      {record_bytes / 1024:9.1f} KiB "
+        f"({record_bytes / args.count:6.0f} B/record)"
+    )
+    print(f"reduction:          {1 - record_bytes / dict_bytes:9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Measure lookup latency of the semantic /chat cache.
+
+Fills a ``SemanticCache`` with ``--entries`` synthetic questions built from
+question templates and ``--names`` Pokémon names (one or two per question),
+then times ``get`` for paraphrases of cached questions (hits) and for
+questions that are not cached (misses).
+
+Questions are bucketed by their Pokémon, so lookups only compare against
+questions about the same Pokémon. ``--names 1`` puts every question in a
+single bucket, which is the worst case: a scan of the whole matrix.
+
+Usage:
+    python -m benchmarks.semantic_cache [--entries 100000] [--names 1000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, List
+
+from core.semantic_cache import SemanticCache
+
+SINGLE_TEMPLATES = [
+    "What are the base stats of {0}?",
+    "How tall is {0}?",
+    "How heavy is {0}?",
+    "What type is {0}?",
+    "What moves does {0} learn?",
+    "Is {0} good in competitive play?",
+    "What does {0} evolve into?",
+    "Tell me a fun fact about {0}",
+]
+PAIR_TEMPLATES = [
+    "Who would win, {0} or {1}?",
+    "Can {0} beat {1}?",
+    "Is {0} stronger than {1}?",
+]
+PARAPHRASES = {
+    "Who would win, {0} or {1}?": "{0} vs {1} who wins",
+    "What are the base stats of {0}?": "{0} base stats",
+}
+# Qualifiers making every cached question distinct without adding entities.
+QUALIFIERS = [f"qualifier{i}" for i in range(500)]
+
+
+def make_question(rng: random.Random, names: List[str], paraphrase: bool) -> str:
+    qualifiers = " ".join(rng.sample(QUALIFIERS, 2))
+    if rng.random() < 0.5:
+        template = rng.choice(PAIR_TEMPLATES)
+        first, second = rng.sample(names, 2) if len(names) > 1 else names * 2
+    else:
+        template = rng.choice(SINGLE_TEMPLATES)
+        first, second = rng.choice(names), None
+    if paraphrase:
+        template = PARAPHRASES.get(template, template)
+    return f"{template.format(first, second)} {qualifiers}"
+
+
+def percentiles(timings: List[float]) -> str:
+    timings = sorted(timings)
+    p50 = timings[len(timings) // 2]
+    p99 = timings[int(len(timings) * 0.99)]
+    return (
+        f"mean {1e6 * statistics.fmean(timings):7.1f} us   "
+        f"p50 {1e6 * p50:7.1f} us   p99 {1e6 * p99:7.1f} us"
+    )
+
+
+def time_lookups(lookup: Callable[[str], object], questions: List[str]) -> List[float]:
+    timings = []
+    for question in questions:
+        started = time.perf_counter()
+        lookup(question)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Semantic cache lookup benchmark")
+    parser.add_argument("--entries", type=int, default=100_000, help="Cached questions")
+    parser.add_argument("--names", type=int, default=1000, help="Distinct Pokémon")
+    parser.add_argument("--lookups", type=int, default=2000, help="Timed lookups")
+    parser.add_argument("--dimensions", type=int, default=512, help="Vector size")
+    parser.add_argument("--threshold", type=float, default=0.9, help="Match threshold")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"pokemon{i}" for i in range(args.names)]
+    name_set = frozenset(names)
+    cache = SemanticCache(
+        args.entries,
+        ttl=None,
+        threshold=args.threshold,
+        name_source=lambda: name_set,
+        dimensions=args.dimensions,
+    )
+
+    started = time.perf_counter()
+    cached = []
+    while len(cache) < args.entries:
+        state = rng.getstate()
+        question = make_question(rng, names, paraphrase=False)
+        if cache.set(question, {"answer": question}):
+            cached.append(state)
+    fill = time.perf_counter() - started
+
+    hit_questions = []
+    for state in rng.sample(cached, args.lookups):
+        replay = random.Random()
+        replay.setstate(state)
+        hit_questions.append(make_question(replay, names, paraphrase=True))
+    miss_questions = [
+        f"What is the hidden ability of {rng.choice(names)}?"
+        for _ in range(args.lookups)
+    ]
+
+    hit_timings = time_lookups(cache.get, hit_questions)
+    hits = cache.stats()["hits"]
+    miss_timings = time_lookups(cache.get, miss_questions)
+
+    matrix_bytes = sum(bucket.vectors.nbytes for bucket in cache._buckets.values())
+    print(
+        f"entries: {len(cache)}, buckets: {cache.stats()['buckets']}, "
+        f"dimensions: {args.dimensions}, vectors {matrix_bytes / 2**20:.0f} MiB, "
+        f"filled in {fill:.1f} s"
+    )
+    print(
+        f"paraphrase lookups  {percentiles(hit_timings)}   hits {hits}/{args.lookups}"
+    )
+    print(f"uncached lookups    {percentiles(miss_timings)}")
+
+
+if __name__ == "__main__":
+    main()
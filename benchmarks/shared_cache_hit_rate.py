@@ -0,0 +1,137 @@
+"""
+Compare upstream PokéAPI fetches with and without the shared cache tier.
+
+Starts N worker processes, each with its own ``LRUCache`` sized like the
+service's in-memory cache, and replays a Zipf-distributed stream of Pokémon
+lookups in every worker. Misses either go straight to a simulated PokéAPI
+(per-process caches only) or first through ``SharedCacheBackend`` over the
+Unix socket, with one worker elected leader exactly as in production.
+
+Usage:
+    python -m benchmarks.shared_cache_hit_rate [--workers 4] [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import tempfile
+from typing import Dict, List
+
+from tools.cache import LRUCache
+from tools.shared_cache import SharedCacheBackend
+
+
+def make_requests(count: int, catalog: int, skew: float, seed: int) -> List[str]:
+    """Return ``count`` Pokémon names drawn from a Zipf-like popularity distribution."""
+    rng = random.Random(seed)
+    weights = [1 / rank**skew for rank in range(1, catalog + 1)]
+    ids = rng.choices(range(1, catalog + 1), weights=weights, k=count)
+    return [f"pokemon-{i}" for i in ids]
+
+
+async def replay(
+    requests: List[str],
+    local_size: int,
+    socket_path: str,
+    barrier: multiprocessing.Barrier,
+) -> Dict[str, int]:
+    """Replay the lookups of one worker and count where each one was answered."""
+    local = LRUCache(local_size)
+    shared = SharedCacheBackend(socket_path, timeout=1.0) if socket_path else None
+    counts = {"local_hits": 0, "shared_hits": 0, "upstream_fetches": 0}
+
+    if shared is not None:
+        # Elect the leader before any worker starts sending requests.
+        await shared.get("pokemon", "warm-up")
+    await asyncio.to_thread(barrier.wait)
+
+    for name in requests:
+        if local.get(name) is not None:
+            counts["local_hits"] += 1
+            continue
+
+        data = await shared.get("pokemon", name) if shared is not None else None
+        if data is not None:
+            counts["shared_hits"] += 1
+        else:
+            counts["upstream_fetches"] += 1
+            data = {"name": name}
+            if shared is not None:
+                await shared.set("pokemon", name, data)
+        local.set(name, data)
+
+    # Keep the leader serving until every worker is done.
+    await asyncio.to_thread(barrier.wait)
+    if shared is not None:
+        await shared.close()
+    return counts
+
+
+def worker(
+    seed: int,
+    args: argparse.Namespace,
+    socket_path: str,
+    barrier: multiprocessing.Barrier,
+    results: multiprocessing.Queue,
+) -> None:
+    requests = make_requests(args.requests, args.catalog, args.skew, seed)
+    results.put(asyncio.run(replay(requests, args.local_size, socket_path, barrier)))
+
+
+def run(args: argparse.Namespace, socket_path: str) -> Dict[str, int]:
+    """Run all workers and return their summed counters."""
+    barrier = multiprocessing.Barrier(args.workers)
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=worker, args=(seed, args, socket_path, barrier, results)
+        )
+        for seed in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+
+    totals = {"local_hits": 0, "shared_hits": 0, "upstream_fetches": 0}
+    for _ in processes:
+        for key, value in results.get().items():
+            totals[key] += value
+    for process in processes:
+        process.join()
+    return totals
+
+
+def report(label: str, totals: Dict[str, int], lookups: int) -> None:
+    hit_rate = 1 - totals["upstream_fetches"] / lookups
+    print(
+        f"{label:<22} hit rate {hit_rate:6.1%}   "
+        f"local {totals['local_hits']:>7}   shared {totals['shared_hits']:>7}   "
+        f"PokéAPI fetches {totals['upstream_fetches']:>6}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shared cache hit-rate benchmark")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes")
+    parser.add_argument("--requests", type=int, default=5000, help="Lookups per worker")
+    parser.add_argument(
+        "--catalog", type=int, default=1300, help="Number of distinct Pokémon"
+    )
+    parser.add_argument("--skew", type=float, default=1.0, help="Zipf exponent")
+    parser.add_argument(
+        "--local-size", type=int, default=100, help="Per-worker LRU size"
+    )
+    args = parser.parse_args()
+
+    lookups = args.workers * args.requests
+    print(f"workers: {args.workers}, lookups: {lookups}, catalog: {args.catalog}")
+
+    report("per-process LRU only", run(args, ""), lookups)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket_path = os.path.join(tmp_dir, "cache.sock")
+        report("with shared tier", run(args, socket_path), lookups)
+
+
+if __name__ == "__main__":
+    main()
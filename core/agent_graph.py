@@ -4,6 +4,10 @@ from langgraph.graph import MessagesState, END, StateGraph, START
 from langgraph.types import Command
 from agents.factory import get_agent_factory
 from core.config import settings, AgentType, RouterOptions
+from core.logging import get_logger
+from core.response_cache import create_response_cache
+
+logger = get_logger("core.agent_graph")
 
 
 class State(MessagesState):
@@ -22,6 +26,7 @@ class AgentGraph:
         self.supervisor = factory.get_agent(AgentType.SUPERVISOR)
         self.researcher = factory.get_agent(AgentType.RESEARCHER)
         self.pokemon_expert = factory.get_agent(AgentType.POKEMON_EXPERT)
+        self.response_cache = create_response_cache(self.llm)
         self.graph = self._build_graph()
 
     async def _supervisor_node(
@@ -77,7 +82,20 @@ class AgentGraph:
         return builder.compile()
 
     async def invoke(self, question: str) -> Dict[str, Any]:
-        """Invoke the agent graph with a question asynchronously."""
+        """Invoke the agent graph with a question asynchronously, answering repeats from the cache."""
+        if self.response_cache is not None:
+            cached = self.response_cache.get(question)
+            if cached is not None:
+                logger.debug(f"Response cache hit for {question!r}")
+                return cached
+
+        response = await self._run_graph(question)
+        if self.response_cache is not None:
+            self.response_cache.set(question, response)
+        return response
+
+    async def _run_graph(self, question: str) -> Dict[str, Any]:
+        """Run the supervisor and agents on a question."""
         result = await self.graph.ainvoke(
             {"messages": [HumanMessage(content=question)]}
         )
@@ -1,5 +1,5 @@
 from enum import Enum, StrEnum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import field_validator, ValidationInfo
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -56,7 +56,71 @@ class Settings(BaseSettings):
 
     # HTTP Client Configuration
     HTTP_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: Optional[float] = None
+    HTTP_READ_TIMEOUT_SECONDS: Optional[float] = None
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP2_ENABLED: bool = False
+    SELECTIVE_JSON_PARSING: bool = False
+    CONDITIONAL_REQUESTS_ENABLED: bool = True
+    HTTP_RETRY_ATTEMPTS: int = 3
+    HTTP_RETRY_BACKOFF_SECONDS: float = 0.2
+    HTTP_RETRY_MAX_BACKOFF_SECONDS: float = 2.0
+    HTTP_RETRY_DEADLINE_SECONDS: float = 15.0
     CACHE_SIZE: int = 100
+    CACHE_TTL_SECONDS: Optional[float] = None
+    MAX_CONCURRENT_FETCHES: int = 10
+    NEGATIVE_CACHE_SIZE: int = 1000
+    NEGATIVE_CACHE_TTL_SECONDS: float = 3600.0
+    CACHE_STALE_WHILE_REVALIDATE: bool = False
+    CACHE_MAX_STALE_SECONDS: float = 300.0
+
+    # Outbound Rate Limiting (keeps PokéAPI traffic within its fair-use limits)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_REQUESTS_PER_SECOND: Optional[float] = 20.0
+    RATE_LIMIT_BURST: int = 40
+    RATE_LIMIT_MAX_CONCURRENCY: Optional[int] = 20
+
+    # Circuit Breaker Configuration (fails fast while PokéAPI is unhealthy)
+    CIRCUIT_BREAKER_WINDOW_SIZE: int = 20
+    CIRCUIT_BREAKER_MIN_CALLS: int = 5
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = 5.0
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.5
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_HALF_OPEN_PROBES: int = 1
+
+    # Shared Cache Configuration (one cache for all uvicorn workers on the host)
+    SHARED_CACHE_ENABLED: bool = False
+    SHARED_CACHE_SOCKET_PATH: str = "/tmp/pokeapi_cache.sock"
+    SHARED_CACHE_SIZE: int = 5000
+    SHARED_CACHE_TIMEOUT_SECONDS: float = 0.1
+
+    # Peer Cache Configuration (each record is fetched by the node owning it)
+    PEER_SELF_URL: Optional[str] = None
+    PEER_URLS: List[str] = []
+    PEER_TIMEOUT_SECONDS: float = 2.0
+    PEER_FAILURE_COOLDOWN_SECONDS: float = 10.0
+
+    # Persistent Cache Configuration
+    PERSISTENT_CACHE_ENABLED: bool = False
+    PERSISTENT_CACHE_DIR: str = ".cache/pokeapi"
+    PERSISTENT_CACHE_TTL_SECONDS: Optional[float] = None
+
+    # Pokémon Name Index (rejects unknown names without HTTP or LLM calls)
+    NAME_INDEX_ENABLED: bool = True
+    POKEMON_NAME_INDEX_PATH: Optional[str] = None
+
+    # Cache Warm-up (prefetches types and hot Pokémon after startup)
+    WARMUP_ENABLED: bool = False
+    WARMUP_POKEMON: List[str] = []
+    WARMUP_TOP_N: int = 50
+    WARMUP_CONCURRENCY: int = 5
+    WARMUP_ACCESS_LOG_PATH: Optional[str] = None
+
+    # Offline Pokédex Snapshot (serves all lookups without HTTP when set)
+    POKEDEX_SNAPSHOT_PATH: Optional[str] = None
 
     # Model Configuration
     GROQ_API_KEY: Optional[str] = None
@@ -75,8 +139,29 @@ class Settings(BaseSettings):
     LANGSMITH_API_KEY: Optional[str] = None
     LANGSMITH_PROJECT: Optional[str] = None
 
+    # Chat Response Cache (exact-match answers to repeated /chat questions)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_SIZE: int = 1000
+    RESPONSE_CACHE_TTL_SECONDS: Optional[float] = 3600.0
+    # Near-duplicate tier: paraphrases about the same Pokémon share an answer
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_SIZE: int = 10000
+    SEMANTIC_CACHE_THRESHOLD: float = 0.9
+    SEMANTIC_CACHE_DIMENSIONS: int = 512
+
+    # Battle Result Cache (one /battle analysis per unordered Pokémon pair)
+    BATTLE_CACHE_ENABLED: bool = True
+    BATTLE_CACHE_SIZE: int = 1000
+    BATTLE_CACHE_TTL_SECONDS: Optional[float] = 86400.0
+
+    # Supervisor Pre-Router (routes obvious queries without the routing LLM call)
+    PRE_ROUTER_ENABLED: bool = True
+    PRE_ROUTER_CONFIDENCE_THRESHOLD: float = 0.8
+
     # Agent Configuration
     DEFAULT_RESPONSE_FORMAT: ResponseFormat = ResponseFormat.DETAILED
+    # Route and answer small talk in one structured supervisor call
+    SUPERVISOR_SINGLE_CALL: bool = False
 
     # Default agent configurations
     DEFAULT_AGENT_CONFIGS: Dict[str, Dict[str, Any]] = {
@@ -1,2 +1,28 @@
+from typing import Sequence
+
+
 class PokemonNotFoundError(Exception):
+    """
+    Raised when a Pokémon cannot be found.
+
+    ``confirmed`` is set only when PokéAPI answered 404 (or the Pokédex
+    snapshot lacks the Pokémon), as opposed to other errors while fetching it.
+    """
+
+    def __init__(
+        self,
+        message: str = "",
+        suggestions: Sequence[str] = (),
+        confirmed: bool = False,
+    ):
+        super().__init__(message)
+        self.suggestions = list(suggestions)
+        self.confirmed = confirmed
+
+
+class TypeNotFoundError(ValueError):
+    """Raised when PokéAPI answered 404 for a type (or the snapshot lacks it)."""
+
+
+class PokeAPIUnavailableError(Exception):
     pass
@@ -0,0 +1,174 @@
+import hashlib
+import re
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from pydantic import BaseModel
+
+import prompts
+from core.config import PokemonNotFoundStatus, settings
+from core.semantic_cache import SemanticCache
+from tools.cache import LRUCache
+from tools.pokeapi import get_loaded_name_index
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+TRAILING_PUNCTUATION = "?!."
+FAILED_STATUSES = tuple(PokemonNotFoundStatus)
+
+
+def normalize_question(question: str) -> str:
+    """
+    Case-fold a question, collapse its whitespace and strip trailing ``?!.``.
+
+    Other symbols are kept: "2+2" and "2-2", or "C++" and "C", are different
+    questions.
+    """
+    question = WHITESPACE_PATTERN.sub(" ", question.casefold()).strip()
+    return question.rstrip(TRAILING_PUNCTUATION).rstrip()
+
+
+def prompt_version() -> str:
+    """Return a short hash of every prompt, so that editing one invalidates cached answers."""
+    digest = hashlib.sha256()
+    for name, value in sorted(vars(prompts).items()):
+        if name.isupper() and isinstance(value, str):
+            digest.update(f"{name}={value}\0".encode())
+    return digest.hexdigest()[:12]
+
+
+def is_cacheable(response: Any) -> bool:
+    """Return whether a response is a successful answer, not a fallback or NOT_FOUND result."""
+    data = response.model_dump() if isinstance(response, BaseModel) else response
+    if not isinstance(data, dict) or not data:
+        return False
+    for value in data.values():
+        if value is None or value == "" or value in FAILED_STATUSES:
+            return False
+    return True
+
+
+class ResponseCache:
+    """
+    Exact-match cache of /chat responses.
+
+    Questions are keyed after normalization, so casing, punctuation and
+    spacing variants of a question share one entry. The model name and the
+    prompt version are part of the key: switching either one never serves
+    answers produced by the old configuration. Only successful responses are
+    stored; fallbacks and NOT_FOUND results are recomputed every time.
+
+    With a ``semantic`` tier, questions missing the exact-match cache are
+    looked up among paraphrases of cached questions as well.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a response is served (None means until evicted)
+        model: Name of the generative model producing the responses
+        version: Prompt version, ``prompt_version()`` by default
+        semantic: Near-duplicate tier consulted on exact-match misses
+        normalize: Maps a question to its key (None uses questions as given)
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float],
+        model: str,
+        version: Optional[str] = None,
+        semantic: Optional[SemanticCache] = None,
+        normalize: Optional[Callable[[str], str]] = normalize_question,
+    ):
+        self.model = model
+        self.version = version if version is not None else prompt_version()
+        self.cache = LRUCache(maxsize, ttl=ttl)
+        self.semantic = semantic
+        self.normalize = normalize
+        self.skipped = 0
+
+    def key(self, question: str) -> Hashable:
+        if self.normalize is not None:
+            question = self.normalize(question)
+        return self.model, self.version, question
+
+    def get(self, question: str) -> Optional[Any]:
+        """Return the cached response to a question or to a paraphrase of it, or None."""
+        key = self.key(question)
+        response = self.cache.get(key)
+        if response is None and self.semantic is not None:
+            response = self.semantic.get(question)
+            if response is not None:
+                self.cache.set(key, response)
+        return response
+
+    def set(self, question: str, response: Any) -> bool:
+        """Cache a response if it is cacheable and return whether it was stored."""
+        if not is_cacheable(response):
+            self.skipped += 1
+            return False
+        self.cache.set(self.key(question), response)
+        if self.semantic is not None:
+            self.semantic.set(question, response)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            **self.cache.stats(),
+            "skipped": self.skipped,
+            "model": self.model,
+            "prompt_version": self.version,
+        }
+        if self.semantic is not None:
+            stats["semantic"] = self.semantic.stats()
+        return stats
+
+
+def battle_question(pokemon1: str, pokemon2: str) -> str:
+    """
+    Return the canonical form of a battle: both names lower-cased, in sorted order.
+
+    Punctuation is kept, since "Mr. Mime" is not a valid spelling of "mr-mime".
+    """
+    first, second = sorted((pokemon1.strip().lower(), pokemon2.strip().lower()))
+    return f"{first} vs {second}"
+
+
+def model_name(llm: Any) -> str:
+    """Return the model name of a chat model, falling back to its class name."""
+    for attribute in ("model_name", "model"):
+        name = getattr(llm, attribute, None)
+        if isinstance(name, str) and name:
+            return name
+    return type(llm).__name__
+
+
+def create_response_cache(llm: Any) -> Optional[ResponseCache]:
+    """Create the /chat response cache from the RESPONSE_CACHE_* settings."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return None
+
+    semantic = None
+    if settings.SEMANTIC_CACHE_ENABLED:
+        semantic = SemanticCache(
+            settings.SEMANTIC_CACHE_SIZE,
+            settings.RESPONSE_CACHE_TTL_SECONDS,
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            name_source=get_loaded_name_index,
+            dimensions=settings.SEMANTIC_CACHE_DIMENSIONS,
+        )
+    return ResponseCache(
+        settings.RESPONSE_CACHE_SIZE,
+        settings.RESPONSE_CACHE_TTL_SECONDS,
+        model=model_name(llm),
+        semantic=semantic,
+    )
+
+
+def create_battle_cache(llm: Any) -> Optional[ResponseCache]:
+    """Create the /battle result cache from the BATTLE_CACHE_* settings."""
+    if not settings.BATTLE_CACHE_ENABLED:
+        return None
+    return ResponseCache(
+        settings.BATTLE_CACHE_SIZE,
+        settings.BATTLE_CACHE_TTL_SECONDS,
+        model=model_name(llm),
+        normalize=None,
+    )
@@ -0,0 +1,280 @@
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Container, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from agents.pre_router import BATTLE_PATTERN, find_pokemon, tokenize
+
+BATTLE_TOKEN = "__battle__"
+# Stands where a Pokémon name or number was, so word order around it counts.
+ENTITY_TOKEN = "__entity__"
+
+# Words that carry no meaning of their own in a Pokémon question; dropping
+# them lets "show me the stats of pikachu" match "pikachu stats".
+STOPWORDS = frozenset(
+    "a about an and are as at be by can could do does for give has have how "
+    "i in is it its me of on or please show tell that the their there this was "
+    "what whats which who will with would you your".split()
+)
+# Words whose object decides the meaning: "pikachu is weak to" is not
+# "weak to pikachu", and "evolve to" is not "evolve from".
+DIRECTION_WORDS = frozenset({"to", "from", "into", "against"})
+
+# Weight of the character trigrams of a word relative to the word itself.
+TRIGRAM_WEIGHT = 0.3
+# Weight of a pair of adjacent words, and of a direction word followed by an entity.
+BIGRAM_WEIGHT = 0.3
+DIRECTED_BIGRAM_WEIGHT = 1.5
+
+# Entity tuple of a question, e.g. ("pikachu", "bulbasaur") or ("pikachu", "50").
+Entities = Tuple[str, ...]
+
+
+def stem(word: str) -> str:
+    """Strip a plural "s" so that "stats" matches "stat" and "wins" matches "win"."""
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+class QuestionVectorizer:
+    """
+    Embeds questions as hashed bags of words and character trigrams.
+
+    Pokémon names and numbers are returned as the question's entities: they
+    have to match exactly, so in the text they are replaced by a placeholder
+    and the vector only describes what is asked about them. Battle wordings
+    ("vs", "who would win", "beat") all map to one token. Bigrams of adjacent
+    words keep some word order, so "what is pikachu weak to" does not match
+    "what is weak to pikachu".
+
+    Args:
+        dimensions: Size of the hashed vector space
+    """
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+
+    def split(self, question: str, names: Container[str]) -> Tuple[Entities, List[str]]:
+        """Return the entities of a question, in order, and its words with placeholders."""
+        tokens = tokenize(question)
+        pokemon = find_pokemon(tokens, names)
+        numbers = [token for token in tokens if token.isdigit()]
+        entities = tuple(dict.fromkeys(pokemon + numbers))
+
+        marked = []
+        i = 0
+        while i < len(tokens):
+            if i + 1 < len(tokens) and f"{tokens[i]}-{tokens[i + 1]}" in names:
+                marked.append(ENTITY_TOKEN)
+                i += 2
+                continue
+            token = tokens[i]
+            marked.append(ENTITY_TOKEN if token in names or token.isdigit() else token)
+            i += 1
+
+        text = BATTLE_PATTERN.sub(BATTLE_TOKEN, " ".join(marked))
+        words = [stem(word) for word in text.split() if word not in STOPWORDS]
+        return entities, words
+
+    def embed(self, words: List[str]) -> np.ndarray:
+        """Return the L2-normalized vector of the words (all zeros when there are none)."""
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for word in words:
+            if word == ENTITY_TOKEN:
+                continue
+            vector[zlib.crc32(word.encode()) % self.dimensions] += 1.0
+            if word == BATTLE_TOKEN:
+                continue
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                index = zlib.crc32(padded[i : i + 3].encode()) % self.dimensions
+                vector[index] += TRIGRAM_WEIGHT
+        for first, second in zip(words, words[1:]):
+            index = zlib.crc32(f"{first} {second}".encode()) % self.dimensions
+            if first in DIRECTION_WORDS and second == ENTITY_TOKEN:
+                vector[index] += DIRECTED_BIGRAM_WEIGHT
+            else:
+                vector[index] += BIGRAM_WEIGHT
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class _Bucket:
+    """Vectors of the cached questions sharing one entity tuple, one per row."""
+
+    __slots__ = ("vectors", "ids", "count")
+
+    def __init__(self, dimensions: int):
+        self.vectors = np.empty((1, dimensions), dtype=np.float32)
+        self.ids: List[int] = []
+        self.count = 0
+
+
+class _Entry:
+    __slots__ = ("entities", "row", "response", "expires_at")
+
+    def __init__(
+        self, entities: Entities, row: int, response: Any, expires_at: Optional[float]
+    ):
+        self.entities = entities
+        self.row = row
+        self.response = response
+        self.expires_at = expires_at
+
+
+class SemanticCache:
+    """
+    Near-duplicate cache of /chat responses.
+
+    A question is answered from the cache when a cached question has the
+    same entities (Pokémon names and numbers, in the same order) and a
+    cosine similarity of at least ``threshold``. Vectors of each entity
+    tuple are kept in one matrix, so a lookup is a single matrix-vector
+    product over the candidates. Questions without any Pokémon, and all
+    questions while the name index is not loaded, are not cached: their
+    entities cannot be checked.
+
+    Args:
+        maxsize: Maximum number of cached questions (least recently used are evicted)
+        ttl: Seconds a response is served (None means until evicted)
+        threshold: Minimum cosine similarity of a match
+        name_source: Returns the known Pokémon names, or None while they are not loaded
+        dimensions: Size of the hashed vector space
+        clock: Monotonic time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float],
+        threshold: float,
+        name_source: Callable[[], Optional[Container[str]]],
+        dimensions: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self.name_source = name_source
+        self.vectorizer = QuestionVectorizer(dimensions)
+        self._clock = clock
+        self._buckets: Dict[Entities, _Bucket] = {}
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._next_id = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _vectorize(self, question: str) -> Optional[Tuple[Entities, np.ndarray]]:
+        """Return the entities and vector of a question, or None if it cannot be cached."""
+        names = self.name_source()
+        if names is None:
+            return None
+        entities, words = self.vectorizer.split(question, names)
+        if not entities or all(word == ENTITY_TOKEN for word in words):
+            return None
+        return entities, self.vectorizer.embed(words)
+
+    def get(self, question: str) -> Optional[Any]:
+        """Return the response to the most similar cached question, or None."""
+        vectorized = self._vectorize(question)
+        if vectorized is None:
+            self.skipped += 1
+            return None
+
+        entities, vector = vectorized
+        bucket = self._buckets.get(entities)
+        if bucket is None:
+            self.misses += 1
+            return None
+
+        scores = bucket.vectors[: bucket.count] @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            self.misses += 1
+            return None
+
+        entry_id = bucket.ids[best]
+        entry = self._entries[entry_id]
+        if entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(entry_id)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(entry_id)
+        self.hits += 1
+        return entry.response
+
+    def set(self, question: str, response: Any) -> bool:
+        """Cache the response to a question and return whether it was stored."""
+        vectorized = self._vectorize(question)
+        if vectorized is None:
+            return False
+
+        if len(self._entries) >= self.maxsize:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+        entities, vector = vectorized
+        bucket = self._buckets.get(entities)
+        if bucket is None:
+            bucket = self._buckets[entities] = _Bucket(self.vectorizer.dimensions)
+        if bucket.count == len(bucket.vectors):
+            bucket.vectors = np.resize(bucket.vectors, (2 * bucket.count, vector.size))
+
+        entry_id = self._next_id
+        self._next_id += 1
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        self._entries[entry_id] = _Entry(entities, bucket.count, response, expires_at)
+        bucket.vectors[bucket.count] = vector
+        bucket.ids.append(entry_id)
+        bucket.count += 1
+        return True
+
+    def _remove(self, entry_id: int) -> None:
+        """Drop an entry, moving the last row of its bucket into its place."""
+        entry = self._entries.pop(entry_id)
+        bucket = self._buckets[entry.entities]
+        last = bucket.count - 1
+        if entry.row != last:
+            moved_id = bucket.ids[last]
+            bucket.vectors[entry.row] = bucket.vectors[last]
+            bucket.ids[entry.row] = moved_id
+            self._entries[moved_id].row = entry.row
+        bucket.ids.pop()
+        bucket.count = last
+        if last == 0:
+            del self._buckets[entry.entities]
+
+    def clear(self) -> None:
+        """Remove every entry from the cache (statistics are kept)."""
+        self._buckets.clear()
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "buckets": len(self._buckets),
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
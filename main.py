@@ -1,19 +1,28 @@
+import asyncio
 from contextlib import asynccontextmanager
 from http import HTTPStatus
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Response
+from fastapi.responses import JSONResponse
 from agents.factory import get_agent_factory
 from prompts import BATTLE_EXPERT_PROMPT
 from agents.pokemon_expert import PokemonExpertAgent
 from api.models import ChatRequest
 from core.agent_graph import AgentGraph, get_agent_graph
-from core.config import PokemonNotFoundStatus
-from core.exceptions import PokemonNotFoundError
+from core.config import PokemonNotFoundStatus, settings
+from core.exceptions import (
+    PokemonNotFoundError,
+    PokeAPIUnavailableError,
+    TypeNotFoundError,
+)
+from core.response_cache import ResponseCache, battle_question, create_battle_cache
 from tools.pokeapi import (
     PokeAPIService,
     get_pokemon_service,
     initialize_pokemon_service,
+    load_pokemon_name_index,
     shutdown_pokemon_service,
 )
+from tools.warmup import CacheWarmer, create_cache_warmer
 from core.logging import configure_all_loggers, get_logger
 
 configure_all_loggers(debug_mode=False)
@@ -21,6 +30,8 @@ logger = get_logger(__name__)
 
 agent_graph: AgentGraph | None = None
 battle_expert: PokemonExpertAgent | None = None
+battle_cache: ResponseCache | None = None
+cache_warmer: CacheWarmer | None = None
 
 
 @asynccontextmanager
@@ -35,6 +46,16 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing the Pokémon Multi-Agent System")
     initialize_pokemon_service()
 
+    name_index_task = None
+    if settings.NAME_INDEX_ENABLED:
+        name_index_task = asyncio.create_task(load_pokemon_name_index())
+
+    global cache_warmer
+    warmup_task = None
+    if settings.WARMUP_ENABLED:
+        cache_warmer = create_cache_warmer(get_pokemon_service())
+        warmup_task = asyncio.create_task(cache_warmer.run())
+
     global agent_graph
     agent_graph = get_agent_graph()
 
@@ -44,10 +65,16 @@ async def lifespan(app: FastAPI):
         use_tool=False,
     )
 
+    global battle_cache
+    battle_cache = create_battle_cache(battle_expert.llm)
+
     logger.info("System initialization complete")
     yield
 
     logger.info("Shutting down the Pokémon Multi-Agent System")
+    for task in (name_index_task, warmup_task):
+        if task is not None:
+            task.cancel()
     await shutdown_pokemon_service()
     logger.info("System shutdown complete")
 
@@ -86,11 +113,14 @@ async def chat(request: ChatRequest):
 async def battle(
     pokemon1: str,
     pokemon2: str,
+    response: Response,
     pokemon_service: PokeAPIService = Depends(get_pokemon_service),
 ):
     """
     Endpoint for processing battle requests.
     Compares two Pokémon and returns the result of a hypothetical battle.
+    Results are cached per unordered pair, and the X-Cache header tells
+    whether the response was a cache HIT or MISS.
 
     Args:
         pokemon1 (str): The name of the first Pokémon.
@@ -99,38 +129,123 @@ async def battle(
     Returns:
         The result of the battle request processing.
     """
+    matchup = battle_question(pokemon1, pokemon2)
+    if battle_cache is not None:
+        cached = battle_cache.get(matchup)
+        if cached is not None:
+            logger.info(f"Battle cache hit: {pokemon1} vs {pokemon2}")
+            response.headers["X-Cache"] = "HIT"
+            return cached
+
     try:
         logger.info(f"Processing battle request: {pokemon1} vs {pokemon2}")
-        pokemon1_data = await pokemon_service.get_pokemon_data(
-            pokemon1, get_type_data=True
+        pokemon1_data, pokemon2_data = await pokemon_service.get_many_pokemon_data(
+            [pokemon1, pokemon2], get_type_data=True
         )
-        logger.debug(f"Retrieved data for {pokemon1}")
-
-        pokemon2_data = await pokemon_service.get_pokemon_data(
-            pokemon2, get_type_data=True
-        )
-        logger.debug(f"Retrieved data for {pokemon2}")
+        logger.debug(f"Retrieved data for {pokemon1} and {pokemon2}")
 
         query = f"Who would win in a battle, {pokemon1}: {pokemon1_data}\nor {pokemon2}: {pokemon2_data}?"
         messages = [{"role": "human", "content": query}]
 
         logger.debug("Sending battle analysis query to expert agent")
         result = await battle_expert.process(messages)
+        if battle_cache is not None:
+            battle_cache.set(matchup, result)
+            response.headers["X-Cache"] = "MISS"
 
         logger.info("Battle request processed successfully")
         return result
 
     except PokemonNotFoundError as e:
         logger.warning(f"Pokemon not found: {str(e)}")
+        reasoning = "Could not analyze the battle due to invalid Pokémon. Please check the spelling of Pokémon names."
+        if e.suggestions:
+            reasoning += f" Did you mean: {', '.join(e.suggestions)}?"
         return {
             "winner": PokemonNotFoundStatus.BATTLE_IMPOSSIBLE,
-            "reasoning": "Could not analyze the battle due to invalid Pokémon. Please check the spelling of Pokémon names.",
+            "reasoning": reasoning,
         }
+    except PokeAPIUnavailableError as e:
+        logger.error(f"PokéAPI unavailable: {str(e)}")
+        raise HTTPException(status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail=str(e))
     except Exception as e:
         logger.error(f"Error processing battle request: {e}", exc_info=True)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@app.get("/metrics")
+async def metrics(pokemon_service: PokeAPIService = Depends(get_pokemon_service)):
+    """
+    Metrics endpoint.
+    Returns cache and HTTP connection pool statistics of the PokéAPI service,
+    and the hit/miss statistics of the /chat and /battle response caches.
+
+    Returns:
+        A dictionary of metric groups.
+    """
+    metrics = pokemon_service.get_metrics()
+    if agent_graph is not None and agent_graph.response_cache is not None:
+        metrics = {**metrics, "response_cache": agent_graph.response_cache.stats()}
+    if battle_cache is not None:
+        metrics = {**metrics, "battle_cache": battle_cache.stats()}
+    return metrics
+
+
+@app.get("/_peer/{namespace}/{key}", include_in_schema=False)
+async def peer_record(
+    namespace: str,
+    key: str,
+    pokemon_service: PokeAPIService = Depends(get_pokemon_service),
+):
+    """
+    Peer cache endpoint.
+    Serves a Pokémon or type record owned by this node to another node.
+
+    Args:
+        namespace (str): "pokemon" or "type".
+        key (str): The Pokémon or type name.
+
+    Returns:
+        {"record": ...}, or {"not_found": message} if PokéAPI confirmed that the
+        record does not exist. Any other failure is answered with a 5xx status,
+        so the asking node fetches the record itself.
+    """
+    try:
+        return {"record": await pokemon_service.get_peer_record(namespace, key)}
+    except PokemonNotFoundError as e:
+        if e.confirmed:
+            return {"not_found": str(e)}
+        raise HTTPException(status_code=HTTPStatus.BAD_GATEWAY, detail=str(e))
+    except TypeNotFoundError as e:
+        return {"not_found": str(e)}
+    except PokeAPIUnavailableError as e:
+        raise HTTPException(status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_GATEWAY, detail=str(e))
+
+
+@app.get("/ready")
+async def ready():
+    """
+    Readiness endpoint.
+    Reports 503 until the background cache warm-up has finished, so load
+    balancers can hold traffic while the caches are still cold.
+
+    Returns:
+        The readiness status and warm-up progress.
+    """
+    if cache_warmer is None:
+        return {"status": "ready"}
+
+    warmup = cache_warmer.stats()
+    if not cache_warmer.ready:
+        return JSONResponse(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            content={"status": "warming_up", "warmup": warmup},
+        )
+    return {"status": "ready", "warmup": warmup}
+
+
 @app.get("/")
 async def root():
     """
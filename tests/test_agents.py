@@ -3,14 +3,27 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from langchain_core.messages import HumanMessage
 
 from agents.base import BaseAgent
+from agents.pre_router import (
+    HashedLinearClassifier,
+    PreRouter,
+    create_pre_router,
+    find_pokemon,
+    tokenize,
+)
 from agents.supervisor import SupervisorAgent
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from agents.pokemon_expert import PokemonExpertAgent
-from agents.models import DetailedPokemonBattle
+from agents.models import DetailedPokemonBattle, Router
 from agents.researcher import ResearcherAgent
-from core.config import ResponseFormat, settings, AgentType, PokemonNotFoundStatus
+from core.config import (
+    ResponseFormat,
+    settings,
+    AgentType,
+    PokemonNotFoundStatus,
+    RouterOptions,
+)
 
 from agents.factory import (
     AgentFactory,
@@ -39,6 +52,7 @@ class TestSupervisorAgent(unittest.IsolatedAsyncioTestCase):
         """
         self.agent = SupervisorAgent(AsyncMock())
         self.agent.llm = AsyncMock()
+        self.agent.pre_router = None
 
     async def test_raw_routing_to_researcher(self):
         """
@@ -137,6 +151,162 @@ class TestSupervisorAgent(unittest.IsolatedAsyncioTestCase):
         result = await self.agent.process(messages)
         self.assertIsNone(result)
 
+    def _mock_structured_output(self, response):
+        structured_llm_mock = MagicMock()
+        structured_llm_mock.ainvoke = AsyncMock(return_value=response)
+        self.agent.llm.with_structured_output = MagicMock(
+            return_value=structured_llm_mock
+        )
+        return structured_llm_mock
+
+    async def test_single_call_returns_direct_answer(self):
+        """
+        Test single-call mode answering small talk in the routing call itself.
+        """
+        self.agent.single_call = True
+        self._mock_structured_output(Router(next="direct_response", answer="Hi!"))
+
+        result = await self.agent.process([HumanMessage(content="Hello")])
+        self.assertEqual(result, {"answer": "Hi!"})
+        self.agent.llm.ainvoke.assert_not_called()
+
+    async def test_single_call_returns_route(self):
+        """
+        Test single-call mode routing a Pokémon question to an agent.
+        """
+        self.agent.single_call = True
+        self._mock_structured_output(Router(next="researcher"))
+
+        result = await self.agent.process([HumanMessage(content="Pikachu stats")])
+        self.assertEqual(result, "researcher")
+        self.agent.llm.ainvoke.assert_not_called()
+
+    async def test_single_call_without_answer_generates_one(self):
+        """
+        Test single-call mode falling back to a direct answer call when none is given.
+        """
+        self.agent.single_call = True
+        self._mock_structured_output(Router(next="direct_response"))
+        self.agent.llm.ainvoke.return_value.content = "Hello there!"
+
+        result = await self.agent.process([HumanMessage(content="Hello")])
+        self.assertEqual(result, {"answer": "Hello there!"})
+        self.agent.llm.ainvoke.assert_called_once()
+
+    async def test_single_call_failure_falls_back_to_raw(self):
+        """
+        Test single-call mode falling back to the raw approach on errors.
+        """
+        self.agent.single_call = True
+        structured_llm_mock = self._mock_structured_output(None)
+        structured_llm_mock.ainvoke.side_effect = Exception("Structured failure")
+        self.agent.llm.ainvoke.return_value.content = "pokemon_expert"
+
+        result = await self.agent.process([HumanMessage(content="Pikachu vs Onix")])
+        self.assertEqual(result, "pokemon_expert")
+
+
+# ------------------------------------
+# pre_router.py tests
+# ------------------------------------
+
+NAMES = frozenset({"pikachu", "charizard", "onix", "dragonite", "mr-mime"})
+
+
+class TestPreRouter(unittest.IsolatedAsyncioTestCase):
+    """
+    Test suite for PreRouter in agents.pre_router.
+    Covers name detection, the keyword rules, the trained classifier and
+    falling through to the supervisor LLM.
+    """
+
+    def setUp(self):
+        self.router = PreRouter(
+            HashedLinearClassifier.load(), name_source=lambda: NAMES, threshold=0.8
+        )
+
+    def test_find_pokemon_joins_two_word_names(self):
+        tokens = tokenize("Is Mr. Mime faster than Dragonite's partner?")
+        self.assertEqual(find_pokemon(tokens, NAMES), ["mr-mime", "dragonite"])
+
+    def test_battle_rule(self):
+        for query in ("Pikachu vs Onix", "Who would win, Charizard or Dragonite?"):
+            pre_route = self.router.classify(query)
+            self.assertEqual(pre_route.route, RouterOptions.POKEMON_EXPERT)
+            self.assertEqual(pre_route.reason, "rule:battle")
+
+    def test_stats_rule(self):
+        pre_route = self.router.classify("What are Dragonite's base stats?")
+        self.assertEqual(pre_route.route, RouterOptions.RESEARCHER)
+        self.assertEqual(pre_route.reason, "rule:stats")
+
+    def test_stats_rule_skips_matchup_and_non_stat_questions(self):
+        for query in (
+            "What type is Charizard weak against?",
+            "what is the best attack for pikachu",
+            "Is Onix's defense effective against Pikachu?",
+            "What are Charizard's abilities?",
+        ):
+            pre_route = self.router.classify(query)
+            self.assertNotEqual(pre_route.reason, "rule:stats", query)
+
+        for query in (
+            "What type is Charizard weak against?",
+            "what is the best attack for pikachu",
+        ):
+            pre_route = self.router.route(query)
+            self.assertNotEqual(
+                pre_route and pre_route.route, RouterOptions.RESEARCHER, query
+            )
+
+    def test_classifier_routes_queries_left_open_by_rules(self):
+        cases = {
+            "Hello there": RouterOptions.DIRECT_RESPONSE,
+            "How tall is Onix?": RouterOptions.RESEARCHER,
+            "Tell me about Pikachu": RouterOptions.POKEMON_EXPERT,
+        }
+        for query, route in cases.items():
+            pre_route = self.router.route(query)
+            self.assertIsNotNone(pre_route, query)
+            self.assertEqual(pre_route.route, route, query)
+            self.assertEqual(pre_route.reason, "classifier")
+
+    def test_low_confidence_falls_through(self):
+        self.router.threshold = 0.999
+        self.assertIsNone(self.router.route("Tell me about Pikachu"))
+        self.assertEqual(self.router.stats()["fell_through"], 1)
+
+    def test_without_name_index_queries_fall_through(self):
+        router = PreRouter(HashedLinearClassifier.load())
+
+        self.assertIsNone(router.route("Pikachu vs Onix"))
+        self.assertIsNone(router.route("What are the base stats of Pikachu?"))
+        self.assertEqual(router.stats()["fell_through"], 2)
+
+    @patch.object(settings, "PRE_ROUTER_ENABLED", False)
+    def test_create_pre_router_disabled(self):
+        self.assertIsNone(create_pre_router())
+
+    async def test_supervisor_skips_routing_llm_call(self):
+        agent = SupervisorAgent(AsyncMock(), pre_router=self.router)
+        result = await agent.process([HumanMessage(content="Pikachu vs Onix")])
+        self.assertEqual(result, RouterOptions.POKEMON_EXPERT.value)
+        agent.llm.ainvoke.assert_not_called()
+
+    async def test_supervisor_answers_direct_queries(self):
+        agent = SupervisorAgent(AsyncMock(), pre_router=self.router)
+        agent.llm.ainvoke.return_value.content = "Hi!"
+        result = await agent.process([HumanMessage(content="Hello there")])
+        self.assertEqual(result, {"answer": "Hi!"})
+        agent.llm.ainvoke.assert_called_once()
+
+    async def test_supervisor_falls_back_to_llm(self):
+        self.router.threshold = 1.0
+        agent = SupervisorAgent(AsyncMock(), pre_router=self.router)
+        agent.llm.ainvoke.return_value.content = "researcher"
+        result = await agent.process([HumanMessage(content="How tall is Onix?")])
+        self.assertEqual(result, RouterOptions.RESEARCHER.value)
+
 
 # ------------------------------------
 # factory.py tests
@@ -2,7 +2,18 @@ import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
 from langchain_core.messages import HumanMessage, AIMessage
 
+from agents.models import DetailedPokemonBattle
 from core.agent_graph import AgentGraph, get_agent_graph
+from core.config import PokemonNotFoundStatus, settings
+from core.response_cache import (
+    ResponseCache,
+    battle_question,
+    create_response_cache,
+    is_cacheable,
+    normalize_question,
+    prompt_version,
+)
+from core.semantic_cache import QuestionVectorizer, SemanticCache
 
 # ------------------------------------
 # agent_graph.py tests
@@ -84,3 +95,226 @@ class TestAgentGraph(unittest.IsolatedAsyncioTestCase):
         graph1 = get_agent_graph()
         graph2 = get_agent_graph()
         self.assertIs(graph1, graph2)
+
+    async def test_repeated_question_is_answered_from_cache(self):
+        """
+        Test that a repeated question, in another casing, skips the agents.
+        """
+        self.mock_supervisor.process.return_value = "researcher"
+        self.mock_researcher.process.return_value = {"name": "pikachu"}
+
+        first = await self.agent_graph.invoke("What are the base stats of Pikachu?")
+        second = await self.agent_graph.invoke("what are the base stats of pikachu")
+
+        self.assertEqual(first, second)
+        self.mock_supervisor.process.assert_awaited_once()
+        self.assertEqual(self.agent_graph.response_cache.stats()["hits"], 1)
+
+    async def test_not_found_response_is_not_cached(self):
+        """
+        Test that NOT_FOUND results are recomputed on every request.
+        """
+        self.mock_supervisor.process.return_value = "researcher"
+        self.mock_researcher.process.return_value = {
+            "name": PokemonNotFoundStatus.NOT_FOUND
+        }
+
+        await self.agent_graph.invoke("Stats of Pikachuu")
+        await self.agent_graph.invoke("Stats of Pikachuu")
+
+        self.assertEqual(self.mock_researcher.process.await_count, 2)
+
+
+# ------------------------------------
+# response_cache.py tests
+# ------------------------------------
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Test suite for ResponseCache in core.response_cache.
+    """
+
+    def setUp(self):
+        self.cache = ResponseCache(maxsize=2, ttl=None, model="gpt", version="v1")
+
+    def test_normalize_question(self):
+        self.assertEqual(
+            normalize_question("  What are the BASE stats of Pikachu?! "),
+            normalize_question("what are the base stats of pikachu"),
+        )
+
+    def test_normalize_question_keeps_inner_symbols(self):
+        for first, second in (
+            ("What is 2+2?", "what is 2-2"),
+            ("Is C++ better than C#?", "Is C better than C?"),
+        ):
+            self.assertNotEqual(normalize_question(first), normalize_question(second))
+        self.assertEqual(normalize_question("What is 2+2 ?"), "what is 2+2")
+
+    def test_prompt_version_is_stable(self):
+        self.assertEqual(prompt_version(), prompt_version())
+
+    def test_key_includes_model_and_prompt_version(self):
+        other_model = ResponseCache(maxsize=2, ttl=None, model="llama", version="v1")
+        other_version = ResponseCache(maxsize=2, ttl=None, model="gpt", version="v2")
+        key = self.cache.key("Hello")
+        self.assertNotEqual(key, other_model.key("Hello"))
+        self.assertNotEqual(key, other_version.key("Hello"))
+
+    def test_is_cacheable(self):
+        self.assertTrue(is_cacheable({"answer": "Hi!"}))
+        self.assertTrue(
+            is_cacheable(DetailedPokemonBattle(answer="Pikachu", reasoning="Speed"))
+        )
+        self.assertFalse(is_cacheable({"answer": ""}))
+        self.assertFalse(is_cacheable({"name": PokemonNotFoundStatus.NOT_FOUND}))
+        self.assertFalse(
+            is_cacheable(
+                DetailedPokemonBattle(
+                    answer=PokemonNotFoundStatus.ANSWER_IMPOSSIBLE, reasoning="Typo"
+                )
+            )
+        )
+        self.assertFalse(is_cacheable(None))
+
+    def test_set_and_get(self):
+        self.assertTrue(self.cache.set("Hello!", {"answer": "Hi!"}))
+        self.assertEqual(self.cache.get("hello"), {"answer": "Hi!"})
+        self.assertIsNone(self.cache.get("Goodbye"))
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_uncacheable_response_is_skipped(self):
+        self.assertFalse(self.cache.set("Q", {"name": PokemonNotFoundStatus.NOT_FOUND}))
+        self.assertIsNone(self.cache.get("Q"))
+        self.assertEqual(self.cache.stats()["skipped"], 1)
+
+    def test_lru_eviction(self):
+        for question in ("a", "b", "c"):
+            self.cache.set(question, {"answer": question})
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_battle_question_is_symmetric(self):
+        self.assertEqual(
+            battle_question("Pikachu", "eevee"), battle_question(" EEVEE", "pikachu")
+        )
+        self.assertEqual(battle_question("Mr. Mime", "onix"), "mr. mime vs onix")
+
+    def test_battle_keys_keep_spelling(self):
+        cache = ResponseCache(10, None, model="m", version="v", normalize=None)
+        cache.set(battle_question("mr-mime", "onix"), {"winner": "mr-mime"})
+
+        for pokemon in ("Mr. Mime", "mr mime", "mr-mime."):
+            self.assertIsNone(cache.get(battle_question(pokemon, "onix")), pokemon)
+        self.assertIsNotNone(cache.get(battle_question(" MR-MIME", "Onix")))
+
+    @patch.object(settings, "RESPONSE_CACHE_ENABLED", False)
+    def test_create_response_cache_disabled(self):
+        self.assertIsNone(create_response_cache(MagicMock()))
+
+
+# ------------------------------------
+# semantic_cache.py tests
+# ------------------------------------
+
+NAMES = frozenset({"pikachu", "bulbasaur", "onix", "mr-mime"})
+
+
+class TestSemanticCache(unittest.TestCase):
+    """
+    Test suite for SemanticCache in core.semantic_cache.
+    Covers paraphrase matching, the entity check, eviction and expiry.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        self.cache = SemanticCache(
+            maxsize=3,
+            ttl=60,
+            threshold=0.9,
+            name_source=lambda: NAMES,
+            clock=lambda: self.now,
+        )
+
+    def test_split_extracts_entities_in_order(self):
+        entities, words = QuestionVectorizer().split(
+            "Who would win, Mr. Mime or Onix at level 50?", NAMES
+        )
+        self.assertEqual(entities, ("mr-mime", "onix", "50"))
+        self.assertEqual(
+            words, ["__battle__", "__entity__", "__entity__", "level", "__entity__"]
+        )
+
+    def test_paraphrase_is_a_hit(self):
+        self.cache.set("Who would win, Pikachu or Bulbasaur?", {"answer": "Pikachu"})
+        self.assertEqual(
+            self.cache.get("pikachu vs bulbasaur who wins"), {"answer": "Pikachu"}
+        )
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_different_entities_miss(self):
+        self.cache.set("Who would win, Pikachu or Bulbasaur?", {"answer": "Pikachu"})
+        self.assertIsNone(self.cache.get("Who would win, Pikachu or Onix?"))
+        self.assertIsNone(self.cache.get("Who would win, Bulbasaur or Pikachu?"))
+
+    def test_opposite_questions_miss(self):
+        for cached, question in (
+            ("what does pikachu evolve to", "what does pikachu evolve from"),
+            (
+                "what types are strong against pikachu",
+                "what types is pikachu strong against",
+            ),
+            ("what is weak to pikachu", "what is pikachu weak to"),
+        ):
+            with self.subTest(question=question):
+                self.cache.clear()
+                self.cache.set(cached, {"answer": cached})
+                self.assertIsNone(self.cache.get(question))
+                self.cache.clear()
+                self.cache.set(question, {"answer": question})
+                self.assertIsNone(self.cache.get(cached))
+
+    def test_different_question_about_same_pokemon_misses(self):
+        self.cache.set("How tall is Pikachu?", {"answer": "0.4 m"})
+        self.assertIsNone(self.cache.get("How heavy is Pikachu?"))
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_questions_without_pokemon_are_not_cached(self):
+        self.assertFalse(self.cache.set("What is the capital of France?", {"a": 1}))
+        self.assertIsNone(self.cache.get("What is the capital of France?"))
+        self.assertEqual(self.cache.stats()["skipped"], 1)
+
+    def test_nothing_is_cached_without_name_index(self):
+        cache = SemanticCache(3, None, 0.9, name_source=lambda: None)
+        self.assertFalse(cache.set("How tall is Pikachu?", {"answer": "0.4 m"}))
+
+    def test_lru_eviction_keeps_buckets_consistent(self):
+        self.cache.set("How tall is Pikachu?", {"answer": "tall"})
+        self.cache.set("How heavy is Pikachu?", {"answer": "heavy"})
+        self.cache.set("What type is Onix?", {"answer": "rock"})
+        self.cache.get("How heavy is Pikachu?")
+        self.cache.set("What type is Bulbasaur?", {"answer": "grass"})
+
+        self.assertIsNone(self.cache.get("How tall is Pikachu?"))
+        self.assertEqual(self.cache.get("How heavy is Pikachu?"), {"answer": "heavy"})
+        self.assertEqual(self.cache.get("Onix type"), {"answer": "rock"})
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_expired_entry_misses(self):
+        self.cache.set("How tall is Pikachu?", {"answer": "0.4 m"})
+        self.now = 61.0
+        self.assertIsNone(self.cache.get("How tall is Pikachu?"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_response_cache_promotes_semantic_hits(self):
+        response_cache = ResponseCache(
+            10, None, model="gpt", version="v1", semantic=self.cache
+        )
+        response_cache.set("Who would win, Pikachu or Bulbasaur?", {"answer": "P"})
+
+        self.assertEqual(response_cache.get("Pikachu vs Bulbasaur"), {"answer": "P"})
+        self.assertEqual(response_cache.get("pikachu VS bulbasaur!"), {"answer": "P"})
+        self.assertEqual(response_cache.stats()["semantic"]["hits"], 1)
@@ -2,8 +2,16 @@ import unittest
 from unittest.mock import AsyncMock, patch, Mock
 from fastapi.testclient import TestClient
 import pytest
-from core.exceptions import PokemonNotFoundError
+from core.config import PokemonNotFoundStatus
+from core.exceptions import (
+    PokemonNotFoundError,
+    PokeAPIUnavailableError,
+    TypeNotFoundError,
+)
+from core.response_cache import ResponseCache
 from main import app, lifespan
+from tools.pokeapi import get_pokemon_service
+from tools.warmup import CacheWarmer
 from pytest import MonkeyPatch
 
 
@@ -59,17 +67,22 @@ class TestBattleEndpoint(unittest.TestCase):
     def setUp(self):
         self.client = TestClient(app)
 
+        cache_patcher = patch("main.battle_cache", None)
+        self.addCleanup(cache_patcher.stop)
+        cache_patcher.start()
+
         patcher = patch("tools.pokeapi.PokeAPIService", autospec=True)
         self.addCleanup(patcher.stop)
         self.mock_pokeapi_service_class = patcher.start()
         self.mock_service = AsyncMock()
         self.mock_pokeapi_service_class.return_value = self.mock_service
+        app.dependency_overrides[get_pokemon_service] = lambda: self.mock_service
 
     def tearDown(self):
         app.dependency_overrides = {}
 
     def test_battle_success(self):
-        self.mock_service.get_pokemon_data.side_effect = [
+        self.mock_service.get_many_pokemon_data.return_value = [
             {"name": "pikachu", "type_details": {}},
             {"name": "bulbasaur", "type_details": {}},
         ]
@@ -85,8 +98,13 @@ class TestBattleEndpoint(unittest.TestCase):
             self.assertEqual(
                 response.json(), {"winner": "pikachu", "reasoning": "Speed advantage"}
             )
+            self.mock_service.get_many_pokemon_data.assert_awaited_once_with(
+                ["pikachu", "bulbasaur"], get_type_data=True
+            )
 
     def test_battle_pokemon_not_found(self):
+        self.mock_service.get_many_pokemon_data.return_value = [{}, {}]
+
         with patch("main.battle_expert") as mock_battle_expert:
             mock_battle_expert.process.side_effect = PokemonNotFoundError(
                 "Pokemon not found"
@@ -96,18 +114,210 @@ class TestBattleEndpoint(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["winner"], "BATTLE_IMPOSSIBLE")
-        self.mock_service.get_pokemon_data.side_effect = None
-        self.mock_service.get_pokemon_data.reset_mock()
+        self.mock_service.get_many_pokemon_data.side_effect = None
+        self.mock_service.get_many_pokemon_data.reset_mock()
+
+    def test_battle_pokemon_not_found_with_suggestions(self):
+        self.mock_service.get_many_pokemon_data.side_effect = PokemonNotFoundError(
+            "Pokémon 'pikachuu' not found", suggestions=["pikachu"]
+        )
+
+        response = self.client.get("/battle?pokemon1=pikachuu&pokemon2=eevee")
+
+        self.assertEqual(response.json()["winner"], "BATTLE_IMPOSSIBLE")
+        self.assertIn("Did you mean: pikachu?", response.json()["reasoning"])
+        self.mock_service.get_many_pokemon_data.side_effect = None
+
+    def test_battle_pokeapi_unavailable(self):
+        self.mock_service.get_many_pokemon_data.side_effect = PokeAPIUnavailableError(
+            "SERVICE UNAVAILABLE"
+        )
+
+        response = self.client.get("/battle?pokemon1=pikachu&pokemon2=eevee")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["detail"], "SERVICE UNAVAILABLE")
 
     def test_battle_internal_error(self):
-        self.mock_service.get_pokemon_data.side_effect = Exception("Unexpected error")
+        self.mock_service.get_many_pokemon_data.side_effect = Exception(
+            "Unexpected error"
+        )
 
         response = self.client.get("/battle?pokemon1=a&pokemon2=b")
 
         self.assertEqual(response.status_code, 500)
         self.assertEqual(response.json()["detail"], "Unexpected error")
-        self.mock_service.get_pokemon_data.side_effect = None
-        self.mock_service.get_pokemon_data.reset_mock()
+        self.mock_service.get_many_pokemon_data.side_effect = None
+        self.mock_service.get_many_pokemon_data.reset_mock()
+
+
+class TestBattleCache(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+        self.cache = ResponseCache(10, None, model="gpt", version="v1")
+
+        cache_patcher = patch("main.battle_cache", self.cache)
+        self.addCleanup(cache_patcher.stop)
+        cache_patcher.start()
+
+        expert_patcher = patch("main.battle_expert")
+        self.addCleanup(expert_patcher.stop)
+        self.mock_battle_expert = expert_patcher.start()
+        self.mock_battle_expert.process = AsyncMock(
+            return_value={"winner": "pikachu", "reasoning": "Speed advantage"}
+        )
+
+        self.mock_service = AsyncMock()
+        self.mock_service.get_many_pokemon_data.return_value = [
+            {"name": "pikachu"},
+            {"name": "eevee"},
+        ]
+        app.dependency_overrides[get_pokemon_service] = lambda: self.mock_service
+
+    def tearDown(self):
+        app.dependency_overrides = {}
+
+    def test_reversed_pair_is_a_cache_hit(self):
+        first = self.client.get("/battle?pokemon1=pikachu&pokemon2=eevee")
+        second = self.client.get("/battle?pokemon1=Eevee&pokemon2=Pikachu")
+
+        self.assertEqual(first.headers["X-Cache"], "MISS")
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(first.json(), second.json())
+        self.mock_battle_expert.process.assert_awaited_once()
+        self.mock_service.get_many_pokemon_data.assert_awaited_once()
+
+    def test_failed_analysis_is_not_cached(self):
+        self.mock_battle_expert.process.return_value = {
+            "winner": PokemonNotFoundStatus.BATTLE_IMPOSSIBLE,
+            "reasoning": "Invalid Pokémon",
+        }
+
+        self.client.get("/battle?pokemon1=pikachu&pokemon2=eevee")
+        response = self.client.get("/battle?pokemon1=pikachu&pokemon2=eevee")
+
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        self.assertEqual(self.mock_battle_expert.process.await_count, 2)
+
+    def test_metrics_include_battle_cache(self):
+        self.mock_service.get_metrics = Mock(return_value={})
+        self.client.get("/battle?pokemon1=pikachu&pokemon2=eevee")
+
+        response = self.client.get("/metrics")
+        self.assertEqual(response.json()["battle_cache"]["size"], 1)
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+        cache_patcher = patch("main.battle_cache", None)
+        self.addCleanup(cache_patcher.stop)
+        cache_patcher.start()
+        self.mock_service = Mock()
+        self.mock_service.get_metrics.return_value = {"http_pool": {"requests": 3}}
+        app.dependency_overrides[get_pokemon_service] = lambda: self.mock_service
+
+    def tearDown(self):
+        app.dependency_overrides = {}
+
+    def test_metrics(self):
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"http_pool": {"requests": 3}})
+
+    @patch("main.agent_graph")
+    def test_metrics_include_response_cache(self, mock_agent_graph):
+        mock_agent_graph.response_cache.stats.return_value = {"hits": 2}
+        response = self.client.get("/metrics")
+
+        self.assertEqual(
+            response.json(),
+            {"http_pool": {"requests": 3}, "response_cache": {"hits": 2}},
+        )
+
+
+class TestPeerEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+        self.mock_service = Mock()
+        self.mock_service.get_peer_record = AsyncMock()
+        app.dependency_overrides[get_pokemon_service] = lambda: self.mock_service
+
+    def tearDown(self):
+        app.dependency_overrides = {}
+
+    def test_peer_record(self):
+        self.mock_service.get_peer_record.return_value = {"name": "pikachu"}
+
+        response = self.client.get("/_peer/pokemon/pikachu")
+
+        self.assertEqual(response.json(), {"record": {"name": "pikachu"}})
+        self.mock_service.get_peer_record.assert_awaited_once_with("pokemon", "pikachu")
+
+    def test_peer_record_not_found(self):
+        self.mock_service.get_peer_record.side_effect = PokemonNotFoundError(
+            "not found", confirmed=True
+        )
+
+        response = self.client.get("/_peer/pokemon/missingno")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"not_found": "not found"})
+
+    def test_peer_record_type_not_found(self):
+        self.mock_service.get_peer_record.side_effect = TypeNotFoundError("not found")
+
+        response = self.client.get("/_peer/type/shadow")
+
+        self.assertEqual(response.json(), {"not_found": "not found"})
+
+    def test_unconfirmed_errors_are_not_reported_as_not_found(self):
+        for error in (
+            PokemonNotFoundError("HTTP 403"),
+            ValueError("Expecting value"),
+        ):
+            with self.subTest(error=error):
+                self.mock_service.get_peer_record.side_effect = error
+
+                response = self.client.get("/_peer/pokemon/pikachu")
+
+                self.assertEqual(response.status_code, 502)
+                self.assertNotIn("not_found", response.json())
+
+    def test_peer_record_upstream_unavailable(self):
+        self.mock_service.get_peer_record.side_effect = PokeAPIUnavailableError("down")
+
+        response = self.client.get("/_peer/type/electric")
+
+        self.assertEqual(response.status_code, 503)
+
+
+class TestReadyEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_ready_without_warmup(self):
+        with patch("main.cache_warmer", None):
+            response = self.client.get("/ready")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ready"})
+
+    def test_not_ready_while_warming_up(self):
+        warmer = CacheWarmer(Mock(), ["pikachu"])
+
+        with patch("main.cache_warmer", warmer):
+            response = self.client.get("/ready")
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.json()["status"], "warming_up")
+
+            warmer.ready = True
+            response = self.client.get("/ready")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["warmup"]["total"], 19)
 
 
 @pytest.fixture
@@ -121,11 +331,13 @@ def mock_pokeapi_service():
     with patch("tools.pokeapi.PokeAPIService", autospec=True) as mock_service_class:
         mock_service = AsyncMock()
         mock_service_class.return_value = mock_service
+        app.dependency_overrides[get_pokemon_service] = lambda: mock_service
         yield mock_service
+        app.dependency_overrides = {}
 
 
 def test_battle_success(client, mock_pokeapi_service):
-    mock_pokeapi_service.get_pokemon_data.side_effect = [
+    mock_pokeapi_service.get_many_pokemon_data.return_value = [
         {"name": "pikachu", "type_details": {}},
         {"name": "bulbasaur", "type_details": {}},
     ]
@@ -142,6 +354,8 @@ def test_battle_success(client, mock_pokeapi_service):
 
 
 def test_battle_pokemon_not_found(client, mock_pokeapi_service):
+    mock_pokeapi_service.get_many_pokemon_data.return_value = [{}, {}]
+
     with patch("main.battle_expert") as mock_battle_expert:
         mock_battle_expert.process.side_effect = PokemonNotFoundError(
             "Pokemon not found"
@@ -151,8 +365,8 @@ def test_battle_pokemon_not_found(client, mock_pokeapi_service):
 
     assert response.status_code == 200
     assert response.json()["winner"] == "BATTLE_IMPOSSIBLE"
-    mock_pokeapi_service.get_pokemon_data.side_effect = None
-    mock_pokeapi_service.get_pokemon_data.reset_mock()
+    mock_pokeapi_service.get_many_pokemon_data.side_effect = None
+    mock_pokeapi_service.get_many_pokemon_data.reset_mock()
 
 
 class TestLifespan(unittest.IsolatedAsyncioTestCase):
@@ -161,12 +375,14 @@ class TestLifespan(unittest.IsolatedAsyncioTestCase):
     @patch("main.get_agent_factory")
     @patch("main.get_agent_graph")
     @patch("main.initialize_pokemon_service")
+    @patch("main.load_pokemon_name_index", new_callable=AsyncMock)
     @patch("main.shutdown_pokemon_service")
     @patch("main.logger")
     async def test_lifespan_starts_and_stops(
         self,
         mock_logger,
         mock_shutdown,
+        mock_load_name_index,
         mock_initialize,
         mock_get_graph,
         mock_get_factory,
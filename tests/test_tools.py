@@ -1,9 +1,33 @@
+import asyncio
+import json
+import math
+import os
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote
 from unittest.mock import AsyncMock, Mock, patch
 import httpx
 from tools import pokeapi
-from tools.pokeapi import PokeAPIService
-from core.exceptions import PokemonNotFoundError
+from tools.pokeapi import PokeAPIService, extract_pokemon_info, parse_retry_after
+from tools.cache import LRUCache
+from tools.circuit_breaker import CircuitBreaker, CircuitState
+from tools.name_index import PokemonNameIndex, levenshtein
+from tools.peer_cache import HashRing, PeerCache
+from tools.persistent_cache import SQLiteCacheBackend
+from tools.rate_limit import RateLimiter, TokenBucket
+from tools.records import PokemonRecord
+from tools.selective_json import SelectiveJSONParser
+from tools.shared_cache import SharedCacheBackend
+from tools.snapshot import PokedexSnapshot, SnapshotFormatError, write_snapshot
+from tools.build_snapshot import load_dump
+from tools.type_matrix import TypeEffectivenessMatrix
+from tools.transport import ConnectionPoolMetrics, InstrumentedTransport
+from tools.warmup import AccessLog, CacheWarmer, hot_pokemon_names
+from core.config import settings
+from core.exceptions import PokemonNotFoundError, PokeAPIUnavailableError
 from tools.langchain_tools import AsyncPokeapiTool, AsyncPokeapiToolWithTypes
 from tools.langchain_tools import PokemonInput
 
@@ -23,6 +47,7 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
     @patch("tools.pokeapi.httpx.AsyncClient.get")
     async def test_pokemon_exists_true(self, mock_get):
         mock_response = AsyncMock()
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value={"name": "pikachu"})
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
@@ -44,6 +69,7 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
     @patch("tools.pokeapi.httpx.AsyncClient.get")
     async def test_get_pokemon_data_with_cache(self, mock_get):
         mock_response = AsyncMock()
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(
             return_value={
                 "id": 25,
@@ -73,7 +99,7 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
         }
 
         self.assertEqual(data, expected_data)
-        self.assertIn("pikachu_False", self.service.pokemon_cache)
+        self.assertIn("pikachu", self.service.pokemon_cache)
         mock_get.assert_awaited_once()
 
         mock_get.reset_mock()
@@ -94,6 +120,7 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
     @patch("tools.pokeapi.httpx.AsyncClient.get")
     async def test_get_type_data_with_cache(self, mock_get):
         mock_response = AsyncMock()
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(
             return_value={
                 "id": 13,
@@ -134,6 +161,7 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
         self, mock_get, mock_fetch_type_data
     ):
         mock_response = AsyncMock()
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(
             return_value={
                 "id": 25,
@@ -178,10 +206,9 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
         mock_fetch_type_data.assert_awaited_once_with("electric")
 
     async def test_cache_eviction_policy(self):
-        self.service.pokemon_cache = {
-            "bulbasaur_False": {},
-            "charmander_False": {},
-        }
+        self.service.pokemon_cache.set("bulbasaur", {})
+        self.service.pokemon_cache.set("charmander", {})
+        self.service.pokemon_cache.get("bulbasaur")
 
         with patch.object(
             self.service, "_fetch_pokemon_data", new_callable=AsyncMock
@@ -191,8 +218,123 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
             await self.service.get_pokemon_data("squirtle")
 
             self.assertEqual(len(self.service.pokemon_cache), 2)
-            self.assertIn("squirtle_False", self.service.pokemon_cache)
-            self.assertNotIn("bulbasaur_False", self.service.pokemon_cache)
+            self.assertIn("squirtle", self.service.pokemon_cache)
+            self.assertIn("bulbasaur", self.service.pokemon_cache)
+            self.assertNotIn("charmander", self.service.pokemon_cache)
+
+    def test_get_cache_stats(self):
+        self.service.type_cache.set("fire", {"name": "fire"})
+        self.service.type_cache.get("fire")
+        self.service.type_cache.get("water")
+
+        stats = self.service.get_cache_stats()
+
+        self.assertEqual(stats["type_cache"]["hits"], 1)
+        self.assertEqual(stats["type_cache"]["misses"], 1)
+        self.assertEqual(stats["pokemon_cache"]["size"], 0)
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        release = asyncio.Event()
+
+        async def slow_fetch(pokemon_name):
+            await release.wait()
+            return {"id": 25, "name": pokemon_name}
+
+        with patch.object(
+            self.service, "_fetch_pokemon_data", side_effect=slow_fetch
+        ) as mock_fetch:
+            tasks = [
+                asyncio.create_task(self.service.get_pokemon_data("Pikachu"))
+                for _ in range(10)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        mock_fetch.assert_called_once_with("pikachu")
+        self.assertTrue(all(r["id"] == 25 and r["name"] == "pikachu" for r in results))
+        self.assertEqual(self.service.in_flight.stats()["shared"], 9)
+        self.assertEqual(len(self.service.in_flight), 0)
+
+    async def test_concurrent_misses_share_errors(self):
+        release = asyncio.Event()
+
+        async def failing_fetch(pokemon_name):
+            await release.wait()
+            raise PokemonNotFoundError("not found")
+
+        with patch.object(
+            self.service, "_fetch_pokemon_data", side_effect=failing_fetch
+        ) as mock_fetch:
+            tasks = [
+                asyncio.create_task(self.service.get_pokemon_data("pikachuu"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        mock_fetch.assert_called_once()
+        self.assertTrue(all(isinstance(r, PokemonNotFoundError) for r in results))
+        self.assertNotIn("pikachuu", self.service.pokemon_cache)
+
+    async def test_get_many_pokemon_data_preserves_order(self):
+        async def fetch(pokemon_name):
+            await asyncio.sleep(0.01 if pokemon_name == "pikachu" else 0)
+            return {"name": pokemon_name, "types": []}
+
+        with patch.object(self.service, "_fetch_pokemon_data", side_effect=fetch):
+            results = await self.service.get_many_pokemon_data(
+                ["Pikachu", "eevee"], get_type_data=True
+            )
+
+        self.assertEqual([r["name"] for r in results], ["pikachu", "eevee"])
+        self.assertTrue(all(r["type_details"] == {} for r in results))
+
+    @patch("tools.pokeapi.PokeAPIService._fetch_type_data")
+    async def test_plain_and_enriched_lookups_share_base_record(
+        self, mock_fetch_type_data
+    ):
+        mock_fetch_type_data.return_value = {
+            "name": "electric",
+            "damage_relations": {"double_damage_to": [{"name": "water"}]},
+        }
+
+        with patch.object(
+            self.service, "_fetch_pokemon_data", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = {"name": "pikachu", "types": ["electric"]}
+
+            plain = await self.service.get_pokemon_data("pikachu")
+            enriched = await self.service.get_pokemon_data(
+                "pikachu", get_type_data=True
+            )
+
+        mock_fetch.assert_awaited_once_with("pikachu")
+        self.assertNotIn("type_details", plain)
+        self.assertEqual(
+            enriched["type_details"],
+            {"electric": {"double_damage_to": [{"name": "water"}]}},
+        )
+        self.assertEqual(len(self.service.pokemon_cache), 1)
+
+    async def test_get_many_pokemon_data_bounds_concurrency(self):
+        self.service.max_concurrent_fetches = 2
+        running = 0
+        peak = 0
+
+        async def fetch(pokemon_name):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"name": pokemon_name}
+
+        with patch.object(self.service, "_fetch_pokemon_data", side_effect=fetch):
+            await self.service.get_many_pokemon_data(["a", "b", "c", "d", "e"])
+
+        self.assertEqual(peak, 2)
 
     @patch("tools.pokeapi.httpx.AsyncClient.get")
     async def test_fetch_type_data_error(self, mock_get):
@@ -203,6 +345,106 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
 
         mock_get.assert_awaited_once()
 
+    def _status_error(self, status_code, headers=None):
+        request = httpx.Request("GET", f"{self.service.BASE_URL}/pokemon/pikachu")
+        response = httpx.Response(status_code, headers=headers, request=request)
+        return httpx.HTTPStatusError("error", request=request, response=response)
+
+    @patch("tools.pokeapi.asyncio.sleep", new_callable=AsyncMock)
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_transient_errors_are_retried(self, mock_get, mock_sleep):
+        ok_response = Mock()
+        ok_response.json = Mock(return_value={"id": 25, "name": "pikachu"})
+        ok_response.raise_for_status = Mock()
+        failing_response = Mock()
+        failing_response.raise_for_status = Mock(side_effect=self._status_error(503))
+        mock_get.side_effect = [
+            httpx.ConnectError("connection reset"),
+            failing_response,
+            ok_response,
+        ]
+
+        data = await self.service.get_pokemon_data("pikachu")
+
+        self.assertEqual(data["name"], "pikachu")
+        self.assertEqual(mock_get.await_count, 3)
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    @patch("tools.pokeapi.asyncio.sleep", new_callable=AsyncMock)
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_not_found_is_not_retried(self, mock_get, mock_sleep):
+        response = Mock()
+        response.raise_for_status = Mock(side_effect=self._status_error(404))
+        mock_get.return_value = response
+
+        with self.assertRaises(PokemonNotFoundError):
+            await self.service.get_pokemon_data("pikachuu")
+
+        mock_get.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+    @patch("tools.pokeapi.asyncio.sleep", new_callable=AsyncMock)
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_retries_exhausted_raise_unavailable(self, mock_get, mock_sleep):
+        response = Mock()
+        response.raise_for_status = Mock(
+            side_effect=self._status_error(429, headers={"Retry-After": "1"})
+        )
+        mock_get.return_value = response
+
+        with self.assertRaises(PokeAPIUnavailableError):
+            await self.service.get_pokemon_data("pikachu")
+
+        self.assertEqual(mock_get.await_count, settings.HTTP_RETRY_ATTEMPTS)
+        for call in mock_sleep.await_args_list:
+            self.assertGreaterEqual(call.args[0], 1.0)
+
+    @patch("tools.pokeapi.asyncio.sleep", new_callable=AsyncMock)
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_retry_after_beyond_deadline_fails_fast(self, mock_get, mock_sleep):
+        response = Mock()
+        response.raise_for_status = Mock(
+            side_effect=self._status_error(503, headers={"Retry-After": "3600"})
+        )
+        mock_get.return_value = response
+
+        with self.assertRaises(PokeAPIUnavailableError):
+            await self.service.get_pokemon_data("pikachu")
+
+        mock_get.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_confirmed_404_is_negatively_cached(self, mock_get):
+        response = Mock()
+        response.raise_for_status = Mock(side_effect=self._status_error(404))
+        mock_get.return_value = response
+
+        with self.assertRaises(PokemonNotFoundError):
+            await self.service.get_pokemon_data("pikachuu")
+        self.assertFalse(await self.service.pokemon_exists("PIKACHUU"))
+
+        mock_get.assert_awaited_once()
+        self.assertEqual(self.service.negative_cache.stats()["hits"], 1)
+
+    @patch("tools.pokeapi.asyncio.sleep", new_callable=AsyncMock)
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_transient_errors_are_not_negatively_cached(
+        self, mock_get, mock_sleep
+    ):
+        mock_get.side_effect = httpx.ConnectError("connection reset")
+
+        with self.assertRaises(PokeAPIUnavailableError):
+            await self.service.get_pokemon_data("pikachu")
+
+        self.assertNotIn("pikachu", self.service.negative_cache)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
     async def test_service_close(self):
         with patch.object(
             self.service.client, "aclose", new_callable=AsyncMock
@@ -211,6 +453,122 @@ class TestPokeAPIService(unittest.IsolatedAsyncioTestCase):
             mock_aclose.assert_awaited_once()
 
 
+class TestConditionalRequests(unittest.IsolatedAsyncioTestCase):
+    DOCUMENT = {
+        "id": 25,
+        "name": "pikachu",
+        "stats": [{"base_stat": 90, "stat": {"name": "speed"}}],
+        "types": [{"type": {"name": "electric"}}],
+        "moves": [{"move": {"name": "thunderbolt"}}],
+    }
+
+    async def asyncSetUp(self):
+        self.etag = '"v1"'
+        self.requests = []
+        self.clock = FakeClock()
+        self.service = PokeAPIService(cache_ttl=5)
+        self.service.pokemon_cache = LRUCache(
+            10, ttl=5, max_stale=math.inf, clock=self.clock
+        )
+        self.service.type_cache = LRUCache(
+            10, ttl=5, max_stale=math.inf, clock=self.clock
+        )
+        await self.service.client.aclose()
+        self.service.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self._route)
+        )
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    def _route(self, request):
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(
+            200,
+            json=self.DOCUMENT,
+            headers={
+                "ETag": self.etag,
+                "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+        )
+
+    async def test_not_modified_reuses_the_cached_record(self):
+        first = await self.service.get_pokemon_data("pikachu")
+        self.clock.now = 10
+
+        with patch.object(pokeapi, "extract_pokemon_info") as extract:
+            second = await self.service.get_pokemon_data("pikachu")
+
+        self.assertEqual(second, first)
+        extract.assert_not_called()
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(
+            self.requests[1].headers["If-Modified-Since"],
+            "Wed, 21 Oct 2015 07:28:00 GMT",
+        )
+        self.assertIn("pikachu", self.service.pokemon_cache)
+        stats = self.service.get_cache_stats()["conditional_requests"]
+        self.assertEqual((stats["sent"], stats["not_modified"]), (1, 1))
+        self.assertEqual(stats["validators"], 1)
+
+    async def test_not_modified_restamps_the_cached_type(self):
+        first = await self.service.get_type_data("electric")
+        self.clock.now = 10
+
+        second = await self.service.get_type_data("electric")
+
+        self.assertIs(second, first)
+        self.assertIn("electric", self.service.type_cache)
+        self.assertEqual(self.service.not_modified, 1)
+
+    async def test_evicted_record_is_downloaded_unconditionally(self):
+        await self.service.get_pokemon_data("pikachu")
+        self.service.pokemon_cache.clear()
+
+        await self.service.get_pokemon_data("pikachu")
+
+        self.assertNotIn("If-None-Match", self.requests[1].headers)
+        self.assertEqual(self.service.conditional_requests, 0)
+
+    def test_expired_entries_are_kept_for_revalidation(self):
+        service = PokeAPIService(cache_ttl=5)
+
+        self.assertEqual(service.pokemon_cache.max_stale, math.inf)
+        with patch.object(settings, "CONDITIONAL_REQUESTS_ENABLED", False):
+            self.assertIsNone(PokeAPIService(cache_ttl=5).pokemon_cache.max_stale)
+
+    async def test_changed_document_is_downloaded_again(self):
+        await self.service.get_type_data("electric")
+        self.clock.now = 10
+        self.etag = '"v2"'
+
+        await self.service.get_type_data("electric")
+
+        self.assertEqual(self.service.not_modified, 0)
+        validators = self.service.validators.get(("type", "electric"))
+        self.assertEqual(validators.etag, '"v2"')
+
+    async def test_not_modified_with_selective_parsing(self):
+        with patch.object(settings, "SELECTIVE_JSON_PARSING", True):
+            first = await self.service.get_pokemon_data("pikachu")
+            self.clock.now = 10
+            second = await self.service.get_pokemon_data("pikachu")
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.service.not_modified, 1)
+
+    async def test_disabled(self):
+        with patch.object(settings, "CONDITIONAL_REQUESTS_ENABLED", False):
+            await self.service.get_pokemon_data("pikachu")
+            self.clock.now = 10
+            await self.service.get_pokemon_data("pikachu")
+
+        self.assertNotIn("If-None-Match", self.requests[1].headers)
+        self.assertEqual(len(self.service.validators), 0)
+
+
 class TestGlobalPokemonServiceLifecycle(unittest.IsolatedAsyncioTestCase):
     async def asyncTearDown(self):
         if pokeapi.pokemon_service:
@@ -244,6 +602,1289 @@ class TestGlobalPokemonServiceLifecycle(unittest.IsolatedAsyncioTestCase):
         self.assertIs(service1, service2)
 
 
+# ------------------------------------
+# cache.py tests
+# ------------------------------------
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_set_existing_key_does_not_evict(self):
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        self.assertEqual(cache.get("a"), 10)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = LRUCache(10, ttl=5, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=20)
+
+        clock.now = 6
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.expirations, 1)
+
+    def test_stats(self):
+        cache = LRUCache(10)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+    def test_get_stale_within_max_stale(self):
+        clock = FakeClock()
+        cache = LRUCache(10, ttl=5, max_stale=10, clock=clock)
+        cache.set("a", 1)
+
+        self.assertEqual(cache.get_stale("a"), (1, False))
+        clock.now = 6
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get_stale("a"), (1, True))
+        self.assertEqual(cache.stats()["stale_hits"], 1)
+
+        clock.now = 15
+        self.assertEqual(cache.get_stale("a"), (None, False))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.expirations, 1)
+
+
+class TestStaleWhileRevalidate(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.clock = FakeClock()
+        self.service = PokeAPIService(stale_while_revalidate=True)
+        self.service.pokemon_cache = LRUCache(10, ttl=5, max_stale=60, clock=self.clock)
+        self.service.type_cache = LRUCache(10, ttl=5, max_stale=60, clock=self.clock)
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    async def test_stale_entry_served_while_refreshed_once(self):
+        refreshed = asyncio.Event()
+
+        async def fetch(name):
+            await refreshed.wait()
+            return {"id": 25, "name": name, "base_experience": 999}
+
+        self.service.pokemon_cache.set(
+            "pikachu", PokemonRecord.from_dict(PIKACHU_RECORD)
+        )
+        self.clock.now = 10
+
+        with patch.object(
+            self.service, "_fetch_pokemon_data", side_effect=fetch
+        ) as mock_fetch:
+            first = await self.service.get_pokemon_data("pikachu")
+            second = await self.service.get_pokemon_data("pikachu")
+            self.assertEqual(first["base_experience"], 112)
+            self.assertEqual(second["base_experience"], 112)
+            self.assertEqual(len(self.service.revalidations), 1)
+
+            refreshed.set()
+            await asyncio.gather(*self.service.revalidations.values())
+            fresh = await self.service.get_pokemon_data("pikachu")
+
+        self.assertEqual(fresh["base_experience"], 999)
+        mock_fetch.assert_awaited_once_with("pikachu")
+        self.assertEqual(self.service.revalidations, {})
+
+    async def test_request_waits_past_max_stale(self):
+        self.service.type_cache.set("electric", {"name": "electric", "stale": True})
+        self.clock.now = 100
+
+        with patch.object(
+            self.service, "_fetch_type_data", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = {"name": "electric"}
+            data = await self.service.get_type_data("electric")
+
+        self.assertEqual(data, {"name": "electric"})
+        self.assertEqual(self.service.revalidations, {})
+
+    async def test_failed_refresh_keeps_stale_entry(self):
+        self.service.type_cache.set("electric", ELECTRIC_RECORD)
+        self.clock.now = 10
+
+        with patch.object(
+            self.service, "_fetch_type_data", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.side_effect = PokeAPIUnavailableError("down")
+            data = await self.service.get_type_data("electric")
+            await asyncio.gather(
+                *self.service.revalidations.values(), return_exceptions=True
+            )
+
+        self.assertEqual(data, ELECTRIC_RECORD)
+        self.assertEqual(
+            self.service.type_cache.get_stale("electric"), (ELECTRIC_RECORD, True)
+        )
+        self.assertEqual(self.service.get_cache_stats()["revalidation"]["failures"], 1)
+
+
+# ------------------------------------
+# records.py tests
+# ------------------------------------
+
+
+class TestPokemonRecord(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            "id": 25,
+            "name": "pikachu",
+            "base_experience": 112,
+            "height": 4,
+            "weight": 60,
+            "abilities": ["static", "lightning-rod"],
+            "stats": {
+                "hp": 35,
+                "attack": 55,
+                "defense": 40,
+                "special-attack": 50,
+                "special-defense": 50,
+                "speed": 90,
+            },
+            "types": ["electric"],
+        }
+
+    def test_round_trip(self):
+        record = PokemonRecord.from_dict(self.data)
+
+        self.assertEqual(record.to_dict(), self.data)
+        self.assertEqual(record.stats.typecode, "H")
+        self.assertEqual(list(record.stats), [35, 55, 40, 50, 50, 90])
+
+    def test_missing_and_unknown_stats(self):
+        record = PokemonRecord.from_dict(
+            {"name": "pikachu", "stats": {"speed": 90, "accuracy": 100}}
+        )
+
+        self.assertEqual(record.stats_dict(), {"speed": 90, "accuracy": 100})
+
+    def test_names_are_interned(self):
+        first = PokemonRecord.from_dict(self.data)
+        second = PokemonRecord.from_dict(json.loads(json.dumps(self.data)))
+
+        self.assertIs(first.types[0], second.types[0])
+        self.assertIs(first.abilities[1], second.abilities[1])
+        self.assertFalse(hasattr(first, "__dict__"))
+
+
+# ------------------------------------
+# persistent_cache.py tests
+# ------------------------------------
+
+
+class TestSQLiteCacheBackend(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.backend = SQLiteCacheBackend(self.tmp_dir.name)
+
+    async def asyncTearDown(self):
+        await self.backend.close()
+        self.tmp_dir.cleanup()
+
+    async def test_round_trip(self):
+        await self.backend.set("pokemon", "pikachu", {"id": 25, "name": "pikachu"})
+
+        self.assertEqual(
+            await self.backend.get("pokemon", "pikachu"), {"id": 25, "name": "pikachu"}
+        )
+        self.assertIsNone(await self.backend.get("type", "pikachu"))
+        self.assertEqual(self.backend.stats()["hits"], 1)
+        self.assertEqual(self.backend.stats()["misses"], 1)
+
+    async def test_survives_reopen(self):
+        await self.backend.set("type", "fire", {"id": 10, "name": "fire"})
+        await self.backend.close()
+
+        self.backend = SQLiteCacheBackend(self.tmp_dir.name)
+
+        self.assertEqual(
+            await self.backend.get("type", "fire"), {"id": 10, "name": "fire"}
+        )
+
+    async def test_max_age(self):
+        with patch("tools.persistent_cache.time.time", return_value=1000.0):
+            await self.backend.set("type", "fire", {"name": "fire"})
+
+        with patch("tools.persistent_cache.time.time", return_value=1100.0):
+            self.assertIsNone(await self.backend.get("type", "fire", max_age=60))
+            self.assertIsNotNone(await self.backend.get("type", "fire", max_age=600))
+
+    async def test_service_reads_and_writes_persistent_tier(self):
+        service = PokeAPIService(persistent_cache=self.backend)
+        await self.backend.set("type", "fire", {"id": 10, "name": "fire"})
+
+        with patch.object(
+            service, "_fetch_type_data", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = {"id": 11, "name": "water"}
+
+            self.assertEqual(
+                await service.get_type_data("fire"), {"id": 10, "name": "fire"}
+            )
+            await service.get_type_data("water")
+
+        mock_fetch.assert_awaited_once_with("water")
+        self.assertEqual(
+            await self.backend.get("type", "water"), {"id": 11, "name": "water"}
+        )
+        await service.client.aclose()
+
+
+# ------------------------------------
+# snapshot.py / build_snapshot.py tests
+# ------------------------------------
+
+PIKACHU_RECORD = {
+    "id": 25,
+    "name": "pikachu",
+    "base_experience": 112,
+    "height": 4,
+    "weight": 60,
+    "abilities": ["static", "lightning-rod"],
+    "stats": {"hp": 35, "speed": 90},
+    "types": ["electric"],
+}
+ELECTRIC_RECORD = {
+    "id": 13,
+    "name": "electric",
+    "damage_relations": {"double_damage_to": [{"name": "water"}]},
+}
+
+
+class TestPokedexSnapshot(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "pokedex.snapshot")
+        write_snapshot(self.path, [PIKACHU_RECORD], [ELECTRIC_RECORD])
+        self.snapshot = PokedexSnapshot(self.path)
+
+    async def asyncTearDown(self):
+        self.snapshot.close()
+        self.tmp_dir.cleanup()
+
+    async def test_lookup_by_name_and_id(self):
+        self.assertEqual(self.snapshot.get_pokemon("Pikachu"), PIKACHU_RECORD)
+        self.assertEqual(self.snapshot.get_pokemon("25"), PIKACHU_RECORD)
+        self.assertEqual(self.snapshot.get_type("electric"), ELECTRIC_RECORD)
+        self.assertIsNone(self.snapshot.get_pokemon("pikachuu"))
+        self.assertEqual(self.snapshot.pokemon_names(), ["pikachu"])
+
+    async def test_rejects_invalid_file(self):
+        invalid_path = os.path.join(self.tmp_dir.name, "invalid.snapshot")
+        with open(invalid_path, "wb") as f:
+            f.write(b"not a snapshot at all")
+
+        with self.assertRaises(SnapshotFormatError):
+            PokedexSnapshot(invalid_path)
+
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_service_snapshot_mode_skips_http(self, mock_get):
+        service = PokeAPIService(snapshot=self.snapshot)
+
+        data = await service.get_pokemon_data("pikachu", get_type_data=True)
+
+        self.assertEqual(
+            data["type_details"], {"electric": ELECTRIC_RECORD["damage_relations"]}
+        )
+        with self.assertRaises(PokemonNotFoundError):
+            await service.get_pokemon_data("pikachuu")
+        mock_get.assert_not_called()
+        await service.client.aclose()
+
+    async def test_load_dump(self):
+        dump_dir = os.path.join(self.tmp_dir.name, "dump")
+        documents = {
+            "pokemon/25": {
+                "id": 25,
+                "name": "pikachu",
+                "abilities": [{"ability": {"name": "static"}}],
+                "stats": [{"stat": {"name": "speed"}, "base_stat": 90}],
+                "types": [{"type": {"name": "electric"}}],
+                "moves": [{"move": {"name": "thunder-shock"}}],
+            },
+            "type/13": {"id": 13, "name": "electric", "damage_relations": {}},
+        }
+        for folder, document in documents.items():
+            os.makedirs(os.path.join(dump_dir, folder))
+            with open(os.path.join(dump_dir, folder, "index.json"), "w") as f:
+                json.dump(document, f)
+
+        pokemon_records, type_records = load_dump(dump_dir)
+
+        self.assertEqual(pokemon_records[0]["abilities"], ["static"])
+        self.assertNotIn("moves", pokemon_records[0])
+        self.assertEqual(
+            type_records, [{"id": 13, "name": "electric", "damage_relations": {}}]
+        )
+
+
+# ------------------------------------
+# type_matrix.py tests
+# ------------------------------------
+
+TYPE_RECORDS = [
+    {
+        "name": "fire",
+        "damage_relations": {
+            "double_damage_to": [{"name": "grass"}, {"name": "ice"}],
+            "half_damage_to": [{"name": "water"}, {"name": "fire"}],
+            "no_damage_to": [],
+        },
+    },
+    {
+        "name": "electric",
+        "damage_relations": {
+            "double_damage_to": [{"name": "water"}, {"name": "flying"}],
+            "half_damage_to": [{"name": "grass"}],
+            "no_damage_to": [{"name": "ground"}],
+        },
+    },
+]
+
+
+class TestTypeEffectivenessMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = TypeEffectivenessMatrix.from_type_records(TYPE_RECORDS)
+
+    def test_matrix_shape_and_values(self):
+        self.assertEqual(self.matrix.matrix.shape, (18, 18))
+        fire, grass, water = self.matrix.indices(["fire", "grass", "water"])
+        self.assertEqual(self.matrix.matrix[fire, grass], 2.0)
+        self.assertEqual(self.matrix.matrix[fire, water], 0.5)
+        self.assertEqual(self.matrix.matrix[water, fire], 1.0)
+
+    def test_dual_type_defensive_multipliers(self):
+        multipliers = self.matrix.defensive_multipliers(["water", "flying"])
+        electric = self.matrix.indices(["electric"])[0]
+        self.assertEqual(multipliers[electric], 4.0)
+        self.assertEqual(self.matrix.weaknesses(["water", "flying"]), {"electric": 4.0})
+
+    def test_attacker_vs_defender(self):
+        self.assertEqual(
+            list(self.matrix.effectiveness(["fire", "electric"], ["ground"])),
+            [1.0, 0.0],
+        )
+        self.assertEqual(
+            self.matrix.best_effectiveness(["fire", "electric"], ["grass", "ice"]), 4.0
+        )
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            self.matrix.defensive_multipliers(["shadow"])
+
+
+class TestServiceTypeMatrix(unittest.IsolatedAsyncioTestCase):
+    async def test_get_type_matrix_is_built_once(self):
+        service = PokeAPIService()
+        records = {record["name"]: record for record in TYPE_RECORDS}
+
+        with patch.object(
+            service, "_fetch_type_data", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.side_effect = lambda name: records.get(name, {"name": name})
+
+            matrix = await service.get_type_matrix()
+            again = await service.get_type_matrix()
+
+        self.assertIs(matrix, again)
+        self.assertEqual(mock_fetch.await_count, 18)
+        self.assertEqual(matrix.best_effectiveness(["electric"], ["water"]), 2.0)
+        await service.close()
+
+
+# ------------------------------------
+# transport.py tests
+# ------------------------------------
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestInstrumentedTransport(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    async def asyncTearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    async def test_counts_new_and_reused_connections(self):
+        metrics = ConnectionPoolMetrics()
+        async with httpx.AsyncClient(
+            transport=InstrumentedTransport(metrics), trust_env=False
+        ) as client:
+            for _ in range(3):
+                response = await client.get(self.url)
+                self.assertEqual(response.json(), {"ok": True})
+
+        stats = metrics.stats()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["new_connections"], 1)
+        self.assertEqual(stats["reused_connections"], 2)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertGreaterEqual(stats["pool_wait_max_ms"], 0.0)
+
+    def test_service_exposes_pool_metrics(self):
+        service = PokeAPIService()
+        metrics = service.get_metrics()
+
+        self.assertIn("http_pool", metrics)
+        self.assertIn("pokemon_cache", metrics)
+        self.assertIsInstance(service.client._transport, InstrumentedTransport)
+
+
+# ------------------------------------
+# selective_json.py tests
+# ------------------------------------
+
+POKEMON_DOCUMENT = {
+    "abilities": [{"ability": {"name": "static", "url": "u"}, "slot": 1}],
+    "base_experience": 112,
+    "game_indices": [{"game_index": 84, "version": {"name": "red"}}] * 20,
+    "height": 4,
+    "id": 25,
+    "moves": [
+        {
+            "move": {"name": f"move-{i}"},
+            "version_group_details": [{"level_learned_at": i, "note": 'a "]}" b'}],
+        }
+        for i in range(50)
+    ],
+    "name": "pikachu",
+    "sprites": {"front_default": None, "other": {"home": {}}, "versions": {}},
+    "stats": [{"base_stat": 35, "stat": {"name": "hp"}}],
+    "types": [{"type": {"name": "electric"}}],
+    "weight": 60,
+}
+
+
+def _chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestSelectiveJSONParser(unittest.TestCase):
+    KEYS = ("id", "name", "stats", "types")
+
+    def test_keeps_only_selected_members_for_any_chunking(self):
+        data = json.dumps(POKEMON_DOCUMENT, indent=1).encode()
+        expected = {key: POKEMON_DOCUMENT[key] for key in self.KEYS}
+
+        for size in (1, 7, 256, len(data)):
+            parser = SelectiveJSONParser(self.KEYS)
+            for chunk in _chunks(data, size):
+                parser.feed(chunk)
+            self.assertEqual(parser.close(), expected, f"chunk size {size}")
+
+    def test_multibyte_characters_split_across_chunks(self):
+        parser = SelectiveJSONParser(["name"])
+        for chunk in _chunks('{"name": "Flabébé", "skip": ["é"]}'.encode(), 1):
+            parser.feed(chunk)
+
+        self.assertEqual(parser.close(), {"name": "Flabébé"})
+
+    def test_rejects_invalid_documents(self):
+        for document in (b'{"id": 25', b'{"id": 2', b"[25]", b'{"id" 25}', b"{} {}"):
+            parser = SelectiveJSONParser(self.KEYS)
+            with self.assertRaises(ValueError, msg=document):
+                parser.feed(document)
+                parser.close()
+
+
+class _CutOffStream(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b'{"id": 25, "moves": ['
+        raise httpx.ReadError("connection reset")
+
+
+class TestServiceSelectiveParsing(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = PokeAPIService()
+        await self.service.client.aclose()
+        self.service.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self._route)
+        )
+        self.patcher = patch.object(settings, "SELECTIVE_JSON_PARSING", True)
+        self.patcher.start()
+
+    async def asyncTearDown(self):
+        self.patcher.stop()
+        await self.service.close()
+
+    def _route(self, request):
+        name = request.url.path.rsplit("/", 1)[-1]
+        if name == "pikachu":
+            return httpx.Response(200, json=POKEMON_DOCUMENT)
+        if name == "cut-off":
+            return httpx.Response(200, stream=_CutOffStream())
+        if name == "forbidden":
+            return httpx.Response(403)
+        return httpx.Response(404)
+
+    async def test_streams_and_trims_pokemon_document(self):
+        data = await self.service.get_pokemon_data("pikachu")
+
+        self.assertEqual(data, extract_pokemon_info(POKEMON_DOCUMENT))
+
+    async def test_not_found_is_negative_cached(self):
+        with self.assertRaises(PokemonNotFoundError) as raised:
+            await self.service.get_pokemon_data("missingno")
+
+        self.assertTrue(raised.exception.confirmed)
+        self.assertIn("missingno", self.service.negative_cache)
+
+    async def test_other_client_error_is_not_confirmed(self):
+        with self.assertRaises(PokemonNotFoundError) as raised:
+            await self.service.get_pokemon_data("forbidden")
+
+        self.assertFalse(raised.exception.confirmed)
+        self.assertNotIn("forbidden", self.service.negative_cache)
+
+    async def test_cut_off_body_is_unavailable_not_missing(self):
+        with self.assertRaises(PokeAPIUnavailableError):
+            await self.service.get_pokemon_data("cut-off")
+
+        self.assertNotIn("cut-off", self.service.negative_cache)
+
+
+# ------------------------------------
+# name_index.py tests
+# ------------------------------------
+
+
+class TestPokemonNameIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = PokemonNameIndex(
+            ["pikachu", "Pichu", "raichu", "bulbasaur", "pikachu-gmax", ""]
+        )
+
+    def test_levenshtein(self):
+        self.assertEqual(levenshtein("kitten", "sitting"), 3)
+        self.assertEqual(levenshtein("", "abc"), 3)
+        self.assertEqual(levenshtein("pikachu", "pikachu"), 0)
+        self.assertEqual(levenshtein("pikachu", "pikahcu"), 2)
+
+    def test_exact_match_is_case_insensitive(self):
+        self.assertIn("Pikachu", self.index)
+        self.assertIn("pichu", self.index)
+        self.assertNotIn("pikachuu", self.index)
+        self.assertEqual(len(self.index), 5)
+
+    def test_complete_prefix(self):
+        self.assertEqual(
+            self.index.complete("pi"), ["pichu", "pikachu", "pikachu-gmax"]
+        )
+        self.assertEqual(self.index.complete("pik", limit=1), ["pikachu"])
+        self.assertEqual(self.index.complete("zz"), [])
+
+    def test_suggest_closest_names(self):
+        self.assertEqual(self.index.suggest("pikachuu"), ["pikachu"])
+        self.assertEqual(self.index.suggest("bulbsaur"), ["bulbasaur"])
+        self.assertEqual(self.index.suggest("mewtwo"), [])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "names.txt")
+            self.index.save(path)
+            loaded = PokemonNameIndex.from_file(path)
+
+        self.assertEqual(loaded.names, self.index.names)
+
+
+class TestServiceNameIndex(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = PokeAPIService()
+        self.service.name_index = PokemonNameIndex(["pikachu", "bulbasaur"])
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_unknown_name_rejected_without_http(self, mock_get):
+        with self.assertRaises(PokemonNotFoundError) as ctx:
+            await self.service.get_pokemon_data("pikachuu")
+
+        self.assertEqual(ctx.exception.suggestions, ["pikachu"])
+        self.assertIn("Did you mean: pikachu?", str(ctx.exception))
+        mock_get.assert_not_called()
+
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_pokemon_exists_uses_index(self, mock_get):
+        self.assertTrue(await self.service.pokemon_exists("Pikachu"))
+        self.assertFalse(await self.service.pokemon_exists("mewthree"))
+        mock_get.assert_not_called()
+
+    async def test_load_name_index_from_api_and_save(self):
+        self.service.name_index = None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "names.txt")
+            with patch.object(settings, "POKEMON_NAME_INDEX_PATH", path), patch.object(
+                self.service, "list_resource_names", new_callable=AsyncMock
+            ) as mock_list:
+                mock_list.side_effect = lambda resource: {
+                    "pokemon": ["pikachu", "pikachu-gmax"],
+                    "pokemon-species": ["pikachu"],
+                }[resource]
+
+                name_index = await self.service.load_name_index()
+                self.assertIs(await self.service.load_name_index(), name_index)
+                self.assertEqual(mock_list.await_count, 2)
+
+                self.service.name_index = None
+                reloaded = await self.service.load_name_index()
+                self.assertEqual(mock_list.await_count, 2)
+
+        self.assertEqual(name_index.names, {"pikachu", "pikachu-gmax"})
+        self.assertEqual(reloaded.names, name_index.names)
+
+    async def test_load_name_index_from_snapshot(self):
+        self.service.name_index = None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "pokedex.snapshot")
+            write_snapshot(path, [PIKACHU_RECORD], [ELECTRIC_RECORD])
+            self.service.snapshot = PokedexSnapshot(path)
+
+            name_index = await self.service.load_name_index()
+
+        self.assertEqual(name_index.names, {"pikachu"})
+
+
+# ------------------------------------
+# shared_cache.py tests
+# ------------------------------------
+
+
+class TestSharedCacheBackend(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmp_dir.name, "cache.sock")
+        self.leader = SharedCacheBackend(self.socket_path, timeout=1.0)
+        self.follower = SharedCacheBackend(self.socket_path, timeout=1.0)
+
+    async def asyncTearDown(self):
+        await self.follower.close()
+        await self.leader.close()
+        self.tmp_dir.cleanup()
+
+    async def test_workers_share_records(self):
+        self.assertIsNone(await self.leader.get("pokemon", "pikachu"))
+        self.assertEqual(self.leader.stats()["role"], "leader")
+
+        await self.follower.set("pokemon", "pikachu", PIKACHU_RECORD)
+
+        self.assertEqual(self.follower.stats()["role"], "follower")
+        self.assertEqual(await self.leader.get("pokemon", "pikachu"), PIKACHU_RECORD)
+        self.assertEqual(await self.follower.get("pokemon", "pikachu"), PIKACHU_RECORD)
+        self.assertIsNone(await self.follower.get("type", "pikachu"))
+        self.assertEqual(self.follower.stats()["hits"], 1)
+        self.assertEqual(self.follower.stats()["misses"], 1)
+
+    async def test_max_age(self):
+        await self.leader.set("type", "electric", ELECTRIC_RECORD)
+
+        with patch("tools.shared_cache.time.time", return_value=time.time() + 60):
+            self.assertIsNone(await self.follower.get("type", "electric", max_age=30))
+            self.assertEqual(
+                await self.follower.get("type", "electric", max_age=120),
+                ELECTRIC_RECORD,
+            )
+
+    async def test_queued_requests_do_not_time_out(self):
+        follower = SharedCacheBackend(self.socket_path, timeout=0.05)
+        self.addAsyncCleanup(follower.close)
+        await self.leader.set("type", "electric", ELECTRIC_RECORD)
+
+        async with follower._io_lock:
+            lookups = [
+                asyncio.ensure_future(follower.get("type", "electric"))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.1)
+
+        self.assertEqual(await asyncio.gather(*lookups), [ELECTRIC_RECORD] * 5)
+        self.assertEqual(follower.stats()["errors"], 0)
+
+    def test_module_does_not_import_fcntl(self):
+        import tools.shared_cache
+
+        self.assertNotIn("fcntl", vars(tools.shared_cache))
+
+    async def test_follower_takes_over_when_leader_exits(self):
+        await self.leader.set("type", "electric", ELECTRIC_RECORD)
+        self.assertEqual(await self.follower.get("type", "electric"), ELECTRIC_RECORD)
+
+        await self.leader.close()
+        self.assertIsNone(await self.follower.get("type", "electric"))
+        self.assertEqual(self.follower.stats()["errors"], 1)
+
+        await self.follower.set("type", "electric", ELECTRIC_RECORD)
+        self.assertEqual(self.follower.stats()["role"], "leader")
+        self.assertEqual(await self.follower.get("type", "electric"), ELECTRIC_RECORD)
+
+    async def test_service_reads_shared_tier_before_fetching(self):
+        service = PokeAPIService(shared_cache=self.follower)
+        await self.leader.set("pokemon", "pikachu", PIKACHU_RECORD)
+
+        with patch.object(
+            service, "_fetch_type_data", new_callable=AsyncMock
+        ) as mock_fetch_type, patch.object(
+            service, "_fetch_pokemon_data", new_callable=AsyncMock
+        ) as mock_fetch_pokemon:
+            mock_fetch_type.return_value = ELECTRIC_RECORD
+            data = await service.get_pokemon_data("pikachu", get_type_data=True)
+
+        mock_fetch_pokemon.assert_not_awaited()
+        self.assertEqual(data["name"], "pikachu")
+        self.assertEqual(await self.leader.get("type", "electric"), ELECTRIC_RECORD)
+        self.assertIn("shared_cache", service.get_cache_stats())
+        await service.client.aclose()
+
+
+# ------------------------------------
+# peer_cache.py tests
+# ------------------------------------
+
+PEER_URLS = ["http://node-a:8000", "http://node-b:8000", "http://node-c:8000"]
+
+
+class TestHashRing(unittest.TestCase):
+    def test_keys_spread_and_move_minimally(self):
+        ring = HashRing(PEER_URLS)
+        keys = [f"pokemon:pokemon-{i}" for i in range(3000)]
+        owners = {key: ring.owner(key) for key in keys}
+
+        counts = {url: list(owners.values()).count(url) for url in PEER_URLS}
+        self.assertTrue(all(count > 600 for count in counts.values()), counts)
+
+        smaller = HashRing(PEER_URLS[:2])
+        for key, owner in owners.items():
+            if owner != PEER_URLS[2]:
+                self.assertEqual(smaller.owner(key), owner)
+
+
+class TestPeerCluster(unittest.IsolatedAsyncioTestCase):
+    """Three services talking to each other through the /_peer protocol."""
+
+    async def asyncSetUp(self):
+        self.nodes = {}
+        self.upstream_calls = []
+        self.peer_paths = []
+        self.down = set()
+
+        async def route(request):
+            node_url = f"{request.url.scheme}://{request.url.host}:{request.url.port}"
+            if node_url in self.down:
+                raise httpx.ConnectError("connection refused", request=request)
+            self.peer_paths.append(request.url.raw_path.decode())
+            _, namespace, key = request.url.path.rsplit("/", 2)
+            try:
+                record = await self.nodes[node_url].get_peer_record(namespace, key)
+            except PokemonNotFoundError as e:
+                if not e.confirmed:
+                    return httpx.Response(502, json={"detail": str(e)})
+                return httpx.Response(200, json={"not_found": str(e)})
+            return httpx.Response(200, json={"record": record})
+
+        for url in PEER_URLS:
+            peer_cache = PeerCache(
+                url,
+                PEER_URLS,
+                client=httpx.AsyncClient(transport=httpx.MockTransport(route)),
+            )
+            service = PokeAPIService(peer_cache=peer_cache)
+            service._download_pokemon_data = self._download(url)
+            self.nodes[url] = service
+
+    def _download(self, node_url):
+        async def download(pokemon_name):
+            self.upstream_calls.append((node_url, pokemon_name))
+            await asyncio.sleep(0.01)
+            if pokemon_name == "missingno":
+                raise PokemonNotFoundError(
+                    f"'{pokemon_name}' not found", confirmed=True
+                )
+            if pokemon_name == "glitch":
+                raise PokemonNotFoundError(f"'{pokemon_name}' could not be fetched")
+            return {**PIKACHU_RECORD, "name": pokemon_name}
+
+        return download
+
+    async def asyncTearDown(self):
+        for service in self.nodes.values():
+            await service.close()
+
+    async def test_owner_fetches_once_for_all_nodes(self):
+        results = await asyncio.gather(
+            *(
+                service.get_pokemon_data("pikachu")
+                for service in self.nodes.values()
+                for _ in range(3)
+            )
+        )
+
+        owner = self.nodes[PEER_URLS[0]].peer_cache.owner("pokemon", "pikachu")
+        self.assertEqual(self.upstream_calls, [(owner, "pikachu")])
+        self.assertTrue(all(result["name"] == "pikachu" for result in results))
+
+    async def test_not_found_is_reported_by_owner(self):
+        owner = self.nodes[PEER_URLS[0]].peer_cache.owner("pokemon", "missingno")
+        other = next(url for url in PEER_URLS if url != owner)
+
+        with self.assertRaises(PokemonNotFoundError):
+            await self.nodes[other].get_pokemon_data("missingno")
+        with self.assertRaises(PokemonNotFoundError):
+            await self.nodes[other].get_pokemon_data("missingno")
+
+        self.assertEqual(self.upstream_calls, [(owner, "missingno")])
+
+    async def test_falls_back_to_direct_fetch_when_owner_is_down(self):
+        owner = self.nodes[PEER_URLS[0]].peer_cache.owner("pokemon", "eevee")
+        other = next(url for url in PEER_URLS if url != owner)
+        self.down.add(owner)
+
+        data = await self.nodes[other].get_pokemon_data("eevee")
+        self.nodes[other].pokemon_cache.clear()
+        await self.nodes[other].get_pokemon_data("eevee")
+
+        self.assertEqual(data["name"], "eevee")
+        self.assertEqual(self.upstream_calls, [(other, "eevee"), (other, "eevee")])
+        stats = self.nodes[other].get_cache_stats()["peer_cache"]
+        self.assertEqual((stats["errors"], stats["bypassed"]), (1, 1))
+        self.assertEqual(stats["down"], [owner])
+
+    async def test_unconfirmed_not_found_falls_back_to_direct_fetch(self):
+        owner = self.nodes[PEER_URLS[0]].peer_cache.owner("pokemon", "glitch")
+        other = next(url for url in PEER_URLS if url != owner)
+
+        with self.assertRaises(PokemonNotFoundError) as raised:
+            await self.nodes[other].get_pokemon_data("glitch")
+
+        self.assertFalse(raised.exception.confirmed)
+        self.assertEqual(self.upstream_calls, [(owner, "glitch"), (other, "glitch")])
+        self.assertIsNone(self.nodes[other].negative_cache.get("glitch"))
+        self.assertIsNone(self.nodes[owner].negative_cache.get("glitch"))
+
+    async def test_client_errors_do_not_mark_owner_down(self):
+        async def not_found(request):
+            self.peer_paths.append(request.url.raw_path.decode())
+            return httpx.Response(404)
+
+        peer_cache = PeerCache(
+            PEER_URLS[0],
+            PEER_URLS,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(not_found)),
+        )
+        key = next(
+            f"mr. mime/{i}"
+            for i in range(100)
+            if not peer_cache.is_local("pokemon", f"mr. mime/{i}")
+        )
+
+        self.assertIsNone(await peer_cache.get("pokemon", key))
+        self.assertIsNone(await peer_cache.get("pokemon", key))
+
+        stats = peer_cache.stats()
+        self.assertEqual(
+            (stats["errors"], stats["bypassed"], stats["down"]), (2, 0, [])
+        )
+        self.assertTrue(
+            self.peer_paths[0].endswith(f"/_peer/pokemon/{quote(key, safe='')}")
+        )
+        await peer_cache.close()
+
+
+# ------------------------------------
+# rate_limit.py tests
+# ------------------------------------
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_then_sustained_rate(self):
+        bucket = TokenBucket(rate=50, burst=2)
+
+        started_at = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        burst_elapsed = time.monotonic() - started_at
+        await bucket.acquire()
+        await bucket.acquire()
+        total_elapsed = time.monotonic() - started_at
+
+        self.assertLess(burst_elapsed, 0.01)
+        self.assertGreaterEqual(total_elapsed, 0.035)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, burst=1)
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_caps_concurrency_and_records_queue_wait(self):
+        limiter = RateLimiter(max_concurrency=2)
+        running = []
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot():
+                running.append(1)
+                peak = max(peak, len(running))
+                await asyncio.sleep(0.01)
+                running.pop()
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        stats = limiter.stats()
+        self.assertEqual(peak, 2)
+        self.assertEqual(stats["requests"], 6)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["queued"], 0)
+        self.assertEqual(stats["limited"], 4)
+        self.assertGreaterEqual(stats["wait_max_ms"], 15)
+
+    async def test_cancelled_waiter_releases_its_slot(self):
+        limiter = RateLimiter(requests_per_second=1, burst=1, max_concurrency=1)
+        async with limiter.slot():
+            pass
+
+        waiter = asyncio.create_task(limiter.slot().__aenter__())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        self.assertEqual(limiter.queued, 0)
+        self.assertFalse(limiter._semaphore.locked())
+
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_service_requests_go_through_the_limiter(self, mock_get):
+        mock_get.return_value = httpx.Response(
+            200,
+            json={"name": "pikachu"},
+            request=httpx.Request("GET", "https://pokeapi.test"),
+        )
+        service = PokeAPIService()
+        try:
+            await service.get_pokemon_data("pikachu")
+            stats = service.get_metrics()["rate_limiter"]
+        finally:
+            await service.close()
+
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["max_concurrency"], settings.RATE_LIMIT_MAX_CONCURRENCY)
+
+    async def test_saturated_limiter_does_not_trip_the_breaker(self):
+        async def route(request):
+            await asyncio.sleep(0.01)
+            name = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"name": name})
+
+        service = PokeAPIService()
+        await service.client.aclose()
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(route))
+        service.rate_limiter = RateLimiter(requests_per_second=2, burst=1)
+        service.circuit_breaker = CircuitBreaker(min_calls=1, failure_rate=0.5)
+        try:
+            with patch.object(settings, "HTTP_RETRY_DEADLINE_SECONDS", 0.5):
+                results = await asyncio.gather(
+                    *(service.get_pokemon_data(f"pokemon-{i}") for i in range(8)),
+                    return_exceptions=True,
+                )
+        finally:
+            await service.close()
+
+        failures = [r for r in results if isinstance(r, Exception)]
+        self.assertTrue(failures)
+        self.assertTrue(all(isinstance(e, PokeAPIUnavailableError) for e in failures))
+        self.assertIn("rate limit queue", str(failures[0]))
+        self.assertEqual(service.circuit_breaker.state, CircuitState.CLOSED)
+        self.assertEqual(sum(service.circuit_breaker.transitions.values()), 0)
+
+
+# ------------------------------------
+# circuit_breaker.py tests
+# ------------------------------------
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            window_size=4,
+            min_calls=4,
+            failure_rate=0.5,
+            slow_call_seconds=1.0,
+            slow_call_rate=0.75,
+            open_seconds=10,
+            clock=self.clock,
+        )
+
+    def test_opens_on_failure_rate(self):
+        for _ in range(2):
+            self.breaker.record_success(0.1)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.retry_after(), 10)
+        self.assertEqual(self.breaker.stats()["rejected"], 1)
+
+    def test_opens_on_slow_call_rate(self):
+        self.breaker.record_success(0.1)
+        for _ in range(3):
+            self.breaker.record_success(2.0)
+
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+    def test_half_open_probe_closes_or_reopens(self):
+        for _ in range(4):
+            self.breaker.record_failure()
+
+        self.clock.now = 10
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+        self.clock.now = 20
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_success(0.1)
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+        self.assertEqual(
+            self.breaker.stats()["transitions"],
+            {
+                "closed->open": 1,
+                "open->half_open": 2,
+                "half_open->open": 1,
+                "half_open->closed": 1,
+            },
+        )
+
+    def test_cancelled_probe_is_released(self):
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now = 10
+
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.release()
+
+        self.assertTrue(self.breaker.allow_request())
+
+
+class TestServiceCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.clock = FakeClock()
+        self.service = PokeAPIService()
+        self.service.circuit_breaker = CircuitBreaker(
+            min_calls=1, failure_rate=1.0, open_seconds=30, clock=self.clock
+        )
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    @patch("tools.pokeapi.asyncio.sleep", new_callable=AsyncMock)
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_open_breaker_fails_fast(self, mock_get, mock_sleep):
+        mock_get.side_effect = httpx.ConnectError("connection refused")
+
+        with self.assertRaises(PokeAPIUnavailableError):
+            await self.service.get_pokemon_data("pikachu")
+        with self.assertRaises(PokeAPIUnavailableError) as ctx:
+            await self.service.get_type_data("electric")
+
+        mock_get.assert_awaited_once()
+        self.assertIn("circuit breaker is open", str(ctx.exception))
+        self.assertEqual(self.service.get_metrics()["circuit_breaker"]["state"], "open")
+
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_open_breaker_serves_expired_entries(self, mock_get):
+        self.service.type_cache = LRUCache(10, ttl=5, clock=self.clock)
+        self.service.type_cache.set("electric", ELECTRIC_RECORD)
+        self.service.circuit_breaker.record_failure()
+        self.clock.now = 6
+
+        data = await self.service.get_type_data("electric")
+
+        self.assertEqual(data, ELECTRIC_RECORD)
+        mock_get.assert_not_called()
+        self.assertEqual(
+            self.service.get_metrics()["circuit_breaker"]["degraded_responses"], 1
+        )
+
+    @patch("tools.pokeapi.httpx.AsyncClient.get")
+    async def test_open_breaker_falls_back_to_outdated_persistent_entry(self, mock_get):
+        self.service.persistent_cache = AsyncMock()
+        self.service.persistent_cache.get.side_effect = (
+            lambda namespace, key, max_age=None: (
+                PIKACHU_RECORD if max_age is None else None
+            )
+        )
+        self.service.circuit_breaker.record_failure()
+
+        with patch.object(settings, "PERSISTENT_CACHE_TTL_SECONDS", 60):
+            data = await self.service.get_pokemon_data("pikachu")
+
+        self.assertEqual(data["name"], "pikachu")
+        mock_get.assert_not_called()
+        self.assertNotIn("pikachu", self.service.pokemon_cache)
+
+
+# ------------------------------------
+# warmup.py tests
+# ------------------------------------
+
+
+class TestAccessLog(unittest.TestCase):
+    def test_top_and_round_trip(self):
+        access_log = AccessLog()
+        for name in ["pikachu", "eevee", "pikachu", "mew", "eevee", "pikachu"]:
+            access_log.record(name)
+
+        self.assertEqual(access_log.top(2), ["pikachu", "eevee"])
+        self.assertEqual(access_log.top(0), [])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "logs", "access.json")
+            access_log.save(path)
+            loaded = AccessLog.load(path)
+            missing = AccessLog.load(os.path.join(tmp_dir, "missing.json"))
+
+        self.assertEqual(loaded.counts, access_log.counts)
+        self.assertEqual(len(missing.counts), 0)
+
+    def test_hot_pokemon_names_deduplicates(self):
+        self.assertEqual(
+            hot_pokemon_names(["Pikachu", " mew "], ["pikachu", "eevee", ""]),
+            ["pikachu", "mew", "eevee"],
+        )
+
+
+class TestCacheWarmer(unittest.IsolatedAsyncioTestCase):
+    async def test_prefetches_types_and_hot_pokemon(self):
+        service = Mock()
+        service.get_type_data = AsyncMock()
+        service.get_pokemon_data = AsyncMock()
+        warmer = CacheWarmer(service, ["pikachu", "eevee"], concurrency=4)
+
+        self.assertFalse(warmer.ready)
+        await warmer.run()
+
+        self.assertTrue(warmer.ready)
+        self.assertEqual(service.get_type_data.await_count, 18)
+        service.get_pokemon_data.assert_any_await("pikachu", record_access=False)
+        service.get_pokemon_data.assert_any_await("eevee", record_access=False)
+        self.assertEqual(warmer.stats()["warmed"], 20)
+
+    async def test_failures_are_counted_and_concurrency_is_bounded(self):
+        active = 0
+        max_active = 0
+
+        async def lookup(name, **kwargs):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0)
+            active -= 1
+            if name == "missingno":
+                raise PokemonNotFoundError("not found")
+
+        service = Mock()
+        service.get_type_data = AsyncMock(side_effect=lookup)
+        service.get_pokemon_data = AsyncMock(side_effect=lookup)
+        warmer = CacheWarmer(service, ["pikachu", "missingno"], concurrency=3)
+
+        await warmer.run()
+
+        self.assertTrue(warmer.ready)
+        self.assertEqual(warmer.failed, 1)
+        self.assertEqual(warmer.warmed, 19)
+        self.assertEqual(max_active, 3)
+
+    async def test_service_records_accesses(self):
+        service = PokeAPIService()
+        with patch.object(
+            service, "_fetch_pokemon_data", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = PIKACHU_RECORD
+            await service.get_pokemon_data("Pikachu")
+            await service.get_pokemon_data("pikachu")
+
+        self.assertEqual(service.access_log.top(1), ["pikachu"])
+        self.assertEqual(service.access_log.counts["pikachu"], 2)
+        await service.close()
+
+    async def test_warm_up_does_not_record_accesses(self):
+        service = PokeAPIService()
+        with patch.object(
+            service, "_fetch_pokemon_data", new_callable=AsyncMock
+        ) as mock_fetch, patch.object(
+            service, "_fetch_type_data", new_callable=AsyncMock
+        ) as mock_fetch_type:
+            mock_fetch.return_value = PIKACHU_RECORD
+            mock_fetch_type.return_value = ELECTRIC_RECORD
+            await CacheWarmer(service, ["pikachu"]).run()
+
+        self.assertIn("pikachu", service.pokemon_cache)
+        self.assertEqual(service.access_log.top(1), [])
+        await service.close()
+
+
 # ------------------------------------
 # pokeapi.py tests
 # ------------------------------------
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from tools.pokeapi import PokeAPIService, extract_pokemon_info, extract_type_info
+from tools.snapshot import write_snapshot
+
+DEFAULT_OUTPUT = "data/pokedex.snapshot"
+
+
+async def crawl_pokeapi(
+    concurrency: int = 8,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Download every Pokémon and type from the PokéAPI.
+
+    Args:
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        Trimmed Pokémon records and trimmed type records
+    """
+    service = PokeAPIService()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download(fetch, name: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch(name)
+
+    try:
+        pokemon_names = await service.list_resource_names("pokemon")
+        type_names = await service.list_resource_names("type")
+
+        pokemon_records = await asyncio.gather(
+            *(download(service._download_pokemon_data, n) for n in pokemon_names)
+        )
+        type_records = await asyncio.gather(
+            *(download(service._download_type_data, n) for n in type_names)
+        )
+    finally:
+        await service.close()
+
+    return list(pokemon_records), list(type_records)
+
+
+def load_dump(
+    dump_dir: str,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Load Pokémon and types from a local PokéAPI dump.
+
+    The dump uses the layout of the PokeAPI ``api-data`` repository, i.e.
+    ``<dump_dir>/pokemon/<id>/index.json`` and ``<dump_dir>/type/<id>/index.json``.
+
+    Args:
+        dump_dir: Directory containing the ``pokemon`` and ``type`` folders
+
+    Returns:
+        Trimmed Pokémon records and trimmed type records
+    """
+    root = Path(dump_dir)
+
+    def read(resource: str) -> List[Dict[str, Any]]:
+        documents = []
+        for path in sorted(root.glob(f"{resource}/*/index.json")):
+            with open(path, encoding="utf-8") as f:
+                documents.append(json.load(f))
+        return documents
+
+    pokemon_records = [extract_pokemon_info(doc) for doc in read("pokemon")]
+    type_records = [extract_type_info(doc) for doc in read("type")]
+    return pokemon_records, type_records
+
+
+def main() -> None:
+    """Build an offline Pokédex snapshot from the PokéAPI or a local dump."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Snapshot path")
+    parser.add_argument(
+        "--from-dump",
+        help="Import a local PokéAPI dump directory instead of crawling the API",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Parallel requests when crawling"
+    )
+    args = parser.parse_args()
+
+    if args.from_dump:
+        pokemon_records, type_records = load_dump(args.from_dump)
+    else:
+        pokemon_records, type_records = asyncio.run(crawl_pokeapi(args.concurrency))
+
+    write_snapshot(args.output, pokemon_records, type_records)
+    print(
+        f"Wrote {len(pokemon_records)} Pokémon and {len(type_records)} types "
+        f"to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class CacheEntry:
+    """A single cached value together with its expiry deadline."""
+
+    __slots__ = ("value", "expires_at")
+
+    def __init__(self, value: Any, expires_at: Optional[float]):
+        self.value = value
+        self.expires_at = expires_at
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with optional per-entry TTL.
+
+    All operations are O(1): entries live in an ``OrderedDict`` that is
+    reordered on every hit, so the least recently used entry is always the
+    first one and can be evicted without scanning.
+
+    With ``max_stale`` set, expired entries are kept for that many extra
+    seconds so ``get_stale`` can still serve them (flagged as stale) while
+    the caller refreshes them in the background.
+
+    Args:
+        maxsize: Maximum number of entries kept in the cache
+        ttl: Default time-to-live in seconds (None means entries never expire)
+        max_stale: Seconds an expired entry stays servable via ``get_stale``
+        clock: Monotonic time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        max_stale: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._is_expired(entry)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= self._clock()
+
+    def _is_past_max_stale(self, entry: CacheEntry) -> bool:
+        return (
+            self.max_stale is None or entry.expires_at + self.max_stale <= self._clock()
+        )
+
+    def _lookup(self, key: Hashable) -> Tuple[Optional[CacheEntry], bool]:
+        """Return the entry for ``key`` (None when absent or too old) and whether it is stale."""
+        entry = self._entries.get(key)
+        if entry is None or not self._is_expired(entry):
+            return entry, False
+
+        if self._is_past_max_stale(entry):
+            del self._entries[key]
+            self.expirations += 1
+            return None, False
+        return entry, True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` and mark it as most recently used."""
+        entry, stale = self._lookup(key)
+        if entry is None or stale:
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Tuple[Any, bool]:
+        """
+        Return ``(value, stale)`` for ``key``, serving expired entries within ``max_stale``.
+
+        ``stale`` is True when the value has expired but is still inside the
+        ``max_stale`` window; entries past that window are dropped.
+        """
+        entry, stale = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return default, False
+
+        self._entries.move_to_end(key)
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return entry.value, stale
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` even if it has expired, without updating order or counters."""
+        entry = self._entries.get(key)
+        return default if entry is None else entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        self._entries[key] = CacheEntry(value, expires_at)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key`` from the cache and return its value."""
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry.value
+
+    def clear(self) -> None:
+        """Remove every entry from the cache (statistics are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and the current fill level."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
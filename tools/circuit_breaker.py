@@ -0,0 +1,164 @@
+import time
+from collections import Counter, deque
+from enum import StrEnum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from core.logging import get_logger
+
+logger = get_logger("tools.circuit_breaker")
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker tripping on the failure and slow-call rates of recent calls.
+
+    The outcomes of the last ``window_size`` calls are kept in a ring
+    buffer. Once at least ``min_calls`` are recorded and either the share of
+    failures or the share of calls slower than ``slow_call_seconds`` reaches
+    its threshold, the breaker opens and rejects calls for ``open_seconds``.
+    It then lets ``half_open_probes`` calls through: if they all succeed
+    quickly the breaker closes again, otherwise it re-opens.
+
+    Args:
+        window_size: Number of recent calls the rates are computed over
+        min_calls: Calls required in the window before the breaker can trip
+        failure_rate: Failure share that opens the breaker
+        slow_call_seconds: Duration above which a call counts as slow
+        slow_call_rate: Slow-call share that opens the breaker
+        open_seconds: How long the breaker stays open before probing
+        half_open_probes: Successful probes needed to close the breaker
+        clock: Monotonic time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        slow_call_rate: float = 0.5,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+
+        # (failed, slow) outcome of each recent call
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probes_succeeded = 0
+
+        self.rejected = 0
+        self.transitions: Counter = Counter()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open breaker turns half-open once ``open_seconds`` have passed."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        self.transitions[f"{self._state}->{state}"] += 1
+        logger.warning(f"Circuit breaker {self._state} -> {state}")
+
+        self._state = state
+        self._probes_in_flight = 0
+        self._probes_succeeded = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif state == CircuitState.CLOSED:
+            self._window.clear()
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go ahead, reserving a probe slot when half-open."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if (
+            state == CircuitState.HALF_OPEN
+            and self._probes_in_flight < self.half_open_probes
+        ):
+            self._probes_in_flight += 1
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self, duration: float) -> None:
+        """Record a call that got an answer after ``duration`` seconds."""
+        self._record(failed=False, slow=duration >= self.slow_call_seconds)
+
+    def record_failure(self) -> None:
+        """Record a call that failed (transport error, timeout, 5xx, ...)."""
+        self._record(failed=True, slow=False)
+
+    def release(self) -> None:
+        """Give back a probe slot of a call that was cancelled before it finished."""
+        if self._state == CircuitState.HALF_OPEN and self._probes_in_flight:
+            self._probes_in_flight -= 1
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            if failed or slow:
+                self._transition(CircuitState.OPEN)
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self.half_open_probes:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self._state == CircuitState.OPEN:
+            return
+
+        self._window.append((failed, slow))
+        if len(self._window) < self.min_calls:
+            return
+
+        failure_rate, slow_call_rate = self._rates()
+        if failure_rate >= self.failure_rate or slow_call_rate >= self.slow_call_rate:
+            self._transition(CircuitState.OPEN)
+
+    def _rates(self) -> Tuple[float, float]:
+        if not self._window:
+            return 0.0, 0.0
+        failures = sum(failed for failed, _ in self._window)
+        slow_calls = sum(slow for _, slow in self._window)
+        return failures / len(self._window), slow_calls / len(self._window)
+
+    def retry_after(self) -> Optional[float]:
+        """Seconds until an open breaker starts probing, or None when it is not open."""
+        if self.state != CircuitState.OPEN:
+            return None
+        return max(0.0, self._opened_at + self.open_seconds - self._clock())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the breaker state, recent failure/slow-call rates and transition counts."""
+        failure_rate, slow_call_rate = self._rates()
+        return {
+            "state": str(self.state),
+            "calls_in_window": len(self._window),
+            "failure_rate": failure_rate,
+            "slow_call_rate": slow_call_rate,
+            "rejected": self.rejected,
+            "transitions": dict(self.transitions),
+        }
@@ -0,0 +1,166 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    Return the edit distance between two strings.
+
+    Uses Myers' bit-parallel algorithm: each column of the dynamic
+    programming table is encoded as the vertical deltas packed into two
+    integers, so one pass over ``a`` with a handful of bit operations per
+    character replaces the quadratic table.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    match_masks: Dict[str, int] = {}
+    for i, char in enumerate(b):
+        match_masks[char] = match_masks.get(char, 0) | (1 << i)
+
+    mask = (1 << len(b)) - 1
+    last_bit = 1 << (len(b) - 1)
+    positive, negative, distance = mask, 0, len(b)
+    for char in a:
+        matches = match_masks.get(char, 0)
+        vertical = matches | negative
+        horizontal = (((matches & positive) + positive) ^ positive) | matches
+        h_positive = negative | ~(horizontal | positive)
+        h_negative = positive & horizontal
+        if h_positive & last_bit:
+            distance += 1
+        elif h_negative & last_bit:
+            distance -= 1
+        h_positive = (h_positive << 1) | 1
+        h_negative <<= 1
+        positive = (h_negative | ~(vertical | h_positive)) & mask
+        negative = h_positive & vertical & mask
+    return distance
+
+
+class _TrieNode:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.terminal = False
+
+
+class PrefixTrie:
+    """Character trie answering prefix completion queries."""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root = _TrieNode()
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        node = self._root
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+        node.terminal = True
+
+    def starts_with(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to ``limit`` words starting with ``prefix`` in alphabetical order."""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        matches: List[str] = []
+        stack: List[Tuple[str, _TrieNode]] = [(prefix, node)]
+        while stack and len(matches) < limit:
+            word, node = stack.pop()
+            if node.terminal:
+                matches.append(word)
+            for char in sorted(node.children, reverse=True):
+                stack.append((word + char, node.children[char]))
+        return matches
+
+
+class BKTree:
+    """Burkhard-Keller tree for nearest-neighbour search under edit distance."""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            return
+
+        node_word, children = self._root
+        while True:
+            distance = levenshtein(word, node_word)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (word, {})
+                return
+            node_word, children = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Return ``(distance, word)`` pairs within ``max_distance``, closest first."""
+        if self._root is None:
+            return []
+
+        results = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= max_distance:
+                results.append((distance, node_word))
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return sorted(results)
+
+
+class PokemonNameIndex:
+    """
+    In-process index of every known Pokémon species and form name.
+
+    Exact-match checks are O(1) set lookups, prefix completion uses a trie
+    and spelling suggestions come from a BK-tree, so unknown names can be
+    rejected (with suggestions) without any HTTP or LLM call.
+
+    Args:
+        names: Pokémon names; they are lower-cased and de-duplicated
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = frozenset(name.strip().lower() for name in names if name.strip())
+        ordered = sorted(self.names)
+        self._trie = PrefixTrie(ordered)
+        self._bk_tree = BKTree(ordered)
+
+    @classmethod
+    def from_file(cls, path: str) -> "PokemonNameIndex":
+        """Load an index from a text file containing one name per line."""
+        return cls(Path(path).read_text(encoding="utf-8").splitlines())
+
+    def save(self, path: str) -> None:
+        """Write the indexed names to a text file, one per line."""
+        Path(path).write_text("\n".join(sorted(self.names)) + "\n", encoding="utf-8")
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self.names
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return names starting with ``prefix``."""
+        return self._trie.starts_with(prefix.lower(), limit)
+
+    def suggest(self, name: str, max_distance: int = 2, limit: int = 3) -> List[str]:
+        """Return the closest known names to a (misspelled) name."""
+        matches = self._bk_tree.search(name.lower(), max_distance)
+        return [match for _, match in matches[:limit]]
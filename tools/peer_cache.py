@@ -0,0 +1,178 @@
+import bisect
+import hashlib
+import time
+from urllib.parse import quote
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from core.logging import get_logger
+
+logger = get_logger("tools.peer_cache")
+
+PEER_PATH = "/_peer"
+
+
+class PeerNotFoundError(LookupError):
+    """Raised when the owning peer reports that a record does not exist upstream."""
+
+
+def _hash(value: str) -> int:
+    digest = hashlib.md5(value.encode(), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring mapping keys to nodes.
+
+    Every node is placed on the ring ``replicas`` times (virtual nodes) so
+    keys spread evenly, and adding or removing a node only moves the keys
+    it owned.
+
+    Args:
+        nodes: Node identifiers (peer base URLs)
+        replicas: Virtual nodes per node
+    """
+
+    def __init__(self, nodes: Iterable[str], replicas: int = 100):
+        self.nodes = sorted(set(nodes))
+        points: List[Tuple[int, str]] = sorted(
+            (_hash(f"{node}#{i}"), node) for node in self.nodes for i in range(replicas)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+
+    def owner(self, key: str) -> str:
+        """Return the node owning ``key``."""
+        if not self._hashes:
+            raise ValueError("the hash ring has no nodes")
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[index]
+
+
+class PeerCache:
+    """
+    Groupcache-style peer layer: each key is fetched upstream by one node only.
+
+    Keys are assigned to nodes with a ``HashRing`` that includes this node.
+    For keys owned by another node, ``get`` asks the owner's
+    ``/_peer/{namespace}/{key}`` endpoint; the owner answers from its caches
+    or fetches (single-flighted) from PokéAPI, replying
+    ``{"record": ...}`` or ``{"not_found": message}``. A peer that fails is skipped
+    for ``failure_cooldown`` seconds, during which callers fetch directly.
+
+    Args:
+        self_url: Base URL under which the other peers reach this node
+        peer_urls: Base URLs of all peers (this node may be included)
+        timeout: Timeout of peer requests in seconds
+        failure_cooldown: Seconds a failed peer is bypassed
+        replicas: Virtual nodes per peer on the hash ring
+        client: HTTP client for peer requests (created when omitted)
+    """
+
+    def __init__(
+        self,
+        self_url: str,
+        peer_urls: Iterable[str],
+        timeout: float = 2.0,
+        failure_cooldown: float = 10.0,
+        replicas: int = 100,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.self_url = self_url.rstrip("/")
+        self.ring = HashRing(
+            {self.self_url, *(url.rstrip("/") for url in peer_urls)}, replicas
+        )
+        self.failure_cooldown = failure_cooldown
+        self.client = client or httpx.AsyncClient(timeout=timeout)
+        self._down_until: Dict[str, float] = {}
+
+        self.requests = 0
+        self.hits = 0
+        self.not_found = 0
+        self.errors = 0
+        self.bypassed = 0
+
+    def owner(self, namespace: str, key: str) -> str:
+        """Return the base URL of the peer owning a record."""
+        return self.ring.owner(f"{namespace}:{key}")
+
+    def is_local(self, namespace: str, key: str) -> bool:
+        """Return whether this node owns a record."""
+        return self.owner(namespace, key) == self.self_url
+
+    async def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Ask the owning peer for a record.
+
+        Returns:
+            The record, or None when this node owns the key or the owner is
+            unavailable (the caller then fetches directly)
+
+        Raises:
+            PeerNotFoundError: When the owner reports that the record does not exist
+        """
+        owner = self.owner(namespace, key)
+        if owner == self.self_url:
+            return None
+        if self._down_until.get(owner, 0.0) > time.monotonic():
+            self.bypassed += 1
+            return None
+
+        self.requests += 1
+        try:
+            response = await self.client.get(
+                f"{owner}{PEER_PATH}/{namespace}/{quote(key, safe='')}"
+            )
+        except httpx.HTTPError as e:
+            return self._mark_down(owner, e)
+
+        if response.is_server_error:
+            return self._mark_down(owner, f"HTTP {response.status_code}")
+        if response.status_code != httpx.codes.OK:
+            return self._fail(owner, f"HTTP {response.status_code}")
+        try:
+            body = response.json()
+        except ValueError as e:
+            return self._fail(owner, e)
+
+        if "not_found" in body:
+            self.not_found += 1
+            raise PeerNotFoundError(body["not_found"])
+        if not isinstance(body.get("record"), dict):
+            return self._fail(owner, "malformed response")
+        self.hits += 1
+        return body["record"]
+
+    def _fail(self, owner: str, error: Any) -> None:
+        """Count a failed request whose owner is still reachable."""
+        self.errors += 1
+        logger.warning(f"Peer {owner} failed ({error}); fetching directly")
+
+    def _mark_down(self, owner: str, error: Any) -> None:
+        """Count a failed request and skip the owner for ``failure_cooldown`` seconds."""
+        self.errors += 1
+        self._down_until[owner] = time.monotonic() + self.failure_cooldown
+        logger.warning(
+            f"Peer {owner} failed ({error}); fetching directly for "
+            f"{self.failure_cooldown}s"
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "self": self.self_url,
+            "peers": self.ring.nodes,
+            "down": sorted(
+                peer for peer, until in self._down_until.items() if until > now
+            ),
+            "requests": self.requests,
+            "hits": self.hits,
+            "not_found": self.not_found,
+            "errors": self.errors,
+            "bypassed": self.bypassed,
+        }
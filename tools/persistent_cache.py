@@ -0,0 +1,138 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.logging import get_logger
+
+logger = get_logger("tools.persistent_cache")
+
+
+class CacheBackend(ABC):
+    """Base class for persistent cache tiers sitting behind the in-memory caches."""
+
+    @abstractmethod
+    async def get(
+        self, namespace: str, key: str, max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored record, or None if it is missing or older than ``max_age``."""
+        pass
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        """Store a record together with the current fetch timestamp."""
+        pass
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Return backend statistics."""
+        return {}
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Persistent cache backend storing JSON records in a SQLite database.
+
+    The database lives in ``directory`` and uses WAL journaling so that
+    several processes on the same host can share it. Blocking SQLite calls
+    run in a worker thread to keep the event loop responsive; storage
+    errors are logged and treated as cache misses.
+
+    Args:
+        directory: Directory holding the database file (created if missing)
+        filename: Name of the database file
+    """
+
+    def __init__(self, directory: str, filename: str = "pokeapi_cache.sqlite3"):
+        self.path = Path(directory) / filename
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        self._connection.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _get(
+        self, namespace: str, key: str, max_age: Optional[float]
+    ) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, fetched_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        value, fetched_at = row
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        return json.loads(value)
+
+    def _set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, fetched_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, time.time()),
+            )
+            self._connection.commit()
+
+    async def get(
+        self, namespace: str, key: str, max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            value = await asyncio.to_thread(self._get, namespace, key, max_age)
+        except (sqlite3.Error, ValueError) as e:
+            self.errors += 1
+            logger.warning(f"Persistent cache read failed for {namespace}/{key}: {e}")
+            return None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        try:
+            await asyncio.to_thread(self._set, namespace, key, value)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.errors += 1
+            logger.warning(f"Persistent cache write failed for {namespace}/{key}: {e}")
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
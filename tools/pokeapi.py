@@ -1,7 +1,63 @@
-from typing import Dict, Any
+import asyncio
+import math
+import random
+import time
+from contextlib import AsyncExitStack
+from email.utils import parsedate_to_datetime
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Any,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 import httpx
 from core.config import settings, PokemonNotFoundStatus
-from core.exceptions import PokemonNotFoundError
+from core.exceptions import (
+    PokemonNotFoundError,
+    PokeAPIUnavailableError,
+    TypeNotFoundError,
+)
+from core.logging import get_logger
+from tools.cache import LRUCache
+from tools.circuit_breaker import CircuitBreaker, CircuitState
+from tools.name_index import PokemonNameIndex
+from tools.peer_cache import PeerCache, PeerNotFoundError
+from tools.persistent_cache import CacheBackend, SQLiteCacheBackend
+from tools.rate_limit import RateLimiter
+from tools.records import PokemonRecord
+from tools.selective_json import parse_selected
+from tools.shared_cache import SharedCacheBackend
+from tools.snapshot import PokedexSnapshot
+from tools.transport import ConnectionPoolMetrics, InstrumentedTransport
+from tools.type_matrix import TYPE_NAMES, TypeEffectivenessMatrix
+from tools.warmup import AccessLog
+from tools.singleflight import SingleFlight
+
+logger = get_logger("tools.pokeapi")
+
+
+class Validators(NamedTuple):
+    """The ETag/Last-Modified of the PokéAPI response a cached record was trimmed from."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the headers asking PokéAPI to answer 304 if the record is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
 
 
 class PokeAPIService:
@@ -9,20 +65,159 @@ class PokeAPIService:
 
     BASE_URL = settings.POKEAPI_BASE_URL
 
-    def __init__(self, cache_size: int = settings.CACHE_SIZE):
-        """Initialize the service with an optional cache size."""
-        self.client = httpx.AsyncClient(timeout=settings.HTTP_TIMEOUT_SECONDS)
-
-        self.pokemon_cache = {}
-        self.type_cache = {}
+    def __init__(
+        self,
+        cache_size: int = settings.CACHE_SIZE,
+        cache_ttl: Optional[float] = settings.CACHE_TTL_SECONDS,
+        max_concurrent_fetches: int = settings.MAX_CONCURRENT_FETCHES,
+        stale_while_revalidate: bool = settings.CACHE_STALE_WHILE_REVALIDATE,
+        max_stale: float = settings.CACHE_MAX_STALE_SECONDS,
+        shared_cache: Optional[CacheBackend] = None,
+        persistent_cache: Optional[CacheBackend] = None,
+        snapshot: Optional[PokedexSnapshot] = None,
+        peer_cache: Optional[PeerCache] = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            cache_size: Maximum number of entries in each in-memory cache
+            cache_ttl: Time-to-live of in-memory cache entries in seconds
+            max_concurrent_fetches: Concurrency bound for batch lookups
+            stale_while_revalidate: Serve expired in-memory entries immediately
+                and refresh them in the background
+            max_stale: Seconds past expiry after which a stale entry is no
+                longer served and the request waits for a fresh one
+            shared_cache: Tier shared by all worker processes on the host,
+                between the in-memory caches and the persistent tier
+                (defaults to a Unix socket cache when SHARED_CACHE_ENABLED is set)
+            persistent_cache: Persistent tier behind the in-memory caches
+                (defaults to SQLite when PERSISTENT_CACHE_ENABLED is set)
+            snapshot: Offline Pokédex snapshot answering every lookup without
+                HTTP (defaults to POKEDEX_SNAPSHOT_PATH when it is set)
+            peer_cache: Peer layer asking the node that owns a record instead
+                of PokéAPI (defaults to PEER_SELF_URL/PEER_URLS when both are set)
+        """
+        self.pool_metrics = ConnectionPoolMetrics()
+        self.client = create_http_client(self.pool_metrics)
+        self.circuit_breaker = create_circuit_breaker()
+        self.rate_limiter = create_rate_limiter()
+        self.degraded_responses = 0
+
+        self.stale_while_revalidate = stale_while_revalidate
+        if not stale_while_revalidate:
+            # Expired entries are never served, but kept until evicted so a
+            # conditional request can revalidate them.
+            max_stale = math.inf if settings.CONDITIONAL_REQUESTS_ENABLED else None
+        self.pokemon_cache = LRUCache(cache_size, ttl=cache_ttl, max_stale=max_stale)
+        self.type_cache = LRUCache(cache_size, ttl=cache_ttl, max_stale=max_stale)
         self.cache_size = cache_size
+        self.negative_cache = LRUCache(
+            settings.NEGATIVE_CACHE_SIZE, ttl=settings.NEGATIVE_CACHE_TTL_SECONDS
+        )
+        self.validators = LRUCache(cache_size)
+        self.conditional_requests = 0
+        self.not_modified = 0
+        self.in_flight = SingleFlight()
+        self.revalidations: Dict[Hashable, asyncio.Task] = {}
+        self.revalidation_failures = 0
+        self.max_concurrent_fetches = max_concurrent_fetches
+
+        if shared_cache is None and settings.SHARED_CACHE_ENABLED:
+            shared_cache = SharedCacheBackend(
+                settings.SHARED_CACHE_SOCKET_PATH,
+                maxsize=settings.SHARED_CACHE_SIZE,
+                timeout=settings.SHARED_CACHE_TIMEOUT_SECONDS,
+            )
+        self.shared_cache = shared_cache
+
+        if persistent_cache is None and settings.PERSISTENT_CACHE_ENABLED:
+            persistent_cache = SQLiteCacheBackend(settings.PERSISTENT_CACHE_DIR)
+        self.persistent_cache = persistent_cache
+
+        if snapshot is None and settings.POKEDEX_SNAPSHOT_PATH:
+            snapshot = PokedexSnapshot(settings.POKEDEX_SNAPSHOT_PATH)
+        self.snapshot = snapshot
+
+        if peer_cache is None and settings.PEER_SELF_URL and settings.PEER_URLS:
+            peer_cache = PeerCache(
+                settings.PEER_SELF_URL,
+                settings.PEER_URLS,
+                timeout=settings.PEER_TIMEOUT_SECONDS,
+                failure_cooldown=settings.PEER_FAILURE_COOLDOWN_SECONDS,
+            )
+        self.peer_cache = peer_cache
+        self.type_matrix: Optional[TypeEffectivenessMatrix] = None
+        self.name_index: Optional[PokemonNameIndex] = None
+
+        if settings.WARMUP_ACCESS_LOG_PATH:
+            self.access_log = AccessLog.load(settings.WARMUP_ACCESS_LOG_PATH)
+        else:
+            self.access_log = AccessLog()
 
     async def close(self):
-        """Close the HTTP client when the service is done."""
+        """Close the HTTP client and cache tiers when the service is done."""
+        for task in list(self.revalidations.values()):
+            task.cancel()
         await self.client.aclose()
+        if settings.WARMUP_ACCESS_LOG_PATH:
+            try:
+                await asyncio.to_thread(
+                    self.access_log.save, settings.WARMUP_ACCESS_LOG_PATH
+                )
+            except OSError as e:
+                logger.warning(f"Could not save the access log: {e}")
+        if self.shared_cache is not None:
+            await self.shared_cache.close()
+        if self.persistent_cache is not None:
+            await self.persistent_cache.close()
+        if self.peer_cache is not None:
+            await self.peer_cache.close()
+        if self.snapshot is not None:
+            self.snapshot.close()
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return statistics for the Pokémon/type caches and in-flight fetches."""
+        stats = {
+            "pokemon_cache": self.pokemon_cache.stats(),
+            "type_cache": self.type_cache.stats(),
+            "negative_cache": self.negative_cache.stats(),
+            "in_flight": self.in_flight.stats(),
+            "revalidation": {
+                "in_flight": len(self.revalidations),
+                "failures": self.revalidation_failures,
+            },
+            "conditional_requests": {
+                "validators": len(self.validators),
+                "sent": self.conditional_requests,
+                "not_modified": self.not_modified,
+            },
+        }
+        if self.shared_cache is not None:
+            stats["shared_cache"] = self.shared_cache.stats()
+        if self.persistent_cache is not None:
+            stats["persistent_cache"] = self.persistent_cache.stats()
+        if self.peer_cache is not None:
+            stats["peer_cache"] = self.peer_cache.stats()
+        return stats
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return cache statistics together with HTTP connection pool metrics."""
+        return {
+            **self.get_cache_stats(),
+            "http_pool": self.pool_metrics.stats(),
+            "rate_limiter": self.rate_limiter.stats(),
+            "circuit_breaker": {
+                **self.circuit_breaker.stats(),
+                "degraded_responses": self.degraded_responses,
+            },
+        }
 
     async def pokemon_exists(self, pokemon_name: str) -> bool:
-        """Check if a Pokémon exists in the PokéAPI."""
+        """Check if a Pokémon exists, using the name index when it is loaded."""
+        if self.name_index is not None and not pokemon_name.isdigit():
+            return pokemon_name in self.name_index
+
         try:
             await self.get_pokemon_data(pokemon_name.lower(), False)
             return True
@@ -30,97 +225,726 @@ class PokeAPIService:
             return False
 
     async def get_pokemon_data(
-        self, pokemon_name: str, get_type_data: bool = False
+        self,
+        pokemon_name: str,
+        get_type_data: bool = False,
+        record_access: bool = True,
     ) -> Dict[str, Any]:
-        """Fetch Pokémon data from the PokéAPI with caching."""
+        """
+        Fetch Pokémon data from the PokéAPI with caching.
+
+        Only a compact base record is cached per Pokémon; when ``get_type_data``
+        is set, the damage relations are attached from the (separately cached)
+        type records, so both flavours share one cache entry. Lookups are
+        counted in the access log unless ``record_access`` is False (cache
+        warm-up), so the hot list reflects real traffic.
+        """
         pokemon_name = pokemon_name.lower()
-        cache_key = f"{pokemon_name}_{get_type_data}"
 
-        if cache_key in self.pokemon_cache:
-            return self.pokemon_cache[cache_key]
+        load = partial(self._load_pokemon_data, pokemon_name)
+        record, stale = self._get_cached(self.pokemon_cache, pokemon_name)
+        if stale:
+            self._revalidate(("pokemon", pokemon_name), load)
+        elif record is None:
+            self._check_name(pokemon_name)
 
-        data = await self._fetch_pokemon_data(pokemon_name, get_type_data)
+            not_found_message = self.negative_cache.get(pokemon_name)
+            if not_found_message is not None:
+                raise PokemonNotFoundError(not_found_message, confirmed=True)
 
-        if len(self.pokemon_cache) >= self.cache_size:
-            self.pokemon_cache.pop(next(iter(self.pokemon_cache)))
+            record = await self.in_flight.do(("pokemon", pokemon_name), load)
 
-        self.pokemon_cache[cache_key] = data
+        if record_access:
+            self.access_log.record(record.name or pokemon_name)
+        data = record.to_dict()
+        if get_type_data:
+            data["type_details"] = await self._get_type_details(data["types"])
         return data
 
-    async def _fetch_pokemon_data(
-        self, pokemon_name: str, get_type_data: bool = False
-    ) -> Dict[str, Any]:
-        """Fetch Pokémon data from the PokéAPI (internal implementation)."""
+    async def _get_type_details(
+        self, type_names: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the damage relations of each of the given types."""
+        types_data = await asyncio.gather(
+            *(self.get_type_data(type_name) for type_name in type_names)
+        )
+
+        type_details = {}
+        for type_name, type_data in zip(type_names, types_data):
+            if isinstance(type_data, dict) and "damage_relations" in type_data:
+                type_details[type_name] = type_data["damage_relations"]
+        return type_details
+
+    def _check_name(self, pokemon_name: str) -> None:
+        """Raise PokemonNotFoundError, with suggestions, for names missing from the name index."""
+        if (
+            self.name_index is None
+            or pokemon_name.isdigit()
+            or pokemon_name in self.name_index
+        ):
+            return
+
+        suggestions = self.name_index.suggest(pokemon_name)
+        message = f"SERVICE ERROR: Pokémon '{pokemon_name}' not found."
+        if suggestions:
+            message += f" Did you mean: {', '.join(suggestions)}?"
+        raise PokemonNotFoundError(message, suggestions=suggestions)
+
+    async def load_name_index(self) -> PokemonNameIndex:
+        """
+        Load the Pokémon name index once and return it.
+
+        Names come from POKEMON_NAME_INDEX_PATH when that file exists,
+        otherwise from the offline snapshot, otherwise from the PokéAPI
+        /pokemon and /pokemon-species lists (saved to POKEMON_NAME_INDEX_PATH
+        when it is set, so later starts skip the network).
+        """
+        if self.name_index is None:
+            self.name_index = await self.in_flight.do(
+                ("name_index",), self._build_name_index
+            )
+        return self.name_index
+
+    async def _build_name_index(self) -> PokemonNameIndex:
+        """Collect Pokémon names from the configured source and index them."""
+        index_path = settings.POKEMON_NAME_INDEX_PATH
+        if index_path and Path(index_path).exists():
+            return await asyncio.to_thread(PokemonNameIndex.from_file, index_path)
+
+        if self.snapshot is not None:
+            names = self.snapshot.pokemon_names()
+        else:
+            pokemon_names, species_names = await asyncio.gather(
+                self.list_resource_names("pokemon"),
+                self.list_resource_names("pokemon-species"),
+            )
+            names = pokemon_names + species_names
+
+        name_index = await asyncio.to_thread(PokemonNameIndex, names)
+        if index_path:
+            await asyncio.to_thread(name_index.save, index_path)
+        logger.info(f"Loaded Pokémon name index with {len(name_index)} names")
+        return name_index
+
+    async def get_many_pokemon_data(
+        self, pokemon_names: List[str], get_type_data: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch data for several Pokémon concurrently, preserving the input order.
+
+        At most ``max_concurrent_fetches`` lookups run at the same time. The
+        first error (e.g. PokemonNotFoundError) is raised to the caller.
+
+        Args:
+            pokemon_names: Names of the Pokémon to fetch
+            get_type_data: Whether to include type damage relations
+
+        Returns:
+            List of Pokémon data dictionaries in the same order as the names
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def fetch(pokemon_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_pokemon_data(pokemon_name, get_type_data)
+
+        return list(await asyncio.gather(*(fetch(name) for name in pokemon_names)))
+
+    async def _load_pokemon_data(
+        self, pokemon_name: str, forward: bool = True
+    ) -> PokemonRecord:
+        """Load a base Pokémon record from the cache tiers, a peer or PokéAPI and cache it."""
+        data, cacheable = await self._load_from_tiers(
+            "pokemon", pokemon_name, self._fetch_pokemon_data, forward
+        )
+        record = PokemonRecord.from_dict(data)
+        if cacheable:
+            self.pokemon_cache.set(pokemon_name, record)
+        return record
+
+    async def _fetch_pokemon_data(self, pokemon_name: str) -> Dict[str, Any]:
+        """Fetch a base Pokémon record from the snapshot or PokéAPI (internal implementation)."""
+        if self.snapshot is None:
+            return await self._download_pokemon_data(pokemon_name)
+
+        essential_info = self.snapshot.get_pokemon(pokemon_name)
+        if essential_info is None:
+            raise PokemonNotFoundError(
+                f"SERVICE ERROR: Pokémon '{pokemon_name}' not found in the Pokédex snapshot.",
+                confirmed=True,
+            )
+        return essential_info
+
+    async def _download_pokemon_data(self, pokemon_name: str) -> Dict[str, Any]:
+        """Download and trim a Pokémon record from the PokéAPI."""
         url = f"{self.BASE_URL}/pokemon/{pokemon_name}"
 
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
-
-            data = response.json()
-            essential_info = {
-                "id": data.get("id"),
-                "name": data.get("name"),
-                "base_experience": data.get("base_experience"),
-                "height": data.get("height"),
-                "weight": data.get("weight"),
-                "abilities": [
-                    ability["ability"]["name"] for ability in data.get("abilities", [])
-                ],
-                "stats": {
-                    stat["stat"]["name"]: stat["base_stat"]
-                    for stat in data.get("stats", [])
-                },
-                "types": [ptype["type"]["name"] for ptype in data.get("types", [])],
-            }
-
-            if get_type_data:
-                essential_info["type_details"] = {}
-                for type_name in essential_info["types"]:
-                    type_data = await self.get_type_data(type_name)
-                    if isinstance(type_data, dict) and "damage_relations" in type_data:
-                        essential_info["type_details"][type_name] = type_data[
-                            "damage_relations"
-                        ]
-
-            return essential_info
+            fields = (
+                POKEMON_DOCUMENT_FIELDS if settings.SELECTIVE_JSON_PARSING else None
+            )
+            return await self._get_record(
+                "pokemon", pokemon_name, url, extract_pokemon_info, fields
+            )
 
         except httpx.HTTPError as e:
-            raise PokemonNotFoundError(
+            message = (
                 f"SERVICE ERROR: Pokémon '{pokemon_name}' not found. Details: {str(e)}"
             )
+            confirmed = (
+                isinstance(e, httpx.HTTPStatusError)
+                and e.response.status_code == HTTPStatus.NOT_FOUND
+            )
+            if confirmed:
+                self.negative_cache.set(pokemon_name, message)
+            raise PokemonNotFoundError(message, confirmed=confirmed)
 
     async def get_type_data(self, type_name: str) -> Dict[str, Any]:
         """Fetch data about a specific Pokémon type including damage relations with caching."""
-        if type_name in self.type_cache:
-            return self.type_cache[type_name]
+        load = partial(self._load_type_data, type_name)
+        cached, stale = self._get_cached(self.type_cache, type_name)
+        if stale:
+            self._revalidate(("type", type_name), load)
+        if cached is not None:
+            return cached
+
+        return await self.in_flight.do(("type", type_name), load)
+
+    def _get_cached(self, cache: LRUCache, key: str) -> Tuple[Any, bool]:
+        """
+        Look up an in-memory entry as ``(value, stale)``.
+
+        While the circuit breaker is not closed, expired entries are served
+        (degraded mode) instead of triggering a fetch that would most likely
+        be rejected; when it is half-open they are also flagged as stale, so
+        the background refresh doubles as a probe.
+        """
+        state = self.circuit_breaker.state
+        if state != CircuitState.CLOSED and key not in cache:
+            value = cache.peek(key)
+            if value is not None:
+                self.degraded_responses += 1
+                return value, state == CircuitState.HALF_OPEN
+        if not self.stale_while_revalidate:
+            return cache.get(key), False
+        return cache.get_stale(key)
+
+    def _revalidate(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> None:
+        """Refresh a stale cache entry in the background, at most once at a time per key."""
+        if key in self.revalidations:
+            return
+
+        task = asyncio.ensure_future(self.in_flight.do(key, load))
+        self.revalidations[key] = task
+        task.add_done_callback(lambda done: self._finish_revalidation(key, done))
+
+    def _finish_revalidation(self, key: Hashable, task: asyncio.Task) -> None:
+        self.revalidations.pop(key, None)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.revalidation_failures += 1
+            logger.warning(f"Background refresh of {key} failed: {task.exception()}")
+
+    async def get_type_matrix(self) -> TypeEffectivenessMatrix:
+        """Return the 18x18 type effectiveness matrix, building it once from the type data."""
+        if self.type_matrix is None:
+            self.type_matrix = await self.in_flight.do(
+                ("type_matrix",), self._build_type_matrix
+            )
+        return self.type_matrix
+
+    async def _build_type_matrix(self) -> TypeEffectivenessMatrix:
+        """Fetch all 18 types concurrently and build the effectiveness matrix."""
+        type_records = await asyncio.gather(
+            *(self.get_type_data(type_name) for type_name in TYPE_NAMES)
+        )
+        return TypeEffectivenessMatrix.from_type_records(type_records)
 
-        data = await self._fetch_type_data(type_name)
+    async def _load_type_data(
+        self, type_name: str, forward: bool = True
+    ) -> Dict[str, Any]:
+        """Load type data from the cache tiers, a peer or PokéAPI and cache it."""
+        data, cacheable = await self._load_from_tiers(
+            "type", type_name, self._fetch_type_data, forward
+        )
+        if cacheable:
+            self.type_cache.set(type_name, data)
+        return data
 
-        if len(self.type_cache) >= self.cache_size:
-            self.type_cache.pop(next(iter(self.type_cache)))
+    async def _load_from_tiers(
+        self,
+        namespace: str,
+        key: str,
+        fetch: Callable[[str], Awaitable[Dict[str, Any]]],
+        forward: bool = True,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Read a record from the shared tier, the persistent tier, the owning
+        peer (unless ``forward`` is False) or ``fetch``.
+
+        A record found in a lower tier is copied into the tiers above it.
+
+        Returns:
+            The record and whether it may be cached in memory (False for
+            outdated records served in degraded mode)
+        """
+        data = await self._read_shared(namespace, key)
+        if data is not None:
+            return data, True
+
+        data = await self._read_persistent(namespace, key)
+        if data is None:
+            data = await self._ask_peer(namespace, key) if forward else None
+            if data is None:
+                try:
+                    data = await fetch(key)
+                except PokeAPIUnavailableError:
+                    data = await self._read_degraded(namespace, key)
+                    if data is None:
+                        raise
+                    return data, False
+            await self._write_persistent(namespace, key, data)
+
+        await self._write_shared(namespace, key, data)
+        return data, True
+
+    async def _ask_peer(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Ask the peer owning a record for it; None means this node fetches it itself."""
+        if self.peer_cache is None or self.snapshot is not None:
+            return None
 
-        self.type_cache[type_name] = data
+        try:
+            return await self.peer_cache.get(namespace, key)
+        except PeerNotFoundError as e:
+            if namespace == "pokemon":
+                self.negative_cache.set(key, str(e))
+                raise PokemonNotFoundError(str(e), confirmed=True)
+            raise TypeNotFoundError(str(e))
+
+    async def get_peer_record(self, namespace: str, key: str) -> Dict[str, Any]:
+        """
+        Return a record this node owns to a peer asking for it.
+
+        The record comes from the local caches or is loaded without
+        forwarding to another peer, single-flighted with local lookups.
+
+        Raises:
+            PokemonNotFoundError: If the Pokémon does not exist, or could not
+                be fetched (``confirmed`` is False then)
+            TypeNotFoundError: If the type does not exist
+            ValueError: If the type could not be fetched or the namespace is unknown
+        """
+        key = key.lower()
+        if namespace == "pokemon":
+            record = self.pokemon_cache.get(key)
+            if record is None:
+                not_found_message = self.negative_cache.get(key)
+                if not_found_message is not None:
+                    raise PokemonNotFoundError(not_found_message, confirmed=True)
+                record = await self.in_flight.do(
+                    ("pokemon", key),
+                    partial(self._load_pokemon_data, key, forward=False),
+                )
+            return record.to_dict()
+
+        if namespace == "type":
+            data = self.type_cache.get(key)
+            if data is None:
+                data = await self.in_flight.do(
+                    ("type", key), partial(self._load_type_data, key, forward=False)
+                )
+            return data
+
+        raise ValueError(f"Unknown peer cache namespace: {namespace}")
+
+    async def _read_shared(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Read a record from the cross-worker shared tier, if one is configured."""
+        if self.shared_cache is None:
+            return None
+        return await self.shared_cache.get(
+            namespace, key, max_age=settings.CACHE_TTL_SECONDS
+        )
+
+    async def _write_shared(
+        self, namespace: str, key: str, data: Dict[str, Any]
+    ) -> None:
+        """Write a record to the cross-worker shared tier, if one is configured."""
+        if self.shared_cache is not None:
+            await self.shared_cache.set(namespace, key, data)
+
+    async def _read_persistent(
+        self, namespace: str, key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Read a record from the persistent cache tier, if one is configured."""
+        if self.persistent_cache is None:
+            return None
+        return await self.persistent_cache.get(
+            namespace, key, max_age=settings.PERSISTENT_CACHE_TTL_SECONDS
+        )
+
+    async def _read_degraded(
+        self, namespace: str, key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Read a record from the persistent tier regardless of its age, while PokéAPI is unavailable."""
+        if self.persistent_cache is None:
+            return None
+        data = await self.persistent_cache.get(namespace, key)
+        if data is not None:
+            self.degraded_responses += 1
+            logger.warning(
+                f"Serving possibly outdated {namespace} '{key}' (degraded mode)"
+            )
         return data
 
+    async def _write_persistent(
+        self, namespace: str, key: str, data: Dict[str, Any]
+    ) -> None:
+        """Write a fetched record to the persistent cache tier, if one is configured."""
+        if self.persistent_cache is not None:
+            await self.persistent_cache.set(namespace, key, data)
+
     async def _fetch_type_data(self, type_name: str) -> Dict[str, Any]:
         """Fetch data about a specific Pokémon type including damage relations (internal implementation)."""
+        if self.snapshot is not None:
+            type_info = self.snapshot.get_type(type_name.lower())
+            if type_info is None:
+                raise TypeNotFoundError(
+                    f"Error: Type '{type_name}' not found in the Pokédex snapshot."
+                )
+            return type_info
+
+        return await self._download_type_data(type_name)
+
+    async def _download_type_data(self, type_name: str) -> Dict[str, Any]:
+        """Download and trim a type record from the PokéAPI."""
         url = f"{self.BASE_URL}/type/{type_name.lower()}"
 
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
-
-            data = response.json()
-            type_info = {
-                "id": data.get("id"),
-                "name": data.get("name"),
-                "damage_relations": data.get("damage_relations"),
-            }
-            return type_info
+            return await self._get_record("type", type_name, url, extract_type_info)
 
         except httpx.HTTPError as e:
-            raise ValueError(f"Error: Type '{type_name}' not found. Details: {str(e)}")
+            message = f"Error: Type '{type_name}' not found. Details: {str(e)}"
+            if (
+                isinstance(e, httpx.HTTPStatusError)
+                and e.response.status_code == HTTPStatus.NOT_FOUND
+            ):
+                raise TypeNotFoundError(message)
+            raise ValueError(message)
+
+    async def list_resource_names(self, resource: str) -> List[str]:
+        """
+        List the names of every entry of a PokéAPI resource.
+
+        Args:
+            resource: Resource name, e.g. "pokemon" or "type"
+
+        Returns:
+            Names of all entries, as reported by the resource's list endpoint
+        """
+        url = f"{self.BASE_URL}/{resource}"
+        response = await self._get(url, params={"limit": 100000})
+        return [entry["name"] for entry in response.json().get("results", [])]
+
+    async def _get_record(
+        self,
+        namespace: str,
+        key: str,
+        url: str,
+        extract: Callable[[Dict[str, Any]], Dict[str, Any]],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Dict[str, Any]:
+        """
+        GET a PokéAPI document and trim it into a record with ``extract``.
+
+        If the record is still in memory (possibly expired) and its response
+        carried an ETag or Last-Modified header, the request is conditional,
+        and a 304 answer returns the in-memory record without downloading or
+        parsing the document again; the caller then caches it anew. With
+        ``fields`` set, the response is streamed and only those top-level
+        fields are parsed.
+
+        Raises:
+            httpx.HTTPError: For non-retryable errors (e.g. 404 Not Found)
+            PokeAPIUnavailableError: When PokéAPI is unavailable or the body
+                is cut off while streaming
+        """
+        validators = cached = None
+        if settings.CONDITIONAL_REQUESTS_ENABLED:
+            validators = self.validators.get((namespace, key))
+            if validators is not None:
+                cached = self._peek_cached(namespace, key)
+
+        kwargs: Dict[str, Any] = {}
+        if cached is not None:
+            kwargs["headers"] = validators.conditional_headers()
+            self.conditional_requests += 1
+        response = await self._get(url, stream=fields is not None, **kwargs)
+
+        try:
+            if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+                self.not_modified += 1
+                return cached
+            if fields is None:
+                document = response.json()
+            else:
+                document = await parse_selected(response.aiter_bytes(), fields)
+        except httpx.TransportError as e:
+            raise PokeAPIUnavailableError(
+                f"SERVICE UNAVAILABLE: PokéAPI response from {url} was cut off. "
+                f"Details: {e!r}"
+            ) from e
+        finally:
+            if fields is not None:
+                await response.aclose()
+
+        if settings.CONDITIONAL_REQUESTS_ENABLED:
+            self._store_validators(namespace, key, response.headers)
+        return extract(document)
+
+    def _peek_cached(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the in-memory record of a key, even if it has expired, or None."""
+        if namespace == "pokemon":
+            record = self.pokemon_cache.peek(key)
+            return record.to_dict() if record is not None else None
+        return self.type_cache.peek(key)
+
+    def _store_validators(
+        self, namespace: str, key: str, headers: httpx.Headers
+    ) -> None:
+        """Remember the ETag/Last-Modified of a record's response, if it had any."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            self.validators.set((namespace, key), Validators(etag, last_modified))
+        else:
+            self.validators.pop((namespace, key))
+
+    async def _get(
+        self, url: str, stream: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        GET a PokéAPI URL, retrying transient failures.
+
+        429/5xx responses and network errors are retried with exponential
+        backoff and full jitter, honouring ``Retry-After``, for at most
+        ``HTTP_RETRY_ATTEMPTS`` attempts and ``HTTP_RETRY_DEADLINE_SECONDS``
+        in total. Other HTTP errors, such as 404, are raised immediately,
+        while 304 Not Modified is returned like a success.
+        Every attempt is reported to the circuit breaker, and no request is
+        sent while it is open. Attempts go through the shared rate limiter;
+        waiting for it counts against the deadline, but is neither upstream
+        latency nor a PokéAPI failure for the breaker. With ``stream`` set,
+        only the headers are read and the caller must consume and close the
+        response.
+
+        Raises:
+            httpx.HTTPError: For non-retryable errors (e.g. 404 Not Found)
+            PokeAPIUnavailableError: When retries or the deadline are exhausted,
+                or the circuit breaker is open
+        """
+        deadline = time.monotonic() + settings.HTTP_RETRY_DEADLINE_SECONDS
+        attempt = 0
+
+        while True:
+            if not self.circuit_breaker.allow_request():
+                raise PokeAPIUnavailableError(
+                    f"SERVICE UNAVAILABLE: PokéAPI circuit breaker is open, not "
+                    f"requesting {url}. Retry in "
+                    f"{self.circuit_breaker.retry_after() or 0:.0f}s."
+                )
+
+            attempt += 1
+            retry_after = None
+            try:
+                async with AsyncExitStack() as stack:
+                    await self._acquire_slot(stack, url, deadline)
+                    started_at = time.monotonic()
+                    async with asyncio.timeout(deadline - started_at):
+                        if stream:
+                            request = self.client.build_request("GET", url, **kwargs)
+                            response = await self.client.send(request, stream=True)
+                        else:
+                            response = await self.client.get(url, **kwargs)
+                if stream and response.is_error:
+                    await response.aclose()
+                if response.status_code != HTTPStatus.NOT_MODIFIED:
+                    response.raise_for_status()
+                self.circuit_breaker.record_success(time.monotonic() - started_at)
+                return response
+            except httpx.HTTPStatusError as e:
+                if not is_retryable_status(e.response.status_code):
+                    self.circuit_breaker.record_success(time.monotonic() - started_at)
+                    raise
+                self.circuit_breaker.record_failure()
+                error: Exception = e
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+            except httpx.TransportError as e:
+                self.circuit_breaker.record_failure()
+                error = e
+            except TimeoutError as e:
+                self.circuit_breaker.record_failure()
+                raise PokeAPIUnavailableError(
+                    f"SERVICE UNAVAILABLE: PokéAPI did not answer {url} within "
+                    f"{settings.HTTP_RETRY_DEADLINE_SECONDS}s."
+                ) from e
+            except asyncio.CancelledError:
+                self.circuit_breaker.release()
+                raise
+
+            delay = backoff_delay(attempt)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+            if (
+                attempt >= settings.HTTP_RETRY_ATTEMPTS
+                or time.monotonic() + delay >= deadline
+            ):
+                raise PokeAPIUnavailableError(
+                    f"SERVICE UNAVAILABLE: PokéAPI request to {url} failed after "
+                    f"{attempt} attempt(s). This does not mean the resource does "
+                    f"not exist. Details: {error!r}"
+                ) from error
+
+            logger.warning(
+                f"Retrying {url} in {delay:.2f}s after attempt {attempt}: {error!r}"
+            )
+            await asyncio.sleep(delay)
+
+    async def _acquire_slot(
+        self, stack: AsyncExitStack, url: str, deadline: float
+    ) -> None:
+        """
+        Enter a rate limiter slot on ``stack``, waiting no longer than ``deadline``.
+
+        Running out of time in the local queue says nothing about PokéAPI, so
+        it is not recorded by the circuit breaker, and a half-open probe slot
+        is given back.
+
+        Raises:
+            PokeAPIUnavailableError: When no slot is free before the deadline
+        """
+        try:
+            async with asyncio.timeout(deadline - time.monotonic()):
+                await stack.enter_async_context(self.rate_limiter.slot())
+            if time.monotonic() >= deadline:
+                raise TimeoutError
+        except TimeoutError as e:
+            self.circuit_breaker.release()
+            raise PokeAPIUnavailableError(
+                f"SERVICE UNAVAILABLE: not requesting {url}, the local rate limit "
+                f"queue did not clear within {settings.HTTP_RETRY_DEADLINE_SECONDS}s."
+            ) from e
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Return whether an HTTP status code indicates a transient PokéAPI failure."""
+    return status_code == 429 or status_code >= 500
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return a fully jittered exponential backoff delay for the given attempt."""
+    ceiling = min(
+        settings.HTTP_RETRY_MAX_BACKOFF_SECONDS,
+        settings.HTTP_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1),
+    )
+    return random.uniform(0, ceiling)
+
+
+def create_http_client(metrics: ConnectionPoolMetrics) -> httpx.AsyncClient:
+    """Create the PokéAPI HTTP client with the pool, timeout and HTTP/2 settings."""
+    timeout = httpx.Timeout(
+        settings.HTTP_TIMEOUT_SECONDS,
+        connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS or settings.HTTP_TIMEOUT_SECONDS,
+        read=settings.HTTP_READ_TIMEOUT_SECONDS or settings.HTTP_TIMEOUT_SECONDS,
+    )
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    transport = InstrumentedTransport(
+        metrics, limits=limits, http2=settings.HTTP2_ENABLED
+    )
+    return httpx.AsyncClient(timeout=timeout, transport=transport)
+
+
+def create_rate_limiter() -> RateLimiter:
+    """Create the outbound PokéAPI rate limiter from the RATE_LIMIT_* settings."""
+    if not settings.RATE_LIMIT_ENABLED:
+        return RateLimiter()
+    return RateLimiter(
+        requests_per_second=settings.RATE_LIMIT_REQUESTS_PER_SECOND,
+        burst=settings.RATE_LIMIT_BURST,
+        max_concurrency=settings.RATE_LIMIT_MAX_CONCURRENCY,
+    )
+
+
+def create_circuit_breaker() -> CircuitBreaker:
+    """Create the PokéAPI circuit breaker from the CIRCUIT_BREAKER_* settings."""
+    return CircuitBreaker(
+        window_size=settings.CIRCUIT_BREAKER_WINDOW_SIZE,
+        min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+        failure_rate=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+        slow_call_seconds=settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+        slow_call_rate=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+        open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+        half_open_probes=settings.CIRCUIT_BREAKER_HALF_OPEN_PROBES,
+    )
+
+
+# Top-level members of a /pokemon document read by ``extract_pokemon_info``
+POKEMON_DOCUMENT_FIELDS = (
+    "id",
+    "name",
+    "base_experience",
+    "height",
+    "weight",
+    "abilities",
+    "stats",
+    "types",
+)
+
+
+def extract_pokemon_info(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim a raw PokéAPI /pokemon document down to the fields the agents use."""
+    return {
+        "id": data.get("id"),
+        "name": data.get("name"),
+        "base_experience": data.get("base_experience"),
+        "height": data.get("height"),
+        "weight": data.get("weight"),
+        "abilities": [
+            ability["ability"]["name"] for ability in data.get("abilities", [])
+        ],
+        "stats": {
+            stat["stat"]["name"]: stat["base_stat"] for stat in data.get("stats", [])
+        },
+        "types": [ptype["type"]["name"] for ptype in data.get("types", [])],
+    }
+
+
+def extract_type_info(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim a raw PokéAPI /type document down to its id, name and damage relations."""
+    return {
+        "id": data.get("id"),
+        "name": data.get("name"),
+        "damage_relations": data.get("damage_relations"),
+    }
 
 
 pokemon_service = None
@@ -145,3 +969,16 @@ def get_pokemon_service() -> PokeAPIService:
     if pokemon_service is None:
         pokemon_service = PokeAPIService()
     return pokemon_service
+
+
+def get_loaded_name_index() -> Optional[PokemonNameIndex]:
+    """Return the name index of the global service, or None until it is loaded."""
+    return pokemon_service.name_index if pokemon_service is not None else None
+
+
+async def load_pokemon_name_index() -> None:
+    """Load the name index of the global service, logging failures instead of raising."""
+    try:
+        await get_pokemon_service().load_name_index()
+    except Exception as e:
+        logger.warning(f"Could not load the Pokémon name index: {e}")
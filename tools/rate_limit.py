@@ -0,0 +1,136 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+# Waits shorter than this are not counted as limited (scheduling noise).
+LIMITED_WAIT_SECONDS = 0.001
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` requests per second with bursts of up to ``burst``.
+
+    Waiters are served in arrival order: the first one sleeps until a token
+    is available while the others queue behind it.
+
+    Args:
+        rate: Tokens added per second
+        burst: Maximum number of tokens the bucket holds
+        clock: Monotonic time source, injectable for tests
+    """
+
+    def __init__(
+        self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class RateLimiter:
+    """
+    Rate limit and concurrency cap shared by all outbound requests of a service.
+
+    A request first waits for one of ``max_concurrency`` slots, then for a
+    token of the bucket, so queued requests do not use up tokens. The time
+    spent waiting is recorded, which shows when traffic is limiter-bound
+    rather than upstream-bound.
+
+    Args:
+        requests_per_second: Sustained request rate (None disables the bucket)
+        burst: Requests allowed at once on top of the sustained rate
+        max_concurrency: Requests in flight at the same time (None for no cap)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.bucket = (
+            TokenBucket(requests_per_second, burst) if requests_per_second else None
+        )
+        self.max_concurrency = max_concurrency
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+
+        self.requests = 0
+        self.in_flight = 0
+        self.queued = 0
+        self.limited = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Hold a concurrency slot and a token for one request, yielding the seconds waited."""
+        started_at = time.perf_counter()
+        self.queued += 1
+        try:
+            if self._semaphore is not None:
+                await self._semaphore.acquire()
+            try:
+                if self.bucket is not None:
+                    await self.bucket.acquire()
+            except BaseException:
+                if self._semaphore is not None:
+                    self._semaphore.release()
+                raise
+        finally:
+            self.queued -= 1
+
+        wait = time.perf_counter() - started_at
+        self.requests += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        if wait >= LIMITED_WAIT_SECONDS:
+            self.limited += 1
+
+        self.in_flight += 1
+        try:
+            yield wait
+        finally:
+            self.in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the limits, current queue and queue-wait statistics."""
+        return {
+            "requests_per_second": self.bucket.rate if self.bucket else None,
+            "burst": self.bucket.burst if self.bucket else None,
+            "max_concurrency": self.max_concurrency,
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "limited": self.limited,
+            "wait_avg_ms": (
+                1000 * self.wait_total / self.requests if self.requests else 0.0
+            ),
+            "wait_max_ms": 1000 * self.wait_max,
+        }
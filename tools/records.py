@@ -0,0 +1,124 @@
+import sys
+from array import array
+from typing import Any, Dict, Optional, Tuple
+
+# Fixed order of the base stats packed into PokemonRecord.stats.
+STAT_NAMES: Tuple[str, ...] = (
+    "hp",
+    "attack",
+    "defense",
+    "special-attack",
+    "special-defense",
+    "speed",
+)
+STAT_INDEX = {name: i for i, name in enumerate(STAT_NAMES)}
+
+# Marks a stat that is absent from the source record (base stats are < 256).
+MISSING_STAT = 0xFFFF
+
+
+def _intern_all(names: Any) -> Tuple[str, ...]:
+    return tuple(sys.intern(name) for name in names)
+
+
+class PokemonRecord:
+    """
+    Compact in-memory representation of a trimmed Pokémon record.
+
+    Stats are packed into a fixed-order ``array('H')`` instead of a dict
+    with repeated string keys, and type/ability names are interned tuples
+    shared by every record. ``to_dict`` rebuilds the dictionary shape
+    returned by ``extract_pokemon_info`` for the API and tool layers.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "base_experience",
+        "height",
+        "weight",
+        "abilities",
+        "types",
+        "stats",
+        "extra_stats",
+    )
+
+    def __init__(
+        self,
+        id: Optional[int],
+        name: Optional[str],
+        base_experience: Optional[int],
+        height: Optional[int],
+        weight: Optional[int],
+        abilities: Tuple[str, ...],
+        types: Tuple[str, ...],
+        stats: array,
+        extra_stats: Optional[Dict[str, int]] = None,
+    ):
+        self.id = id
+        self.name = name
+        self.base_experience = base_experience
+        self.height = height
+        self.weight = weight
+        self.abilities = abilities
+        self.types = types
+        self.stats = stats
+        self.extra_stats = extra_stats
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PokemonRecord":
+        """Build a record from an ``extract_pokemon_info``-shaped dictionary."""
+        stats = array("H", [MISSING_STAT] * len(STAT_NAMES))
+        extra_stats = None
+        for stat_name, value in data.get("stats", {}).items():
+            index = STAT_INDEX.get(stat_name)
+            if index is not None and 0 <= value < MISSING_STAT:
+                stats[index] = value
+            else:
+                extra_stats = extra_stats or {}
+                extra_stats[stat_name] = value
+
+        name = data.get("name")
+        return cls(
+            id=data.get("id"),
+            name=sys.intern(name) if name else name,
+            base_experience=data.get("base_experience"),
+            height=data.get("height"),
+            weight=data.get("weight"),
+            abilities=_intern_all(data.get("abilities", [])),
+            types=_intern_all(data.get("types", [])),
+            stats=stats,
+            extra_stats=extra_stats,
+        )
+
+    def stats_dict(self) -> Dict[str, int]:
+        """Return the base stats as a name -> value dictionary."""
+        stats = {
+            stat_name: value
+            for stat_name, value in zip(STAT_NAMES, self.stats)
+            if value != MISSING_STAT
+        }
+        if self.extra_stats:
+            stats.update(self.extra_stats)
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record in the dictionary shape used by the API and tools."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "base_experience": self.base_experience,
+            "height": self.height,
+            "weight": self.weight,
+            "abilities": list(self.abilities),
+            "stats": self.stats_dict(),
+            "types": list(self.types),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PokemonRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"PokemonRecord(id={self.id!r}, name={self.name!r})"
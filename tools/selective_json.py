@@ -0,0 +1,158 @@
+import codecs
+import json
+from json.decoder import WHITESPACE
+from typing import Any, AsyncIterable, Dict, Generator, Iterable, Optional
+
+_decoder = json.JSONDecoder()
+
+# Generator steps of the parser yield None whenever they need more input.
+_Step = Generator[None, None, Any]
+
+
+class SelectiveJSONParser:
+    """
+    Incremental parser keeping only selected top-level members of a JSON object.
+
+    Bytes are fed as they arrive. Wanted members are decoded as usual; every
+    other member is skipped one array element or object member at a time,
+    so the parsed tree of a large unwanted value (e.g. the ``moves`` of a
+    PokéAPI /pokemon document) never exists in memory as a whole, and the
+    consumed part of the input is dropped on every ``feed``. Decoding itself
+    stays in the C JSON scanner.
+
+    Args:
+        keys: Names of the top-level members to keep
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys = frozenset(keys)
+        self.result: Dict[str, Any] = {}
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._parser: Optional[_Step] = self._parse()
+
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the document."""
+        self._buffer = self._buffer[self._pos :] + self._text.decode(data)
+        self._pos = 0
+        self._advance()
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing and return the selected members.
+
+        Raises:
+            ValueError: When the document is truncated, malformed or not an object
+        """
+        self._buffer = self._buffer[self._pos :] + self._text.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        self._advance()
+        if self._buffer[self._pos :].strip():
+            raise ValueError("Extra data after the JSON document")
+        return self.result
+
+    def _advance(self) -> None:
+        if self._parser is None:
+            return
+        try:
+            next(self._parser)
+        except StopIteration:
+            self._parser = None
+
+    def _parse(self) -> _Step:
+        yield from self._expect("{")
+        if (yield from self._peek()) == "}":
+            self._pos += 1
+            return
+        while True:
+            key = yield from self._key()
+            if key in self.keys:
+                self.result[key] = yield from self._value()
+            else:
+                yield from self._skip()
+            if (yield from self._expect(",}")) == "}":
+                return
+
+    def _skip(self) -> _Step:
+        """Skip a value, decoding the children of a container one at a time."""
+        opening = yield from self._peek()
+        if opening not in ("[", "{"):
+            yield from self._value()
+            return
+
+        closing = "]" if opening == "[" else "}"
+        self._pos += 1
+        if (yield from self._peek()) == closing:
+            self._pos += 1
+            return
+        while True:
+            if opening == "{":
+                yield from self._key()
+            yield from self._value()
+            if (yield from self._expect("," + closing)) == closing:
+                return
+
+    def _peek(self) -> _Step:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                raise ValueError("Truncated JSON document")
+            yield
+
+    def _expect(self, chars: str) -> _Step:
+        """Consume one of ``chars`` and return it."""
+        char = yield from self._peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r}, found {char!r}")
+        self._pos += 1
+        return char
+
+    def _key(self) -> _Step:
+        """Consume an object key and the colon after it."""
+        key = yield from self._value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected an object key, found {key!r}")
+        yield from self._expect(":")
+        return key
+
+    def _value(self) -> _Step:
+        """Decode the next complete value."""
+        while True:
+            yield from self._peek()
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                yield
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end < len(self._buffer) or self._eof:
+                self._pos = end
+                return value
+            yield
+
+
+async def parse_selected(
+    chunks: AsyncIterable[bytes], keys: Iterable[str]
+) -> Dict[str, Any]:
+    """
+    Parse a streamed JSON object, keeping only its top-level members named in ``keys``.
+
+    Args:
+        chunks: Byte chunks of the document, e.g. ``response.aiter_bytes()``
+        keys: Names of the top-level members to keep
+
+    Returns:
+        The selected members that the document contains
+    """
+    parser = SelectiveJSONParser(keys)
+    async for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
@@ -0,0 +1,257 @@
+import asyncio
+import json
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from core.logging import get_logger
+from tools.cache import LRUCache
+from tools.persistent_cache import CacheBackend
+
+logger = get_logger("tools.shared_cache")
+
+# Every message is a JSON document prefixed with its length.
+FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """Read one length-prefixed JSON message."""
+    (length,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Shared cache frame of {length} bytes is too large")
+    return json.loads(await reader.readexactly(length))
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    """Encode a message as a length-prefixed JSON frame."""
+    payload = json.dumps(message, separators=(",", ":")).encode()
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+class SharedCacheStore:
+    """In-memory LRU of JSON records with their fetch time, owned by the leader worker."""
+
+    def __init__(self, maxsize: int):
+        self._entries = LRUCache(maxsize)
+
+    def get(
+        self, namespace: str, key: str, max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        entry: Optional[Tuple[Dict[str, Any], float]] = self._entries.get(
+            (namespace, key)
+        )
+        if entry is None:
+            return None
+        value, fetched_at = entry
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        return value
+
+    def set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        self._entries.set((namespace, key), (value, time.time()))
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a ``get`` or ``set`` request from a follower."""
+        op = request.get("op")
+        if op == "get":
+            return {
+                "value": self.get(
+                    request["namespace"], request["key"], request.get("max_age")
+                )
+            }
+        if op == "set":
+            self.set(request["namespace"], request["key"], request["value"])
+            return {"ok": True}
+        return {"error": f"unknown op {op!r}"}
+
+    def stats(self) -> Dict[str, Any]:
+        return self._entries.stats()
+
+
+class SharedCacheBackend(CacheBackend):
+    """
+    Cache tier shared by every worker process on the host over a Unix socket.
+
+    The first worker that takes the exclusive lock on ``<socket>.lock``
+    becomes the leader: it keeps the records in its own memory and serves
+    them to the other workers over the socket. The others connect as
+    followers and exchange length-prefixed JSON messages with it. The OS
+    drops the lock when the leader exits, so the next follower whose
+    request fails takes over. Socket errors and timeouts are logged and
+    treated as cache misses.
+
+    Args:
+        socket_path: Path of the Unix socket (the lock file sits next to it)
+        maxsize: Maximum number of records kept by the leader
+        timeout: Seconds to wait for the leader's answer before giving up on a
+            request (time spent queued behind other requests is not counted)
+    """
+
+    def __init__(self, socket_path: str, maxsize: int = 5000, timeout: float = 0.1):
+        self.socket_path = Path(socket_path)
+        self.lock_path = self.socket_path.with_name(self.socket_path.name + ".lock")
+        self.maxsize = maxsize
+        self.timeout = timeout
+
+        self._store: Optional[SharedCacheStore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._lock_fd: Optional[int] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._followers: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._io_lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @property
+    def role(self) -> str:
+        if self._store is not None:
+            return "leader"
+        return "follower" if self._writer is not None else "disconnected"
+
+    def _try_lock(self) -> bool:
+        """Try to take the leader lock without blocking."""
+        import fcntl  # POSIX only; not needed unless the shared cache is enabled
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        return True
+
+    async def _become_leader(self) -> None:
+        store = SharedCacheStore(self.maxsize)
+        self.socket_path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(
+            lambda reader, writer: self._serve(store, reader, writer),
+            path=str(self.socket_path),
+        )
+        self._store = store
+        logger.info(f"Serving the shared cache on {self.socket_path}")
+
+    async def _serve(
+        self,
+        store: SharedCacheStore,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self._followers[writer] = asyncio.current_task()
+        try:
+            while True:
+                request = await read_frame(reader)
+                writer.write(encode_frame(store.handle(request)))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Dropping shared cache client after a bad request: {e}")
+        finally:
+            self._followers.pop(writer, None)
+            writer.close()
+
+    async def _connect(self) -> None:
+        """Become the leader if nobody holds the lock, otherwise connect to it."""
+        if self._try_lock():
+            await self._become_leader()
+            return
+
+        self._reader, self._writer = await asyncio.open_unix_connection(
+            str(self.socket_path)
+        )
+
+    def _disconnect(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request to the leader, timing out only on the exchange itself."""
+        async with self._io_lock:
+            if self._store is not None:
+                return self._store.handle(message)
+            # The timeout starts once the connection is ours, so requests
+            # queued behind others during a burst do not time out while waiting.
+            async with asyncio.timeout(self.timeout):
+                if self._writer is None:
+                    await self._connect()
+                    if self._store is not None:
+                        return self._store.handle(message)
+
+                try:
+                    self._writer.write(encode_frame(message))
+                    await self._writer.drain()
+                    return await read_frame(self._reader)
+                except BaseException:
+                    # The stream may hold a partial frame; start over next time.
+                    self._disconnect()
+                    raise
+
+    async def get(
+        self, namespace: str, key: str, max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self._request(
+                {"op": "get", "namespace": namespace, "key": key, "max_age": max_age}
+            )
+        except (OSError, TimeoutError, ValueError, asyncio.IncompleteReadError) as e:
+            self.errors += 1
+            logger.warning(f"Shared cache read failed for {namespace}/{key}: {e!r}")
+            return None
+
+        value = response.get("value")
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        try:
+            await self._request(
+                {"op": "set", "namespace": namespace, "key": key, "value": value}
+            )
+        except (
+            OSError,
+            TimeoutError,
+            TypeError,
+            ValueError,
+            asyncio.IncompleteReadError,
+        ) as e:
+            self.errors += 1
+            logger.warning(f"Shared cache write failed for {namespace}/{key}: {e!r}")
+
+    async def close(self) -> None:
+        self._disconnect()
+        if self._server is not None:
+            self._server.close()
+            handlers = list(self._followers.values())
+            for writer in list(self._followers):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self.socket_path.unlink(missing_ok=True)
+            self._server = None
+        self._store = None
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            "role": self.role,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+        if self._store is not None:
+            stats["store"] = self._store.stats()
+        return stats
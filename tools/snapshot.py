@@ -0,0 +1,138 @@
+import json
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"PKDXSNAP"
+VERSION = 1
+
+# magic, format version, length of the JSON index that follows the header
+HEADER = struct.Struct("<8sHI")
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a valid Pokédex snapshot."""
+
+
+class PokedexSnapshot:
+    """
+    Read-only, memory-mapped Pokédex snapshot.
+
+    The file starts with a small header and a JSON index mapping every
+    Pokémon/type name (and numeric id) to the offset and length of its
+    record. Records are compact JSON blobs in the data section; only the
+    requested record is decoded, directly from the mapped pages, so opening
+    a snapshot is cheap and lookups take microseconds.
+
+    Args:
+        path: Path of a snapshot written by ``write_snapshot``
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SnapshotFormatError(f"Empty Pokédex snapshot: {self.path}")
+
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise SnapshotFormatError(f"Truncated Pokédex snapshot: {self.path}")
+
+        magic, version, index_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SnapshotFormatError(
+                f"Unsupported Pokédex snapshot format in {self.path}"
+            )
+
+        index_end = HEADER.size + index_length
+        index = json.loads(self._mmap[HEADER.size : index_end])
+        self._data_offset = index_end
+        self._pokemon: Dict[str, List[int]] = index["pokemon"]
+        self._types: Dict[str, List[int]] = index["type"]
+        self.created_at: float = index.get("created_at", 0.0)
+
+    def _read(self, location: Optional[List[int]]) -> Optional[Dict[str, Any]]:
+        if location is None:
+            return None
+        offset, length = location
+        start = self._data_offset + offset
+        return json.loads(self._mmap[start : start + length])
+
+    def get_pokemon(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the trimmed record for a Pokémon name or id, or None."""
+        return self._read(self._pokemon.get(name.lower()))
+
+    def get_type(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the trimmed record for a type name or id, or None."""
+        return self._read(self._types.get(name.lower()))
+
+    def pokemon_names(self) -> List[str]:
+        """Return the names of every Pokémon in the snapshot."""
+        return [name for name in self._pokemon if not name.isdigit()]
+
+    def type_names(self) -> List[str]:
+        """Return the names of every type in the snapshot."""
+        return [name for name in self._types if not name.isdigit()]
+
+    def close(self) -> None:
+        """Unmap the snapshot and close the underlying file."""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+
+def _pack_section(
+    records: Iterable[Dict[str, Any]], data: bytearray
+) -> Dict[str, Tuple[int, int]]:
+    """Append records to ``data`` and return their name/id -> (offset, length) index."""
+    index = {}
+    for record in records:
+        blob = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode()
+        location = (len(data), len(blob))
+        data.extend(blob)
+
+        index[record["name"]] = location
+        if record.get("id") is not None:
+            index[str(record["id"])] = location
+    return index
+
+
+def write_snapshot(
+    path: str,
+    pokemon_records: Iterable[Dict[str, Any]],
+    type_records: Iterable[Dict[str, Any]],
+) -> None:
+    """
+    Write trimmed Pokémon and type records to a snapshot file.
+
+    The file is written next to ``path`` and atomically renamed into place,
+    so running services never observe a partially written snapshot.
+
+    Args:
+        path: Destination path of the snapshot
+        pokemon_records: Records shaped like ``extract_pokemon_info`` output
+        type_records: Records shaped like ``extract_type_info`` output
+    """
+    data = bytearray()
+    index = {
+        "created_at": time.time(),
+        "pokemon": _pack_section(pokemon_records, data),
+        "type": _pack_section(type_records, data),
+    }
+    index_blob = json.dumps(index, separators=(",", ":"), ensure_ascii=False).encode()
+
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = destination.with_name(destination.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index_blob)))
+        f.write(index_blob)
+        f.write(data)
+    os.replace(tmp_path, destination)
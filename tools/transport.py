@@ -0,0 +1,116 @@
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+# httpcore trace events marking the moment a request got hold of a connection.
+NEW_CONNECTION_EVENT = "connection.connect_tcp.started"
+REQUEST_SENT_EVENTS = (
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+)
+
+
+class ConnectionPoolMetrics:
+    """Counters describing how outbound requests used the HTTP connection pool."""
+
+    def __init__(self):
+        self.requests = 0
+        self.in_flight = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.pool_wait_total = 0.0
+        self.pool_wait_max = 0.0
+        self.connect_time_total = 0.0
+
+    def record(
+        self, pool_wait: float, new_connection: bool, connect_time: float = 0.0
+    ) -> None:
+        """Record how long a request waited for a connection and whether it opened one."""
+        self.pool_wait_total += pool_wait
+        self.pool_wait_max = max(self.pool_wait_max, pool_wait)
+        if new_connection:
+            self.new_connections += 1
+            self.connect_time_total += connect_time
+        else:
+            self.reused_connections += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool usage statistics, including averages and the reuse ratio."""
+        acquired = self.new_connections + self.reused_connections
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_ratio": self.reused_connections / acquired if acquired else 0.0,
+            "pool_wait_avg_ms": (
+                1000 * self.pool_wait_total / acquired if acquired else 0.0
+            ),
+            "pool_wait_max_ms": 1000 * self.pool_wait_max,
+            "connect_time_avg_ms": (
+                1000 * self.connect_time_total / self.new_connections
+                if self.new_connections
+                else 0.0
+            ),
+        }
+
+
+class _RequestTrace:
+    """httpcore ``trace`` extension callback timing a single request."""
+
+    def __init__(self, started_at: float, parent: Optional[Any] = None):
+        self.started_at = started_at
+        self.parent = parent
+        self.connect_started_at: Optional[float] = None
+        self.pool_wait: Optional[float] = None
+        self.connect_time = 0.0
+
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if event == NEW_CONNECTION_EVENT and self.connect_started_at is None:
+            self.connect_started_at = now
+            self.pool_wait = now - self.started_at
+        elif event in REQUEST_SENT_EVENTS and self.pool_wait is None:
+            self.pool_wait = now - self.started_at
+        elif event in REQUEST_SENT_EVENTS and self.connect_started_at is not None:
+            self.connect_time = now - self.connect_started_at
+
+        if self.parent is not None:
+            await self.parent(event, info)
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """
+    Async HTTP transport that records connection pool metrics.
+
+    Each request gets an httpcore ``trace`` callback. The time until the
+    request either starts opening a TCP connection or starts sending on an
+    existing one is recorded as pool wait, and the presence of a
+    ``connect_tcp`` event tells new connections apart from reused ones.
+
+    Args:
+        metrics: Metrics object updated by every request
+        **kwargs: Passed to ``httpx.AsyncHTTPTransport`` (limits, http2, ...)
+    """
+
+    def __init__(self, metrics: ConnectionPoolMetrics, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = _RequestTrace(time.perf_counter(), request.extensions.get("trace"))
+        request.extensions["trace"] = trace
+
+        self.metrics.requests += 1
+        self.metrics.in_flight += 1
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self.metrics.in_flight -= 1
+            if trace.pool_wait is not None:
+                self.metrics.record(
+                    trace.pool_wait,
+                    new_connection=trace.connect_started_at is not None,
+                    connect_time=trace.connect_time,
+                )
@@ -0,0 +1,109 @@
+from typing import Any, Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+# The 18 battle types, in PokéAPI id order.
+TYPE_NAMES: Tuple[str, ...] = (
+    "normal",
+    "fighting",
+    "flying",
+    "poison",
+    "ground",
+    "rock",
+    "bug",
+    "ghost",
+    "steel",
+    "fire",
+    "water",
+    "grass",
+    "electric",
+    "psychic",
+    "ice",
+    "dragon",
+    "dark",
+    "fairy",
+)
+
+ATTACK_RELATIONS = {
+    "double_damage_to": 2.0,
+    "half_damage_to": 0.5,
+    "no_damage_to": 0.0,
+}
+
+
+class TypeEffectivenessMatrix:
+    """
+    Attack multipliers between the 18 Pokémon types as a NumPy matrix.
+
+    ``matrix[a, d]`` is the damage multiplier of an attack of type ``a``
+    against a single-typed defender of type ``d``. Dual-type multipliers are
+    the product of the two columns, so every helper works on whole rows or
+    columns instead of walking ``damage_relations`` dictionaries.
+
+    Args:
+        matrix: Square float matrix of attack multipliers
+        type_names: Type name of each row/column
+    """
+
+    def __init__(self, matrix: np.ndarray, type_names: Sequence[str] = TYPE_NAMES):
+        if matrix.shape != (len(type_names), len(type_names)):
+            raise ValueError("matrix shape does not match the number of types")
+
+        self.matrix = matrix
+        self.type_names = tuple(type_names)
+        self._index = {name: i for i, name in enumerate(self.type_names)}
+
+    @classmethod
+    def from_type_records(
+        cls, type_records: Iterable[Dict[str, Any]]
+    ) -> "TypeEffectivenessMatrix":
+        """Build the matrix from ``get_type_data`` records (id, name, damage_relations)."""
+        index = {name: i for i, name in enumerate(TYPE_NAMES)}
+        matrix = np.ones((len(TYPE_NAMES), len(TYPE_NAMES)), dtype=np.float32)
+
+        for record in type_records:
+            attacker = index.get(record.get("name"))
+            if attacker is None:
+                continue
+
+            relations = record.get("damage_relations") or {}
+            for relation, multiplier in ATTACK_RELATIONS.items():
+                for target in relations.get(relation, []):
+                    defender = index.get(target["name"])
+                    if defender is not None:
+                        matrix[attacker, defender] = multiplier
+
+        return cls(matrix)
+
+    def indices(self, type_names: Iterable[str]) -> np.ndarray:
+        """Return the row/column indices for the given type names."""
+        try:
+            return np.array([self._index[name] for name in type_names], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"Unknown type: {e.args[0]}")
+
+    def defensive_multipliers(self, defending_types: Sequence[str]) -> np.ndarray:
+        """Return the multiplier of every attacking type against a single- or dual-type defender."""
+        return self.matrix[:, self.indices(defending_types)].prod(axis=1)
+
+    def effectiveness(
+        self, attacking_types: Sequence[str], defending_types: Sequence[str]
+    ) -> np.ndarray:
+        """Return the multiplier of each attacking type against the defender's type combination."""
+        return self.defensive_multipliers(defending_types)[
+            self.indices(attacking_types)
+        ]
+
+    def best_effectiveness(
+        self, attacking_types: Sequence[str], defending_types: Sequence[str]
+    ) -> float:
+        """Return the best multiplier the attacker's types achieve against the defender."""
+        return float(self.effectiveness(attacking_types, defending_types).max())
+
+    def weaknesses(self, defending_types: Sequence[str]) -> Dict[str, float]:
+        """Return every attacking type that deals more than neutral damage to the defender."""
+        multipliers = self.defensive_multipliers(defending_types)
+        return {
+            self.type_names[i]: float(multipliers[i])
+            for i in np.flatnonzero(multipliers > 1.0)
+        }
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, Iterable, List, Optional
+
+from core.config import settings
+from core.logging import get_logger
+from tools.type_matrix import TYPE_NAMES
+
+if TYPE_CHECKING:
+    from tools.pokeapi import PokeAPIService
+
+logger = get_logger("tools.warmup")
+
+
+class AccessLog:
+    """Per-Pokémon lookup counts, persisted so warm-ups can target the hottest names."""
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None):
+        self.counts: Counter = Counter(counts or {})
+
+    @classmethod
+    def load(cls, path: str) -> "AccessLog":
+        """Load counts from a JSON file, starting empty if it is missing or invalid."""
+        try:
+            counts = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable access log {path}: {e}")
+            return cls()
+        return cls(
+            {
+                name: count
+                for name, count in counts.items()
+                if isinstance(count, int) and count > 0
+            }
+        )
+
+    def save(self, path: str) -> None:
+        """Write the counts to a JSON file, replacing it atomically."""
+        destination = Path(path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = destination.with_name(destination.name + ".tmp")
+        tmp_path.write_text(json.dumps(dict(self.counts)), encoding="utf-8")
+        os.replace(tmp_path, destination)
+
+    def record(self, name: str) -> None:
+        """Count one lookup of a Pokémon."""
+        self.counts[name] += 1
+
+    def top(self, n: int) -> List[str]:
+        """Return the ``n`` most frequently looked-up names, hottest first."""
+        return [name for name, _ in self.counts.most_common(n)] if n > 0 else []
+
+
+def hot_pokemon_names(configured: Iterable[str], recorded: Iterable[str]) -> List[str]:
+    """Merge the configured hot list with recorded names, keeping order and dropping duplicates."""
+    names = (name.strip().lower() for name in [*configured, *recorded])
+    return list(dict.fromkeys(name for name in names if name))
+
+
+class CacheWarmer:
+    """
+    Prefetches all types and a hot list of Pokémon into the service caches.
+
+    Lookups go through the regular service methods, so every cache tier is
+    filled exactly as a live request would fill it. Failures are logged and
+    counted but never abort the warm-up; ``ready`` turns true once every
+    prefetch has finished, successfully or not.
+
+    Args:
+        service: Service whose caches are warmed
+        pokemon_names: Pokémon to prefetch after the types
+        concurrency: Maximum number of prefetches in flight
+    """
+
+    def __init__(
+        self,
+        service: "PokeAPIService",
+        pokemon_names: Iterable[str],
+        concurrency: int = settings.WARMUP_CONCURRENCY,
+    ):
+        self.service = service
+        self.pokemon_names = list(pokemon_names)
+        self.concurrency = max(1, concurrency)
+        self.ready = False
+        self.warmed = 0
+        self.failed = 0
+        self.duration: Optional[float] = None
+
+    @property
+    def total(self) -> int:
+        return len(TYPE_NAMES) + len(self.pokemon_names)
+
+    async def run(self) -> None:
+        """Prefetch every type, then the hot Pokémon, with bounded concurrency."""
+        started_at = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def prefetch(label: str, lookup: Awaitable[Any]) -> None:
+            async with semaphore:
+                try:
+                    await lookup
+                    self.warmed += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning(f"Warm-up of {label} failed: {e}")
+
+        logger.info(f"Warming caches with {self.total} entries")
+        await asyncio.gather(
+            *(
+                prefetch(f"type '{name}'", self.service.get_type_data(name))
+                for name in TYPE_NAMES
+            )
+        )
+        await asyncio.gather(
+            *(
+                prefetch(
+                    f"Pokémon '{name}'",
+                    self.service.get_pokemon_data(name, record_access=False),
+                )
+                for name in self.pokemon_names
+            )
+        )
+
+        self.duration = time.perf_counter() - started_at
+        self.ready = True
+        logger.info(
+            f"Cache warm-up finished in {self.duration:.2f}s "
+            f"({self.warmed} warmed, {self.failed} failed)"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return warm-up progress."""
+        return {
+            "ready": self.ready,
+            "total": self.total,
+            "warmed": self.warmed,
+            "failed": self.failed,
+            "duration_ms": (
+                1000 * self.duration if self.duration is not None else None
+            ),
+        }
+
+
+def create_cache_warmer(service: "PokeAPIService") -> CacheWarmer:
+    """Create a warmer for WARMUP_POKEMON plus the WARMUP_TOP_N most looked-up Pokémon."""
+    return CacheWarmer(
+        service,
+        hot_pokemon_names(
+            settings.WARMUP_POKEMON, service.access_log.top(settings.WARMUP_TOP_N)
+        ),
+        concurrency=settings.WARMUP_CONCURRENCY,
+    )